@@ -0,0 +1,87 @@
+"""
+Per-model construction cost, comparing the generic path (normalized
+intermediate dict + per field schema lookups) with the compiled
+constructors of `xchange.models.compiler`, compact models, and lazy
+models reading a single field.
+
+Usage:
+    python -m benchmarks.models [number_of_runs]
+"""
+import sys
+import timeit
+
+from xchange.models.bitfinex import BitfinexTicker, BitfinexOrder, BitfinexPosition
+from xchange.models.kraken import KrakenTicker, KrakenOrder, KrakenPosition
+from xchange.models.okex import OkexTicker, OkexAccountBalance, OkexOrder
+from xchange.models.compact import compact_model
+from xchange.models.lazy import lazy_model
+
+
+SAMPLES = [
+    (BitfinexTicker, {
+        'ask': '3780.2', 'bid': '3780.1', 'low': '3490.0', 'high': '3808.7',
+        'last_price': '3780.2', 'volume': '41981.56526245', 'mid': '3780.15',
+        'timestamp': '1506170236.287525866'}),
+    (BitfinexOrder, {
+        'avg_execution_price': '0.0', 'cid': 81351934272, 'executed_amount': '0.0',
+        'id': 3848275544, 'is_cancelled': False, 'is_live': True,
+        'original_amount': '1.0', 'price': '2.0', 'remaining_amount': '1.0',
+        'side': 'buy', 'symbol': 'btcusd', 'timestamp': '1505601352.0',
+        'type': 'limit'}),
+    (BitfinexPosition, {
+        'amount': '-0.01209215', 'base': '4118.0', 'id': 36860087,
+        'pl': '-0.10928401484', 'status': 'ACTIVE', 'swap': '0.0',
+        'symbol': 'btcusd', 'timestamp': '1503264460.0'}),
+    (KrakenTicker, {
+        'a': ['3809.00000', '1', '1.000'], 'b': ['3803.60000', '1', '1.000'],
+        'c': ['3809.30000', '0.08000000'], 'h': ['3830.30000', '3830.30000'],
+        'l': ['3570.10000', '3525.10000'], 'o': '3606.80000',
+        'v': ['2204.84583619', '4523.49526430']}),
+    (KrakenOrder, {
+        'id': 'OGYUJ3-LSWJV-4OD4DU', 'status': 'open', 'vol': '0.00500000',
+        'descr': {'ordertype': 'limit', 'pair': 'XBTUSD', 'price': '5000.0',
+                  'type': 'sell'}}),
+    (KrakenPosition, {
+        'cost': '62.82690', 'id': 'T3Y3IJ-YAMOG-YJAOJN', 'net': '-0.0153',
+        'pair': 'XXBTZUSD', 'type': 'buy', 'vol': '0.01700000'}),
+    (OkexTicker, {'date': '1506170137', 'ticker': {
+        'buy': 3740.31, 'high': 3785.06, 'last': 3740.31, 'low': 3453.04,
+        'sell': 3742.24, 'vol': 3181196}}),
+    (OkexAccountBalance, {'amount': 0.162, 'currency': 'btc'}),
+    (OkexOrder, {
+        'amount': 1, 'order_id': 10602289748, 'price': 3000, 'status': 0,
+        'symbol': 'btc_usd', 'type': 1}),
+]
+
+
+def generic_construction(model_class, json_response):
+    """Construction path used before models were compiled"""
+    model = model_class.__new__(model_class)
+    model.assign_dynamic_attributes(model.normalize_response(json_response))
+    return model
+
+
+def run(number):
+    print('{:<20} {:>12} {:>12} {:>12} {:>12}'.format(
+        'model (usec/obj)', 'generic', 'compiled', 'compact', 'lazy (1 read)'))
+    for model_class, json_response in SAMPLES:
+        compact_class = compact_model(model_class)
+        lazy_class = lazy_model(model_class)
+        assert generic_construction(model_class, json_response) == \
+            model_class(json_response) == compact_class(json_response) == \
+            lazy_class(json_response)
+        timings = [
+            min(timeit.repeat(lambda: func(json_response), number=number, repeat=5))
+            / number * 1e6
+            for func in (lambda doc: generic_construction(model_class, doc),
+                         model_class, compact_class,
+                         lambda doc: lazy_class(doc).id if 'id' in lazy_class.schema
+                         else lazy_class(doc).last if 'last' in lazy_class.schema
+                         else lazy_class(doc).amount)
+        ]
+        print('{:<20} {:>12.2f} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+            model_class.__name__, *timings))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
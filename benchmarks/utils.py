@@ -0,0 +1,116 @@
+"""
+Cost of `volume_weighted_average_price` and `worst_order_price` on deep
+order books, comparing the implementation used before the single pass
+kernels (depth sum list, reversed copy, sub list slicing and two more
+sums), the single forward scan answering one-off queries, and the
+cached depth index answering later queries.
+
+Usage:
+    python -m benchmarks.utils [number_of_runs]
+"""
+import sys
+import timeit
+from decimal import Decimal
+
+from xchange import exceptions
+from xchange.constants import exchanges
+from xchange.models.arrays import array_order_book
+from xchange.models.base import OrderBook
+from xchange.utils import volume_weighted_average_price, worst_order_price
+
+
+def order_book(depth):
+    return OrderBook({
+        'asks': [(Decimal(4000 + i) / 10, Decimal('0.5')) for i in range(depth)],
+        'bids': [(Decimal(4000 - i) / 10, Decimal('0.5')) for i in range(depth)],
+    })
+
+
+def legacy_volume_weighted_average_price(action, order_book, amount):
+    """Implementation used before the single pass kernels"""
+    order_list = order_book.asks if action == exchanges.BUY else order_book.bids
+    total_market_depth = sum([t[1] for t in order_list])
+    if amount > total_market_depth:
+        raise exceptions.InsufficientMarketDepth(
+            'Not enough depth in OrderBook to {} {} volume'.format(action, amount))
+    # the reversed copy of the asks, which were stored highest price first
+    order_list = list(order_list)
+    accum = Decimal(0.0)
+    rest = amount
+    for index, price_tuple in enumerate(order_list):
+        volume = price_tuple[1]
+        accum += volume
+        if accum >= amount:
+            break
+        rest -= volume
+    sub_list = order_list[:index + 1]
+    sub_list[-1] = (sub_list[-1][0], Decimal(rest))
+    sub_list_amounts = [t[1] for t in sub_list]
+    return sum(x * y for x, y in sub_list) / sum(sub_list_amounts)
+
+
+def legacy_worst_order_price(action, order_book, amount):
+    """Implementation used before the single pass kernels"""
+    order_list = order_book.asks if action == exchanges.BUY else order_book.bids
+    total_market_depth = sum([t[1] for t in order_list])
+    if amount > total_market_depth:
+        raise exceptions.InsufficientMarketDepth(
+            'Not enough depth in OrderBook to {} {} volume'.format(action, amount))
+    order_list = list(order_list)
+    accum = Decimal('0')
+    for price, volume in order_list:
+        accum += volume
+        if accum >= amount:
+            return price
+
+
+def one_off(func, book):
+    """Query of a book whose depth index isn't built (ie: just fetched)"""
+    def call(amount):
+        book.__dict__.pop('_depth_indexes', None)
+        return func(exchanges.BUY, book, amount)
+    return call
+
+
+def indexed(func, book):
+    """Later queries of the same book, answered by its depth index"""
+    book.depth_index('asks')
+    return lambda amount: func(exchanges.BUY, book, amount)
+
+
+def timing(call, amount, number):
+    return min(timeit.repeat(lambda: call(amount), number=number, repeat=3)) / number * 1e6
+
+
+def run(number):
+    print('{:<36} {:>10} {:>10} {:>10}'.format(
+        'query (usec/call)', 'legacy', 'scan', 'indexed'))
+    for depth in (1000, 10000):
+        book = order_book(depth)
+        array_book = array_order_book(OrderBook).from_normalized(book)
+        for fraction in ('0.1', '1'):
+            amount = Decimal(depth) / 2 * Decimal(fraction)
+            for name, legacy, func in (
+                    ('vwap', legacy_volume_weighted_average_price,
+                     volume_weighted_average_price),
+                    ('worst price', legacy_worst_order_price, worst_order_price)):
+                assert legacy(exchanges.BUY, book, amount) == \
+                    one_off(func, book)(amount) == indexed(func, book)(amount)
+                timings = [
+                    timing(lambda amount: legacy(exchanges.BUY, book, amount),
+                           amount, number),
+                    timing(one_off(func, book), amount, number),
+                    timing(indexed(func, book), amount, number),
+                ]
+                print('{:<36} {:>10.1f} {:>10.1f} {:>10.1f}'.format(
+                    '{} {} levels, {:.0%} depth'.format(name, depth, float(fraction)),
+                    *timings))
+                # float64 buffers
+                print('{:<36} {:>10} {:>10.1f} {:>10.1f}'.format(
+                    '  array order book', '-',
+                    timing(one_off(func, array_book), amount, number),
+                    timing(indexed(func, array_book), amount, number)))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
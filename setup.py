@@ -28,6 +28,9 @@ setuptools.setup(
     maintainer='Martin Zugnoni',
     install_requires=read_requirements('requirements/base.txt'),
     tests_require=read_requirements('requirements/dev.txt'),
+    extras_require={
+        'async': ['aiohttp>=3.3'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
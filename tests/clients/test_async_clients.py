@@ -0,0 +1,252 @@
+import re
+import json
+import asyncio
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from tests.fixtures import bitfinex, okex
+from xchange.factories import ExchangeClientFactory
+from xchange.constants import exchanges, currencies
+from xchange.exceptions import BitfinexException, TimeoutException
+from xchange.retry import RetryPolicy
+from xchange.clients.aio import (
+    AsyncBitfinexClient, AsyncKrakenClient, AsyncOkexClient)
+from xchange.models.bitfinex import (
+    BitfinexTicker, BitfinexOrderBook, BitfinexOrder)
+from xchange.models.fixed import fixed_order_book
+from xchange.models.okex import OkexOrderBook, OkexOrder
+
+
+class FakeStreamReader:
+    def __init__(self, body):
+        self.body = body
+
+    async def iter_chunked(self, chunk_size):
+        for index in range(0, len(self.body), chunk_size):
+            yield self.body[index:index + chunk_size]
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.content = FakeStreamReader(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class FakeSession:
+    """Replaces `aiohttp.ClientSession`, answering requests from fixtures."""
+
+    def __init__(self, fixtures=()):
+        self.fixtures = []
+        self.calls = []
+        for fixture in fixtures:
+            self.add(fixture['method'], fixture['url_regex'],
+                     fixture['json'], fixture['status'])
+
+    def add(self, method, url_regex, json_data, status=200, headers=None):
+        # latest added fixtures take precedence
+        self.fixtures.insert(
+            0, (method, re.compile(url_regex), json_data, status, headers))
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        for fixture in self.fixtures:
+            fixture_method, url_regex, json_data, status, headers = fixture
+            if fixture_method == method and url_regex.match(url):
+                if isinstance(json_data, Exception):
+                    raise json_data
+                return FakeResponse(
+                    status, json.dumps(json_data).encode('utf8'), headers)
+        raise AssertionError('Unexpected request: {} {}'.format(method, url))
+
+    async def close(self):
+        pass
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncClientFactoryTestCase(BaseXchangeTestCase):
+
+    def test_get_async_client(self):
+        self.assertEqual(ExchangeClientFactory.get_async_client(exchanges.BITFINEX),
+                         AsyncBitfinexClient)
+        self.assertEqual(ExchangeClientFactory.get_async_client(exchanges.KRAKEN),
+                         AsyncKrakenClient)
+        self.assertEqual(ExchangeClientFactory.get_async_client(exchanges.OKEX),
+                         AsyncOkexClient)
+
+    def test_get_async_client_not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            ExchangeClientFactory.get_async_client('wontwork')
+
+
+class AsyncBitfinexClientTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(AsyncBitfinexClientTestCase, self).setUp()
+        self.session = FakeSession(bitfinex.FIXTURE_RESPONSES)
+        self.client = AsyncBitfinexClient('API_KEY', 'API_SECRET',
+                                          session=self.session)
+
+    def test_get_ticker(self):
+        ticker = run(self.client.get_ticker(currencies.BTC_USD))
+        self.assertEqual(type(ticker), BitfinexTicker)
+        self.assertEqual(ticker.last, Decimal('9398.1'))
+
+    def test_concurrent_requests(self):
+        async def fetch_all():
+            return await asyncio.gather(
+                self.client.get_ticker(currencies.BTC_USD),
+                self.client.get_order_book(currencies.BTC_USD))
+        ticker, order_book = run(fetch_all())
+        self.assertEqual(ticker.ask, Decimal('9398.2'))
+        self.assertEqual(order_book.bids[0], (Decimal('9327.1'), Decimal('0.15')))
+        self.assertEqual(len(self.session.calls), 2)
+
+    def test_get_open_orders_filters_by_symbol_pair(self):
+        order = {
+            'id': 3864975544, 'side': 'buy', 'original_amount': '1.0',
+            'price': '2.0', 'type': 'limit', 'is_live': True,
+        }
+        self.session.add('POST', r'https://api\.bitfinex\.com/v1/orders', [
+            dict(order, symbol='btcusd'),
+            dict(order, symbol='ethusd'),
+        ])
+        orders = run(self.client.get_open_orders(currencies.BTC_USD))
+        self.assertEqual(len(orders), 1)
+        self.assertEqual(type(orders[0]), BitfinexOrder)
+        self.assertEqual(orders[0].symbol_pair, currencies.BTC_USD)
+
+    def test_server_error(self):
+        self.session.add('GET', r'https://api\.bitfinex\.com/v1/pubticker/\w+',
+                         {'message': 'Unknown symbol'}, status=400)
+        with self.assertRaisesRegexp(BitfinexException, 'Got 400 response'):
+            run(self.client.get_ticker(currencies.BTC_USD))
+
+    def test_timeout(self):
+        self.session.add('GET', r'https://api\.bitfinex\.com/v1/pubticker/\w+',
+                         asyncio.TimeoutError())
+        with self.assertRaises(TimeoutException):
+            run(self.client.get_ticker(currencies.BTC_USD))
+
+    def test_retry_idempotent_request(self):
+        """Should retry GET requests failing with a transient status code"""
+        self.client.retry_policy = RetryPolicy(max_retries=2, backoff_factor=0)
+        calls = []
+        original_request = self.session.request
+
+        def flaky_request(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                return FakeResponse(503, b'{}')
+            return original_request(method, url, **kwargs)
+        self.session.request = flaky_request
+
+        ticker = run(self.client.get_ticker(currencies.BTC_USD))
+        self.assertEqual(ticker.last, Decimal('9398.1'))
+        self.assertEqual(len(calls), 2)
+
+    def test_no_retry_non_idempotent_request(self):
+        """Should never retry POST requests failing after being sent"""
+        self.client.retry_policy = RetryPolicy(max_retries=2, backoff_factor=0)
+        self.session.add('POST', r'https://api\.bitfinex\.com/v1/order/new',
+                         {'message': 'Try again'}, status=503)
+        with self.assertRaisesRegexp(BitfinexException, 'Got 503 response'):
+            run(self.client.open_order(
+                exchanges.BUY, '1', currencies.BTC_USD, '100', exchanges.LIMIT))
+        self.assertEqual(len(self.session.calls), 1)
+
+    def test_close_does_not_close_shared_session(self):
+        async def use_client():
+            async with self.client as client:
+                await client.get_ticker(currencies.BTC_USD)
+        run(use_client())
+        self.assertIs(self.client.session, self.session)
+
+
+    def test_get_order_book_stream(self):
+        self.client.STREAM_CHUNK_SIZE = 16
+        order_book = run(self.client.get_order_book(currencies.BTC_USD, stream=True))
+        self.assertEqual(type(order_book), BitfinexOrderBook)
+        self.assertEqual(order_book, run(self.client.get_order_book(currencies.BTC_USD)))
+
+
+class AsyncKrakenClientTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(AsyncKrakenClientTestCase, self).setUp()
+        self.session = FakeSession()
+        self.client = AsyncKrakenClient('API_KEY', 'QVBJX1NFQ1JFVA==',
+                                        session=self.session)
+
+    def test_get_account_balance_symbol(self):
+        self.session.add('POST', r'https://api\.kraken\.com/0/private/Balance', {
+            'error': [], 'result': {'XXBT': '0.0142771914', 'ZUSD': '0.0000'}})
+        balance = run(self.client.get_account_balance(currencies.BTC))
+        self.assertEqual(balance, {'symbol': 'btc', 'amount': Decimal('0.0142771914')})
+
+
+class AsyncOkexClientTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(AsyncOkexClientTestCase, self).setUp()
+        self.session = FakeSession(okex.FIXTURE_RESPONSES)
+        self.client = AsyncOkexClient('API_KEY', 'API_SECRET',
+                                      session=self.session)
+
+    def test_get_order_book(self):
+        order_book = run(self.client.get_order_book(currencies.BTC_USD))
+        self.assertEqual(type(order_book), OkexOrderBook)
+        self.assertEqual(
+            order_book.bids[0],
+            (Decimal('9314.58'), Decimal('1.234920546285895918748671118')))
+
+    def test_get_order_book_stream(self):
+        order_book = run(self.client.get_order_book(currencies.BTC_USD, stream=True))
+        self.assertEqual(type(order_book), OkexOrderBook)
+        self.assertEqual(order_book, run(self.client.get_order_book(currencies.BTC_USD)))
+
+    def test_get_order_book_fixed_point(self):
+        """Off-tick books should fall back to the default precision, as in `OkexClient`"""
+        self.session.add('GET', r'https://www\.okex\.com/api/v1/future_depth\.do', {
+            'asks': [[9315.495, 5]], 'bids': [[9314.58, 115]]})
+        client = AsyncOkexClient('API_KEY', 'API_SECRET', session=self.session,
+                                 fixed_point=True)
+        order_book = run(client.get_order_book(currencies.BTC_USD))
+        self.assertEqual(type(order_book),
+                         fixed_order_book(OkexOrderBook, client.DEFAULT_PRECISION))
+        self.assertEqual(order_book.asks[0][0], Decimal('9315.495'))
+
+    def test_ticker_is_cached(self):
+        async def fetch_twice():
+            await self.client.get_order_book(currencies.BTC_USD)
+            await self.client.get_order_book(currencies.BTC_USD)
+        run(fetch_twice())
+        ticker_calls = [call for call in self.session.calls
+                        if 'future_ticker' in call[1]]
+        self.assertEqual(len(ticker_calls), 1)
+
+    def test_open_order(self):
+        self.session.add('POST', r'https://www\.okex\.com/api/v1/future_trade\.do',
+                         {'order_id': 8931546905, 'result': True})
+        order = run(self.client.open_order(
+            action=exchanges.SELL,
+            amount='0.01209215',
+            symbol_pair=currencies.BTC_USD,
+            price='4118.0',
+            order_type=exchanges.LIMIT))
+        self.assertEqual(order, {'id': '8931546905'})
+        self.assertEqual(type(order), OkexOrder)
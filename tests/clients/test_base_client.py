@@ -1,11 +1,18 @@
 import re
+import time
+import threading
 from decimal import Decimal
 
+import requests
 import responses
 
 from tests import BaseXchangeTestCase
 from xchange.clients.base import BaseExchangeClient
-from xchange.exceptions import BaseXchangeException
+from xchange.exceptions import BaseXchangeException, TimeoutException
+from xchange.ratelimit import RateLimiter
+from xchange.retry import RetryPolicy
+from xchange.deadline import Deadline
+from xchange.models.base import OrderBook
 
 
 class BaseClientTestCase(BaseXchangeTestCase):
@@ -262,3 +269,307 @@ class BaseClientTestCase(BaseXchangeTestCase):
             headers={'X-CUSTOM-HEADER': 'xchange'}
         )
         self.assertEqual(data, {'msg': 'All good.', 'success': True})
+
+
+class BaseClientSessionTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientSessionTestCase, self).setUp()
+        self.client = BaseExchangeClient('API_KEY', 'API_SECRET',
+                                         pool_maxsize=20, max_retries=2)
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+
+    @responses.activate
+    def test_session_is_reused_between_requests(self):
+        """Should send every request through the same long-lived session"""
+        responses.add(
+            method='GET',
+            url='{}/test-get-method'.format(self.client.BASE_API_URL),
+            json={'success': True},
+            status=200,
+            content_type='application/json')
+        self.client._get(path='/test-get-method')
+        session = self.client.session
+        self.client._get(path='/test-get-method')
+        self.assertIs(self.client.session, session)
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_session_adapter_configuration(self):
+        """Should mount a single adapter with the given pool settings"""
+        adapter = self.client.session.get_adapter('https://xchage-testing.url')
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertIs(self.client.session.get_adapter('https://other.url'), adapter)
+
+    def test_context_manager_closes_session(self):
+        """Should release the owned session when leaving the context"""
+        with self.client as client:
+            session = client.session
+        self.assertIsNone(self.client._session)
+        self.assertIsNot(self.client.session, session)
+
+    def test_shared_session_is_not_closed(self):
+        """Should not close a session that was provided by the caller"""
+        session = requests.Session()
+        client = BaseExchangeClient('API_KEY', 'API_SECRET', session=session)
+        client.close()
+        self.assertIs(client.session, session)
+
+
+class BaseClientRateLimitTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientRateLimitTestCase, self).setUp()
+        self.client = BaseExchangeClient('API_KEY', 'API_SECRET')
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+
+    @responses.activate
+    def test_request_is_paced(self):
+        """Should wait for the rate limiter before sending each request"""
+        responses.add(
+            method='GET',
+            url='{}/test-get-method'.format(self.client.BASE_API_URL),
+            json={'success': True},
+            status=200,
+            content_type='application/json')
+        self.client.rate_limiter = RateLimiter(
+            buckets={'test': (1, 10)},
+            endpoints=(('/test-get-method', 'test', 1), ))
+        start = time.time()
+        for _ in range(3):
+            self.client._get(path='/test-get-method')
+        self.assertGreaterEqual(time.time() - start, 0.18)
+        self.assertEqual(len(responses.calls), 3)
+
+    def test_shared_rate_limiter(self):
+        rate_limiter = BaseExchangeClient.build_rate_limiter()
+        client = BaseExchangeClient('API_KEY', 'API_SECRET', rate_limiter=rate_limiter)
+        self.assertIs(client.rate_limiter, rate_limiter)
+
+
+class BaseClientRetryTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientRetryTestCase, self).setUp()
+        self.client = BaseExchangeClient(
+            'API_KEY', 'API_SECRET',
+            retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+        self.url = '{}/test-method'.format(self.client.BASE_API_URL)
+
+    @responses.activate
+    def test_retry_get_server_error(self):
+        """Should retry GET requests failing with a transient status code"""
+        responses.add(method='GET', url=self.url, json={}, status=503)
+        responses.add(method='GET', url=self.url, json={'success': True}, status=200)
+        data = self.client._get(path='/test-method')
+        self.assertEqual(data, {'success': True})
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_retry_get_gives_up(self):
+        """Should raise ERROR_CLASS once retries are exhausted"""
+        responses.add(method='GET', url=self.url, json={}, status=429)
+        with self.assertRaisesRegexp(BaseXchangeException, 'Got 429 response'):
+            self.client._get(path='/test-method')
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_retry_get_honors_retry_after(self):
+        responses.add(method='GET', url=self.url, json={}, status=429,
+                      headers={'Retry-After': '0.2'})
+        responses.add(method='GET', url=self.url, json={'success': True}, status=200)
+        start = time.time()
+        self.client._get(path='/test-method')
+        self.assertGreaterEqual(time.time() - start, 0.2)
+
+    @responses.activate
+    def test_retry_get_read_timeout(self):
+        responses.add(method='GET', url=self.url,
+                      body=requests.exceptions.ReadTimeout())
+        with self.assertRaises(TimeoutException):
+            self.client._get(path='/test-method')
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_no_retry_post_server_error(self):
+        """Should never retry POST requests that reached the server"""
+        responses.add(method='POST', url=self.url, json={}, status=503)
+        with self.assertRaisesRegexp(BaseXchangeException, 'Got 503 response'):
+            self.client._post(path='/test-method')
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_no_retry_post_read_timeout(self):
+        responses.add(method='POST', url=self.url,
+                      body=requests.exceptions.ReadTimeout())
+        with self.assertRaises(TimeoutException):
+            self.client._post(path='/test-method')
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_retry_post_connect_timeout(self):
+        """Should retry POST requests that never reached the server"""
+        responses.add(method='POST', url=self.url,
+                      body=requests.exceptions.ConnectTimeout())
+        responses.add(method='POST', url=self.url, json={'success': True}, status=200)
+        data = self.client._post(path='/test-method')
+        self.assertEqual(data, {'success': True})
+
+
+class BaseClientCoalescingTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientCoalescingTestCase, self).setUp()
+        self.client = BaseExchangeClient('API_KEY', 'API_SECRET')
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+        self.url = '{}/test-method'.format(self.client.BASE_API_URL)
+
+    def slow_callback(self, request):
+        time.sleep(0.1)
+        return (200, {}, '{"success": true}')
+
+    def run_concurrently(self, func, count=5):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(func()))
+                   for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    @responses.activate
+    def test_identical_get_requests_are_coalesced(self):
+        """Should share one HTTP call between concurrent identical GET requests"""
+        responses.add_callback('GET', self.url, callback=self.slow_callback)
+        results = self.run_concurrently(
+            lambda: self.client._get(path='/test-method', params={'pair': 'btcusd'}))
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(results, [{'success': True}] * 5)
+
+    @responses.activate
+    def test_coalesced_requests_keep_their_deadline(self):
+        """Should not wait for the shared call beyond the own deadline"""
+        def slower_callback(request):
+            time.sleep(0.5)
+            return (200, {}, '{"success": true}')
+        responses.add_callback('GET', self.url, callback=slower_callback)
+        leader = threading.Thread(target=lambda: self.client._get(path='/test-method'))
+        leader.start()
+        time.sleep(0.05)
+        start = time.time()
+        with self.assertRaises(TimeoutException):
+            self.client._get(path='/test-method', deadline=0.1)
+        self.assertLess(time.time() - start, 0.3)
+        leader.join()
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_post_requests_are_not_coalesced(self):
+        responses.add_callback('POST', self.url, callback=self.slow_callback)
+        self.run_concurrently(lambda: self.client._post(path='/test-method'))
+        self.assertEqual(len(responses.calls), 5)
+
+    @responses.activate
+    def test_coalescing_disabled(self):
+        responses.add_callback('GET', self.url, callback=self.slow_callback)
+        self.client.coalesce_requests = False
+        self.run_concurrently(lambda: self.client._get(path='/test-method'))
+        self.assertEqual(len(responses.calls), 5)
+
+
+class BaseClientTimeoutTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientTimeoutTestCase, self).setUp()
+        self.client = BaseExchangeClient('API_KEY', 'API_SECRET',
+                                         connect_timeout=2, read_timeout=5)
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+        self.url = '{}/test-method'.format(self.client.BASE_API_URL)
+        self.timeouts = []
+        send = self.client.session.send
+
+        def send_spy(request, **kwargs):
+            self.timeouts.append(kwargs['timeout'])
+            return send(request, **kwargs)
+        self.client.session.send = send_spy
+
+    @responses.activate
+    def test_connect_read_timeouts(self):
+        """Should send requests with separate connect and read timeouts"""
+        responses.add(method='GET', url=self.url, json={}, status=200)
+        self.client._get(path='/test-method')
+        self.assertEqual(self.timeouts, [(2, 5)])
+
+    @responses.activate
+    def test_timeouts_capped_by_deadline(self):
+        """Should only use the remaining budget of the deadline"""
+        responses.add(method='GET', url=self.url, json={}, status=200)
+        self.client._get(path='/test-method', deadline=Deadline(1))
+        connect_timeout, read_timeout = self.timeouts[0]
+        self.assertLessEqual(connect_timeout, 1)
+        self.assertLessEqual(read_timeout, 1)
+
+    @responses.activate
+    def test_expired_deadline(self):
+        responses.add(method='GET', url=self.url, json={}, status=200)
+        with self.assertRaises(TimeoutException):
+            self.client._get(path='/test-method', deadline=Deadline(0))
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_no_retry_beyond_deadline(self):
+        """Should not wait for a retry which would exceed the deadline"""
+        self.client.retry_policy = RetryPolicy(max_retries=3)
+        responses.add(method='GET', url=self.url, json={}, status=503,
+                      headers={'Retry-After': '5'})
+        start = time.time()
+        with self.assertRaises(TimeoutException):
+            self.client._get(path='/test-method', deadline=Deadline(1))
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(len(responses.calls), 1)
+
+
+class BaseClientStreamTestCase(BaseXchangeTestCase):
+    def setUp(self):
+        super(BaseClientStreamTestCase, self).setUp()
+        self.client = BaseExchangeClient('API_KEY', 'API_SECRET')
+        self.client.BASE_API_URL = 'https://xchage-testing.url'
+        self.client.ERROR_CLASS = BaseXchangeException
+        self.client.STREAM_CHUNK_SIZE = 16
+        self.url = '{}/test-method'.format(self.client.BASE_API_URL)
+
+    @responses.activate
+    def test_stream(self):
+        """Should build the order book while the response is read"""
+        responses.add(method='GET', url=self.url, status=200, json={
+            'asks': [['10.5', 1], ['10.2', 2]], 'bids': [['9.8', 3]]})
+        order_book = self.client._get(
+            path='/test-method', model_class=OrderBook, stream=True)
+        self.assertEqual(type(order_book), OrderBook)
+        self.assertEqual(order_book.asks, [(Decimal('10.2'), Decimal('2')),
+                                           (Decimal('10.5'), Decimal('1'))])
+        self.assertEqual(order_book.bids, [(Decimal('9.8'), Decimal('3'))])
+
+    @responses.activate
+    def test_stream_depth(self):
+        responses.add(method='GET', url=self.url, status=200, json={
+            'asks': [['10.2', 2], ['10.5', 1]], 'bids': [['9.8', 3], ['9.5', 4]]})
+        order_book = self.client._get(
+            path='/test-method', model_class=OrderBook, stream=True, depth=1)
+        self.assertEqual(order_book.asks, [(Decimal('10.2'), Decimal('2'))])
+        self.assertEqual(order_book.bids, [(Decimal('9.8'), Decimal('3'))])
+
+    @responses.activate
+    def test_stream_invalid_json(self):
+        responses.add(method='GET', url=self.url, status=200,
+                      body='{"asks": [["10.5", 1], ["10.2", 2]')
+        with self.assertRaisesRegexp(BaseXchangeException,
+                                     'Could not decode JSON response'):
+            self.client._get(path='/test-method', model_class=OrderBook, stream=True)
+
+    @responses.activate
+    def test_stream_error_status(self):
+        responses.add(method='GET', url=self.url, status=400, json={})
+        with self.assertRaisesRegexp(BaseXchangeException, 'Got 400 response'):
+            self.client._get(path='/test-method', model_class=OrderBook, stream=True)
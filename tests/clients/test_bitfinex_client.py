@@ -1,4 +1,6 @@
 import re
+import json
+import time
 from decimal import Decimal
 
 import responses
@@ -7,10 +9,15 @@ from tests import BaseXchangeTestCase
 from tests.fixtures import bitfinex
 from xchange.factories import ExchangeClientFactory
 from xchange.constants import exchanges, currencies
-from xchange.exceptions import BitfinexException, InvalidSymbolPairException
+from xchange.exceptions import (
+    BitfinexException, InvalidSymbolPairException, TimeoutException)
 from xchange.models.bitfinex import (
     BitfinexTicker, BitfinexOrderBook, BitfinexAccountBalance, BitfinexOrder,
     BitfinexPosition)
+from xchange.models.columnar import BalanceSheet, PositionList
+from xchange.models.compact import compact_model
+from xchange.models.fixed import fixed_order_book
+from xchange.models.lazy import lazy_model
 
 
 class BaseBitfinexClientTestCase(BaseXchangeTestCase):
@@ -58,10 +65,10 @@ class BitfinexClientOrderBookTestCase(BaseBitfinexClientTestCase):
         order_book = self.client.get_order_book(currencies.BTC_USD)
         expected = {
         'asks': [
-            (Decimal('9329'), Decimal('7.50897281')),
-            (Decimal('9328.7'), Decimal('0.08')),
+            (Decimal('9327.3'), Decimal('0.31')),
             (Decimal('9327.4'), Decimal('0.09694343')),
-            (Decimal('9327.3'), Decimal('0.31'))],
+            (Decimal('9328.7'), Decimal('0.08')),
+            (Decimal('9329'), Decimal('7.50897281'))],
         'bids': [
             (Decimal('9327.1'), Decimal('0.15')),
             (Decimal('9326.9'), Decimal('0.10915328')),
@@ -72,6 +79,45 @@ class BitfinexClientOrderBookTestCase(BaseBitfinexClientTestCase):
         self.assertEqual(order_book, expected)
         self.assertEqual(type(order_book), BitfinexOrderBook)
 
+    @responses.activate
+    def test_get_order_book_depth(self):
+        """Should ask for `depth` levels and keep the best ones"""
+        for stream in (False, True):
+            order_book = self.client.get_order_book(
+                currencies.BTC_USD, stream=stream, depth=2)
+            self.assertIn('limit_bids=2', responses.calls[-1].request.url)
+            self.assertIn('limit_asks=2', responses.calls[-1].request.url)
+            self.assertEqual(order_book, {
+                'asks': [
+                    (Decimal('9327.3'), Decimal('0.31')),
+                    (Decimal('9327.4'), Decimal('0.09694343'))],
+                'bids': [
+                    (Decimal('9327.1'), Decimal('0.15')),
+                    (Decimal('9326.9'), Decimal('0.10915328'))]
+            })
+
+    def test_get_order_book_invalid_depth(self):
+        for depth in (0, -1, '10'):
+            with self.assertRaises(ValueError):
+                self.client.get_order_book(currencies.BTC_USD, depth=depth)
+
+    @responses.activate
+    def test_get_order_book_stream(self):
+        order_book = self.client.get_order_book(currencies.BTC_USD, stream=True)
+        self.assertEqual(order_book, self.client.get_order_book(currencies.BTC_USD))
+        self.assertEqual(type(order_book), BitfinexOrderBook)
+
+    @responses.activate
+    def test_get_order_book_fixed_point(self):
+        client = self.ClientClass('API_KEY', 'API_SECRET', fixed_point=True)
+        expected = self.client.get_order_book(currencies.BTC_USD)
+        for stream in (False, True):
+            order_book = client.get_order_book(currencies.BTC_USD, stream=stream)
+            self.assertEqual(order_book, expected)
+            self.assertEqual(type(order_book),
+                             fixed_order_book(BitfinexOrderBook, client.DEFAULT_PRECISION))
+            self.assertEqual(order_book.asks.prices[0], 932730000000)
+
 
 class BitfinexClientAccountBalanceTestCase(BaseBitfinexClientTestCase):
 
@@ -89,6 +135,12 @@ class BitfinexClientAccountBalanceTestCase(BaseBitfinexClientTestCase):
         for obj in balance:
             self.assertEqual(type(obj), BitfinexAccountBalance)
 
+        client = self.ClientClass('API_KEY', 'API_SECRET', columnar_results=True)
+        balance = client.get_account_balance()
+        self.assertEqual(type(balance), BalanceSheet)
+        self.assertEqual(balance, expected)
+        self.assertEqual(client.get_account_balance(currencies.BTC), expected[1])
+
     @responses.activate
     def test_get_account_balance_symbol_pair(self):
         balance = self.client.get_account_balance(currencies.BTC)
@@ -220,6 +272,18 @@ class BitfinexGetOpenOrdersTestCase(BaseBitfinexClientTestCase):
             self.assertEqual(type(obj), BitfinexOrder)
         self.assertEqual(open_orders, expected)
 
+        client = self.ClientClass('API_KEY', 'API_SECRET', compact_models=True)
+        open_orders = client.get_open_orders(currencies.ETH_USD)
+        for obj in open_orders:
+            self.assertEqual(type(obj), compact_model(BitfinexOrder))
+        self.assertEqual(open_orders, expected)
+
+        client = self.ClientClass('API_KEY', 'API_SECRET', lazy_models=True)
+        open_orders = client.get_open_orders(currencies.ETH_USD)
+        for obj in open_orders:
+            self.assertEqual(type(obj), lazy_model(BitfinexOrder))
+        self.assertEqual(open_orders, expected)
+
     @responses.activate
     def test_get_open_orders_empty_response(self):
         responses.add(
@@ -383,6 +447,23 @@ class BitfinexCancelOrderTestCase(BaseBitfinexClientTestCase):
         response = self.client.cancel_all_orders(currencies.BTC_USD)
         self.assertEqual(response, fixture)
 
+    @responses.activate
+    def test_cancel_all_orders_deadline(self):
+        """Should fail once the whole operation exceeds its deadline"""
+        def slow_open_orders(request):
+            time.sleep(0.2)
+            return (200, {}, json.dumps([{
+                'id': 3864975544, 'side': 'buy', 'original_amount': '1.0',
+                'price': '2.0', 'symbol': 'btcusd', 'type': 'limit',
+                'is_live': True}]))
+        responses.add_callback(
+            method='POST',
+            url=re.compile('https://api.bitfinex.com/v1/orders'),
+            callback=slow_open_orders)
+        with self.assertRaises(TimeoutException):
+            self.client.cancel_all_orders(currencies.BTC_USD, deadline=0.1)
+        self.assertEqual(len(responses.calls), 1)
+
 
 class BitfinexGetOpenPositionsTestCase(BaseBitfinexClientTestCase):
 
@@ -470,6 +551,13 @@ class BitfinexGetOpenPositionsTestCase(BaseBitfinexClientTestCase):
         for obj in positions:
             self.assertEqual(type(obj), BitfinexPosition)
 
+        client = self.ClientClass('API_KEY', 'API_SECRET', columnar_results=True)
+        positions = client.get_open_positions(currencies.ETH_USD)
+        self.assertEqual(type(positions), PositionList)
+        self.assertEqual(positions['id'], ['34546527'])
+        self.assertEqual(positions, expected)
+        self.assertEqual(type(positions[0]), BitfinexPosition)
+
     @responses.activate
     def test_get_open_positions_no_open_position(self):
         responses.add(
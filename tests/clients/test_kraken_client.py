@@ -7,6 +7,8 @@ from tests import BaseXchangeTestCase
 from xchange.factories import ExchangeClientFactory
 from xchange.constants import exchanges, currencies
 from xchange.exceptions import KrakenException, InvalidSymbolPairException
+from xchange.models.arrays import array_order_book
+from xchange.models.fixed import fixed_order_book
 from xchange.models.kraken import (
     KrakenTicker, KrakenOrderBook, KrakenAccountBalance, KrakenOrder,
     KrakenOrder, KrakenPosition)
@@ -95,11 +97,11 @@ class KrakenClientOrderBookTestCase(BaseKrakenClientTestCase):
         order_book = self.client.get_order_book(currencies.BTC_USD)
         expected = {
             'asks': [
-                (Decimal('775.95000'), Decimal('5.000')),
-                (Decimal('775.93000'), Decimal('0.579')),
-                (Decimal('775.91000'), Decimal('5.000')),
+                (Decimal('775.78000'), Decimal('4.798')),
                 (Decimal('775.82000'), Decimal('4.398')),
-                (Decimal('775.78000'), Decimal('4.798'))
+                (Decimal('775.91000'), Decimal('5.000')),
+                (Decimal('775.93000'), Decimal('0.579')),
+                (Decimal('775.95000'), Decimal('5.000'))
             ],
             'bids': [
                 (Decimal('774.45000'), Decimal('0.167')),
@@ -112,6 +114,71 @@ class KrakenClientOrderBookTestCase(BaseKrakenClientTestCase):
         self.assertEqual(order_book, expected)
         self.assertEqual(type(order_book), KrakenOrderBook)
 
+        order_book = self.client.get_order_book(currencies.BTC_USD, stream=True)
+        self.assertEqual(order_book, expected)
+        self.assertEqual(type(order_book), KrakenOrderBook)
+
+        client = self.ClientClass('API_KEY', 'API_SECRET', array_order_books=True)
+        for stream in (False, True):
+            order_book = client.get_order_book(currencies.BTC_USD, stream=stream)
+            self.assertEqual(order_book, expected)
+            self.assertEqual(type(order_book), array_order_book(KrakenOrderBook))
+
+        # prices off the BTC_USD tick size fall back to the default precision
+        client = self.ClientClass('API_KEY', 'API_SECRET', fixed_point=True)
+        for stream in (False, True):
+            order_book = client.get_order_book(currencies.BTC_USD, stream=stream)
+            self.assertEqual(order_book, expected)
+            self.assertEqual(type(order_book),
+                             fixed_order_book(KrakenOrderBook, client.DEFAULT_PRECISION))
+        order_book = client.get_order_book(currencies.ETH_USD)
+        self.assertEqual(order_book, expected)
+        self.assertEqual(order_book.precision, client.PRECISIONS[currencies.ETH_USD])
+
+    @responses.activate
+    def test_get_order_book_fixed_point_error(self):
+        responses.add(
+            method='GET',
+            url=re.compile('https://api.kraken.com/0/public/Depth'),
+            json={'error': [], 'result': {'XXBTZUSD': {
+                'asks': [['775.123456789', '4.798', 1525637947]], 'bids': []}}},
+            status=200,
+            content_type='application/json')
+        client = self.ClientClass('API_KEY', 'API_SECRET', fixed_point=True)
+        with self.assertRaisesRegexp(KrakenException,
+                                     '"775.123456789" has more than 8 decimal places'):
+            client.get_order_book(currencies.BTC_USD)
+
+    @responses.activate
+    def test_get_order_book_depth(self):
+        responses.add(
+            method='GET',
+            url=re.compile('https://api.kraken.com/0/public/Depth'),
+            json={'error': [], 'result': {'XXBTZUSD': {
+                'asks': [['775.78000', '4.798', 1525637947],
+                         ['775.82000', '4.398', 1525637948]],
+                'bids': [['774.45000', '0.167', 1525637949],
+                         ['773.73000', '2.699', 1525637947]]}}},
+            status=200,
+            content_type='application/json')
+        order_book = self.client.get_order_book(currencies.BTC_USD, depth=1)
+        self.assertIn('count=1', responses.calls[-1].request.url)
+        self.assertEqual(order_book, {
+            'asks': [(Decimal('775.78000'), Decimal('4.798'))],
+            'bids': [(Decimal('774.45000'), Decimal('0.167'))],
+        })
+
+    @responses.activate
+    def test_get_order_book_stream_error(self):
+        responses.add(
+            method='GET',
+            url=re.compile('https://api.kraken.com/0/public/Depth'),
+            json={'error': ['EQuery:Unknown asset pair']},
+            status=200,
+            content_type='application/json')
+        with self.assertRaisesRegexp(KrakenException, 'Unknown asset pair'):
+            self.client.get_order_book(currencies.BTC_USD, stream=True)
+
 
 class KrakenClientAccountBalanceTestCase(BaseKrakenClientTestCase):
     @responses.activate
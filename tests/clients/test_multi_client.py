@@ -0,0 +1,119 @@
+import time
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.constants import exchanges, currencies
+from xchange.exceptions import TimeoutException, KrakenException
+from xchange.clients.bitfinex import BitfinexClient
+from xchange.clients.multi import MultiExchangeClient
+
+
+class FakeClient:
+    def __init__(self, delay=0, result=None, error=None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.closed = False
+        self.deadlines = []
+
+    def get_ticker(self, symbol_pair, deadline=None):
+        self.deadlines.append(deadline)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+    def close(self):
+        self.closed = True
+
+
+class MultiExchangeClientTestCase(BaseXchangeTestCase):
+
+    def test_from_credentials(self):
+        multi_client = MultiExchangeClient.from_credentials({
+            exchanges.BITFINEX: {'api_key': 'API_KEY', 'api_secret': 'API_SECRET'},
+        })
+        client = multi_client.clients[exchanges.BITFINEX]
+        self.assertEqual(type(client), BitfinexClient)
+        # clients built from credentials are owned, and closed
+        closed = []
+        client.close = lambda: closed.append(True)
+        multi_client.close()
+        self.assertEqual(closed, [True])
+
+    def test_requests_are_concurrent(self):
+        clients = {
+            exchanges.BITFINEX: FakeClient(delay=0.2, result=Decimal('1')),
+            exchanges.KRAKEN: FakeClient(delay=0.2, result=Decimal('2')),
+            exchanges.OKEX: FakeClient(delay=0.2, result=Decimal('3')),
+        }
+        with MultiExchangeClient(clients) as multi_client:
+            start = time.time()
+            response = multi_client.get_ticker(currencies.BTC_USD)
+            elapsed = time.time() - start
+        self.assertTrue(response.ok)
+        self.assertEqual(response.results, {
+            exchanges.BITFINEX: Decimal('1'),
+            exchanges.KRAKEN: Decimal('2'),
+            exchanges.OKEX: Decimal('3'),
+        })
+        self.assertLess(elapsed, 0.5)
+        # given clients are still owned by the caller
+        self.assertFalse(any(client.closed for client in clients.values()))
+
+    def test_partial_results(self):
+        """Should keep answered exchanges and report errors and timeouts separately"""
+        clients = {
+            exchanges.BITFINEX: FakeClient(result=Decimal('1')),
+            exchanges.KRAKEN: FakeClient(error=KrakenException('Service unavailable')),
+            exchanges.OKEX: FakeClient(delay=1, result=Decimal('3')),
+        }
+        with MultiExchangeClient(clients) as multi_client:
+            start = time.time()
+            response = multi_client.get_ticker(currencies.BTC_USD, timeout=0.2)
+            elapsed = time.time() - start
+        self.assertFalse(response.ok)
+        self.assertEqual(response.results, {exchanges.BITFINEX: Decimal('1')})
+        self.assertEqual(type(response.errors[exchanges.KRAKEN]), KrakenException)
+        self.assertEqual(type(response.errors[exchanges.OKEX]), TimeoutException)
+        self.assertLess(elapsed, 0.5)
+
+    def test_request_each(self):
+        """Should send a different request to each client, timing each of them"""
+        clients = {
+            exchanges.BITFINEX: FakeClient(delay=0.1, result=Decimal('1')),
+            exchanges.KRAKEN: FakeClient(delay=1, result=Decimal('2')),
+        }
+        with MultiExchangeClient(clients) as multi_client:
+            response = multi_client.request_each({
+                exchanges.BITFINEX: ('get_ticker', (currencies.BTC_USD, ), {}),
+                exchanges.KRAKEN: ('get_ticker', (currencies.ETH_USD, ), {}),
+            }, timeout=0.3)
+        self.assertEqual(response.results, {exchanges.BITFINEX: Decimal('1')})
+        self.assertEqual(type(response.errors[exchanges.KRAKEN]), TimeoutException)
+        self.assertGreaterEqual(response.timings[exchanges.BITFINEX], 0.1)
+        self.assertNotIn(exchanges.KRAKEN, response.timings)
+
+    def test_calls_get_a_deadline(self):
+        client = FakeClient(result=Decimal('1'))
+        with MultiExchangeClient({exchanges.KRAKEN: client}) as multi_client:
+            multi_client.get_ticker(currencies.BTC_USD, timeout=2)
+        deadline, = client.deadlines
+        self.assertEqual(deadline.timeout, 2)
+        self.assertLessEqual(deadline.remaining(), 2)
+
+    def test_slow_exchange_does_not_starve_others(self):
+        """Calls left running past the deadline should only hold their own exchange"""
+        clients = {
+            exchanges.BITFINEX: FakeClient(result=Decimal('1')),
+            exchanges.KRAKEN: FakeClient(result=Decimal('2')),
+            exchanges.OKEX: FakeClient(delay=1, result=Decimal('3')),
+        }
+        with MultiExchangeClient(clients) as multi_client:
+            for _ in range(4):
+                response = multi_client.get_ticker(currencies.BTC_USD, timeout=0.1)
+                self.assertEqual(response.results, {
+                    exchanges.BITFINEX: Decimal('1'),
+                    exchanges.KRAKEN: Decimal('2'),
+                })
+                self.assertEqual(type(response.errors[exchanges.OKEX]), TimeoutException)
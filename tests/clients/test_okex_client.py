@@ -7,6 +7,8 @@ from tests.fixtures import okex
 from xchange.exceptions import *
 from xchange.factories import ExchangeClientFactory
 from xchange.constants import exchanges, currencies
+from xchange.deadline import Deadline
+from xchange.models.columnar import PositionList
 from xchange.models.okex import (
     OkexTicker, OkexOrderBook, OkexAccountBalance, OkexOrder)
 
@@ -51,11 +53,11 @@ class OkexClientOrderBookTestCase(BaseOkexClientTestCase):
         order_book = self.client.get_order_book(currencies.BTC_USD)
         expected = {
             'asks': [
-                (Decimal('9315.49'), Decimal('0.05369219766460417038037700515')),
-                (Decimal('9315.47'), Decimal('0.8268598440349042238578058793')),
-                (Decimal('9315.45'), Decimal('0.5261835371131208697276946505')),
+                (Decimal('9314.78'), Decimal('0.1073843953292083407607540103')),
                 (Decimal('9315.06'), Decimal('0.1073843953292083407607540103')),
-                (Decimal('9314.78'), Decimal('0.1073843953292083407607540103'))
+                (Decimal('9315.45'), Decimal('0.5261835371131208697276946505')),
+                (Decimal('9315.47'), Decimal('0.8268598440349042238578058793')),
+                (Decimal('9315.49'), Decimal('0.05369219766460417038037700515'))
             ],
             'bids': [
                 (Decimal('9314.58'), Decimal('1.234920546285895918748671118')),
@@ -69,6 +71,47 @@ class OkexClientOrderBookTestCase(BaseOkexClientTestCase):
         self.assertEqual(order_book, expected)
         self.assertEqual(type(order_book), OkexOrderBook)
 
+    @responses.activate
+    def test_get_order_book_depth(self):
+        self.client.get_order_book(currencies.BTC_USD)
+        self.assertIn('size=100', responses.calls[-1].request.url)
+        order_book = self.client.get_order_book(currencies.BTC_USD, depth=2)
+        self.assertIn('size=2', responses.calls[-1].request.url)
+        self.assertEqual([price for price, _ in order_book.asks],
+                         [Decimal('9314.78'), Decimal('9315.06')])
+        self.assertEqual([price for price, _ in order_book.bids],
+                         [Decimal('9314.58'), Decimal('9313.3')])
+
+    @responses.activate
+    def test_get_order_book_depth_exceeding_limit(self):
+        """Should not ask for more levels than OKEx serves"""
+        self.client.get_order_book(currencies.BTC_USD, depth=500)
+        self.assertIn('size=200', responses.calls[-1].request.url)
+
+    @responses.activate
+    def test_get_order_book_stream(self):
+        order_book = self.client.get_order_book(currencies.BTC_USD, stream=True)
+        self.assertEqual(order_book, self.client.get_order_book(currencies.BTC_USD))
+        self.assertEqual(type(order_book), OkexOrderBook)
+
+
+    @responses.activate
+    def test_get_order_book_ticker_deadline(self):
+        """The ticker should be fetched within the deadline, and cached"""
+        deadlines = []
+        get_ticker = self.client.get_ticker
+
+        def recording_get_ticker(symbol_pair, deadline=None):
+            deadlines.append(deadline)
+            return get_ticker(symbol_pair, deadline=deadline)
+
+        self.client.get_ticker = recording_get_ticker
+        self.client.get_order_book(currencies.BTC_USD, deadline=5)
+        self.client.get_order_book(currencies.BTC_USD, deadline=5)
+        self.assertEqual(len(deadlines), 1)
+        self.assertEqual(type(deadlines[0]), Deadline)
+        self.assertEqual(deadlines[0].timeout, 5)
+
 
 class OkexClientAccountBalanceTestCase(BaseOkexClientTestCase):
 
@@ -240,6 +283,24 @@ class OkexOpenOrderTestCase(BaseOkexClientTestCase):
         self.assertEqual(order, expected)
         self.assertEqual(type(order), OkexOrder)
 
+    @responses.activate
+    def test_open_order_ticker_deadline(self):
+        responses.add(
+            method='POST',
+            url=re.compile('https://www\.okex\.com/api/v1/future_trade\.do'),
+            json={'order_id': 8931546905, 'result': True},
+            status=200,
+            content_type='application/json')
+        with self.assertRaisesRegexp(TimeoutException, 'Deadline of 0 seconds exceeded'):
+            self.client.open_order(
+                action=exchanges.SELL,
+                amount='0.01209215',
+                symbol_pair=currencies.BTC_USD,
+                price='4118.0',
+                order_type=exchanges.LIMIT,
+                deadline=0)
+        self.assertEqual(len(responses.calls), 0)
+
     @responses.activate
     def test_open_order_amount_in_contracts(self):
         fixture = {'order_id': 8931458965, 'result': True}
@@ -435,6 +496,13 @@ class OkexGetOpenPositionsTestCase(BaseOkexClientTestCase):
         ]
         self.assertEqual(positions, expected)
 
+        # columnar rows match the regular models, 'id' included
+        client = self.ClientClass('API_KEY', 'API_SECRET', columnar_results=True)
+        columns = client.get_open_positions(currencies.BTC_USD)
+        self.assertEqual(type(columns), PositionList)
+        self.assertEqual(list(columns), positions)
+        self.assertEqual(columns['id'], ['None'])
+
     @responses.activate
     def test_get_open_positions_no_positions(self):
         fixture = {
@@ -0,0 +1,88 @@
+import sys
+import pickle
+import unittest
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models import arrays
+from xchange.models.arrays import PriceLevels, array_order_book
+from xchange.models.base import OrderBook
+from xchange.models.kraken import KrakenOrderBook
+
+
+LEVELS = [
+    (Decimal('4630.12300'), Decimal('0.014')),
+    (Decimal('4620.23450'), Decimal('0.456')),
+    (Decimal('4610.5'), Decimal('12')),
+]
+
+
+class PriceLevelsTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        super(PriceLevelsTestCase, self).setUp()
+        self.levels = PriceLevels.from_levels(LEVELS)
+
+    def test_buffers(self):
+        self.assertEqual(self.levels.prices.typecode, 'd')
+        self.assertEqual(list(self.levels.prices), [4630.123, 4620.2345, 4610.5])
+        self.assertEqual(list(self.levels.amounts), [0.014, 0.456, 12.0])
+
+    def test_sequence_view(self):
+        """Should behave as a list of (Decimal, Decimal) tuples"""
+        self.assertEqual(len(self.levels), 3)
+        self.assertEqual(self.levels[0], (Decimal('4630.123'), Decimal('0.014')))
+        self.assertEqual(self.levels[-1], (Decimal('4610.5'), Decimal('12.0')))
+        self.assertEqual(list(self.levels), LEVELS)
+        self.assertEqual(self.levels, LEVELS)
+        self.assertEqual(list(reversed(self.levels)), list(reversed(LEVELS)))
+        self.assertEqual([amount for _, amount in self.levels],
+                         [Decimal('0.014'), Decimal('0.456'), Decimal('12')])
+
+    def test_slice(self):
+        levels = self.levels[1:]
+        self.assertEqual(type(levels), PriceLevels)
+        self.assertEqual(levels, LEVELS[1:])
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.levels)), self.levels)
+
+    def test_memory(self):
+        levels = PriceLevels.from_levels(LEVELS * 100)
+        list_size = sys.getsizeof(LEVELS * 100) + sum(
+            sys.getsizeof(level) + sys.getsizeof(level[0]) + sys.getsizeof(level[1])
+            for level in LEVELS * 100)
+        buffers_size = sys.getsizeof(levels.prices) + sys.getsizeof(levels.amounts)
+        self.assertLess(buffers_size * 5, list_size)
+
+    @unittest.skipIf(arrays.numpy is None, 'NumPy is not installed')
+    def test_as_numpy(self):
+        prices, amounts = self.levels.as_numpy()
+        self.assertEqual(prices.tolist(), list(self.levels.prices))
+        prices[0] = 1
+        self.assertEqual(self.levels.prices[0], 1)
+
+
+class ArrayOrderBookTestCase(BaseXchangeTestCase):
+
+    def test_array_order_book(self):
+        ArrayOrderBook = array_order_book(OrderBook)
+        self.assertIs(array_order_book(OrderBook), ArrayOrderBook)
+        self.assertTrue(issubclass(ArrayOrderBook, OrderBook))
+
+        order_book = ArrayOrderBook({'asks': LEVELS, 'bids': list(reversed(LEVELS))})
+        self.assertEqual(type(order_book.asks), PriceLevels)
+        # sides are still sorted best level first
+        self.assertEqual(order_book, {'asks': list(reversed(LEVELS)), 'bids': LEVELS})
+
+        order_book.limit_depth(1)
+        self.assertEqual(order_book.asks, LEVELS[-1:])
+        self.assertEqual(order_book.bids, LEVELS[:1])
+
+    def test_exchange_order_book(self):
+        json_response = {'error': [], 'result': {'XXBTZUSD': {
+            'asks': [['775.78000', '4.798', 1525637947]],
+            'bids': [['774.45000', '0.167', 1525637949]]}}}
+        order_book = array_order_book(KrakenOrderBook)(json_response)
+        self.assertEqual(order_book, KrakenOrderBook(json_response))
+        self.assertEqual(pickle.loads(pickle.dumps(order_book)), order_book)
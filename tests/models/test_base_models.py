@@ -63,3 +63,25 @@ class OrderBookTestCase(BaseXchangeTestCase):
             OrderBook({
                 'foo': 'bar'
             })
+
+    def test_limit_depth(self):
+        """Should keep the best levels of each side"""
+        order_book = OrderBook({
+            "asks": [
+                (Decimal('4640'), Decimal('1')),
+                (Decimal('4630'), Decimal('2')),
+                (Decimal('4620'), Decimal('3')),
+            ],
+            "bids": [
+                (Decimal('4610'), Decimal('4')),
+                (Decimal('4600'), Decimal('5')),
+            ]
+        })
+        order_book.limit_depth(2)
+        self.assertEqual(order_book.asks, [(Decimal('4620'), Decimal('3')),
+                                           (Decimal('4630'), Decimal('2'))])
+        self.assertEqual(order_book.bids, [(Decimal('4610'), Decimal('4')),
+                                           (Decimal('4600'), Decimal('5'))])
+        order_book.limit_depth(1)
+        self.assertEqual(order_book.asks, [(Decimal('4620'), Decimal('3'))])
+        self.assertEqual(order_book.bids, [(Decimal('4610'), Decimal('4'))])
@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.constants import currencies
+from xchange.models.base import Ticker
+from xchange.models.bitfinex import BitfinexAccountBalance, BitfinexOrder
+from xchange.models.columnar import (
+    UNSET, ModelColumns, OrderList, BalanceSheet, columns_class)
+
+
+ORDERS = [
+    {'id': 1, 'side': 'buy', 'original_amount': '1.0', 'remaining_amount': '1.0',
+     'price': '2.0', 'symbol': 'btcusd', 'type': 'limit', 'is_live': True},
+    {'id': 2, 'side': 'sell', 'original_amount': '3.0', 'remaining_amount': '3.0',
+     'price': '4.5', 'symbol': 'ethusd', 'type': 'limit', 'is_live': True},
+    {'id': 3, 'side': 'buy', 'original_amount': '5.0', 'remaining_amount': '0.0',
+     'price': '6.0', 'symbol': 'btcusd', 'type': 'market', 'is_live': False},
+]
+
+
+class ModelColumnsTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.orders = OrderList.from_responses(BitfinexOrder, ORDERS)
+
+    def test_columns(self):
+        self.assertEqual(len(self.orders), 3)
+        self.assertEqual(self.orders['id'], ['1', '2', '3'])
+        self.assertEqual(self.orders['price'],
+                         [Decimal('2.0'), Decimal('4.5'), Decimal('6.0')])
+        self.assertEqual(self.orders['status'], ['open', 'open', 'closed'])
+
+    def test_rows(self):
+        """Should materialize the same models as the regular path"""
+        expected = [BitfinexOrder(order) for order in ORDERS]
+        self.assertEqual(type(self.orders[1]), BitfinexOrder)
+        self.assertEqual(self.orders[1], expected[1])
+        self.assertEqual(self.orders[1].symbol_pair, currencies.ETH_USD)
+        self.assertEqual(list(self.orders), expected)
+        self.assertEqual(self.orders, expected)
+        self.assertEqual(self.orders[1:], expected[1:])
+        self.assertEqual(type(self.orders[1:]), OrderList)
+
+    def test_where(self):
+        self.assertEqual(self.orders.mask(symbol_pair=currencies.BTC_USD),
+                         [True, False, True])
+        orders = self.orders.where(symbol_pair=currencies.BTC_USD)
+        self.assertEqual(type(orders), OrderList)
+        self.assertEqual(orders['id'], ['1', '3'])
+        orders = self.orders.where(symbol_pair=currencies.BTC_USD, status='open')
+        self.assertEqual(orders['id'], ['1'])
+        self.assertEqual(len(self.orders.where(symbol_pair=currencies.XRP_USD)), 0)
+
+    def test_unset_fields(self):
+        """Missing fields should stay unset, as in the regular models"""
+        responses = [{'last': '1.5', 'volume': '10'}, {'last': '2'}]
+        tickers = ModelColumns.from_responses(Ticker, responses)
+        self.assertEqual(tickers['volume'], [Decimal('10'), UNSET])
+        self.assertEqual(list(tickers), [Ticker(response) for response in responses])
+        self.assertNotIn('volume', tickers[1])
+
+    def test_unknown_field(self):
+        with self.assertRaisesRegexp(ValueError,
+                                     'Unknown field "foo" for class Ticker'):
+            ModelColumns.from_responses(Ticker, [{'foo': 'bar'}])
+
+    def test_balance_sheet(self):
+        balances = BalanceSheet.from_responses(BitfinexAccountBalance, [
+            {'currency': 'btc', 'available': '0.5'},
+            {'currency': 'usd', 'available': '10'},
+        ])
+        self.assertEqual(balances.balance(currencies.USD),
+                         {'symbol': 'usd', 'amount': Decimal('10')})
+        self.assertIsNone(balances.balance(currencies.ETH))
+
+    def test_columns_class(self):
+        self.assertIs(columns_class(BitfinexOrder), OrderList)
+        self.assertIs(columns_class(BitfinexAccountBalance), BalanceSheet)
+        self.assertIs(columns_class(Ticker), ModelColumns)
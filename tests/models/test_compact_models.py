@@ -0,0 +1,92 @@
+import sys
+import pickle
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models.base import Ticker, OrderBook
+from xchange.models.compact import CompactExchangeModel, compact_model
+from xchange.models.okex import OkexOrder
+
+
+class CompactModelTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        super(CompactModelTestCase, self).setUp()
+        self.data = {
+            'ask': '9314.65',
+            'bid': '100.51',
+            'high': '9480',
+            'last': '9312.34',
+            'low': '8800',
+            'volume': '16185076',
+        }
+        self.CompactTicker = compact_model(Ticker)
+        self.ticker = self.CompactTicker(self.data)
+
+    def test_compact_model(self):
+        self.assertIs(compact_model(Ticker), self.CompactTicker)
+        self.assertTrue(issubclass(self.CompactTicker, CompactExchangeModel))
+        self.assertEqual(self.CompactTicker.__name__, 'CompactTicker')
+        self.assertFalse(hasattr(self.ticker, '__dict__'))
+
+    def test_attributes(self):
+        self.assertEqual(self.ticker.ask, Decimal('9314.65'))
+        self.assertEqual(self.ticker.last, Decimal('9312.34'))
+        with self.assertRaisesRegexp(AttributeError,
+                                     'Object CompactTicker has not attribute "foobar"'):
+            self.ticker.foobar
+
+    def test_mapping_interface(self):
+        """Should behave as the dict based model"""
+        ticker = Ticker(self.data)
+        self.assertEqual(self.ticker['last'], Decimal('9312.34'))
+        self.assertEqual(sorted(self.ticker.keys()), sorted(ticker.keys()))
+        self.assertEqual(dict(self.ticker), ticker)
+        self.assertEqual(self.ticker, ticker)
+        self.assertEqual(ticker, self.ticker)
+        self.assertEqual(len(self.ticker), 6)
+        self.assertIn('ask', self.ticker)
+        self.assertEqual(self.ticker.get('foobar', 1), 1)
+        with self.assertRaises(KeyError):
+            self.ticker['foobar']
+
+        self.ticker['last'] = Decimal('1')
+        self.assertEqual(self.ticker.last, Decimal('1'))
+        self.assertNotEqual(self.ticker, ticker)
+
+    def test_unset_fields(self):
+        order = compact_model(OkexOrder)({'order_id': 10602289748})
+        self.assertEqual(order, {'id': '10602289748'})
+        self.assertNotIn('price', order)
+        with self.assertRaises(KeyError):
+            order['price']
+        with self.assertRaises(AttributeError):
+            order.price
+
+    def test_original_class_attributes(self):
+        """Should reach class attributes and methods of the original model"""
+        order = compact_model(OkexOrder)({
+            'order_id': 10602289748, 'type': 1, 'amount': 1, 'price': 3000,
+            'symbol': 'btc_usd', 'status': 0})
+        self.assertEqual(order.action, 'buy')
+        self.assertEqual(order.ORDER_TYPE, OkexOrder.ORDER_TYPE)
+
+        order_book = compact_model(OrderBook)({
+            'asks': [(Decimal('2'), Decimal('1')), (Decimal('1'), Decimal('1'))],
+            'bids': []})
+        order_book.limit_depth(1)
+        self.assertEqual(order_book.asks, [(Decimal('1'), Decimal('1'))])
+
+    def test_invalid_data(self):
+        with self.assertRaisesRegexp(ValueError,
+                                     'Unknown field "foo" for class Ticker'):
+            self.CompactTicker({'foo': 'bar'})
+
+    def test_pickle(self):
+        ticker = pickle.loads(pickle.dumps(self.ticker))
+        self.assertIs(type(ticker), self.CompactTicker)
+        self.assertEqual(ticker, self.ticker)
+
+    def test_memory(self):
+        ticker = Ticker(self.data)
+        self.assertLess(sys.getsizeof(self.ticker), sys.getsizeof(ticker))
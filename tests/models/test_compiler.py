@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models.base import Ticker
+from xchange.models.compiler import compile_constructor, get_constructor
+from xchange.models.kraken import KrakenTicker, KrakenOrder, KrakenPosition
+from xchange.models.bitfinex import BitfinexPosition
+
+
+class CompilerTestCase(BaseXchangeTestCase):
+
+    def test_get_constructor(self):
+        """Should compile each model class once"""
+        self.assertIs(get_constructor(KrakenTicker), get_constructor(KrakenTicker))
+        self.assertIsNot(get_constructor(KrakenTicker),
+                         get_constructor(KrakenTicker, attributes=True))
+
+    def test_response_fields(self):
+        """Should read values straight from the original response"""
+        json_response = {
+            'a': ['3809.00000', '1', '1.000'], 'b': ['3803.60000', '1', '1.000'],
+            'c': ['3809.30000', '0.08000000'], 'h': ['3830.30000', '3830.30000'],
+            'l': ['3570.10000', '3525.10000'], 'v': ['2204.84583619', '4523.49526430']}
+        ticker = KrakenTicker(json_response)
+        self.assertEqual(ticker, {
+            'ask': Decimal('3809.00000'),
+            'bid': Decimal('3803.60000'),
+            'low': Decimal('3570.10000'),
+            'high': Decimal('3830.30000'),
+            'last': Decimal('3809.30000'),
+            'volume': Decimal('2204.84583619'),
+        })
+        # the generic path gives the same result
+        self.assertEqual(ticker.normalize_response(json_response)['last'], '3809.30000')
+
+    def test_response_fields_functions(self):
+        position = BitfinexPosition({
+            'amount': '-0.01209215', 'base': '4118.0', 'id': 36860087,
+            'pl': '-0.10928401484', 'symbol': 'btcusd'})
+        self.assertEqual(position.action, 'sell')
+        self.assertEqual(position.amount, Decimal('0.01209215'))
+
+        position = KrakenPosition({
+            'cost': '62.82', 'id': 'T3Y3IJ', 'net': '-0.0153',
+            'pair': 'XXBTZUSD', 'type': 'buy', 'vol': '0.02'})
+        self.assertEqual(position.price, Decimal('3141'))
+
+    def test_normalize_response(self):
+        """Should keep only the fields present in the normalized response"""
+        self.assertEqual(KrakenOrder({'id': 'OGYUJ3'}), {'id': 'OGYUJ3'})
+
+    def test_unknown_response_field(self):
+        class InvalidTicker(Ticker):
+            response_fields = {'foo': 'bar'}
+
+        with self.assertRaisesRegexp(ValueError,
+                                     'Unknown field "foo" for class InvalidTicker'):
+            compile_constructor(InvalidTicker)
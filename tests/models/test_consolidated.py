@@ -0,0 +1,107 @@
+import pickle
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange import exceptions
+from xchange.constants import exchanges
+from xchange.models.arrays import array_order_book
+from xchange.models.base import OrderBook
+from xchange.models.consolidated import ConsolidatedOrderBook
+from xchange.models.serialization import dumps
+from xchange.utils import volume_weighted_average_price, worst_order_price
+
+
+class ConsolidatedOrderBookTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.bitfinex_book = OrderBook({
+            "asks": [(Decimal('7000'), Decimal('0.3')), (Decimal('7200'), Decimal('0.5'))],
+            "bids": [(Decimal('6900'), Decimal('0.2')), (Decimal('6700'), Decimal('0.4'))],
+        })
+        self.kraken_book = array_order_book(OrderBook)({
+            "asks": [(Decimal('7100'), Decimal('0.1')), (Decimal('7200'), Decimal('0.2'))],
+            "bids": [(Decimal('6950'), Decimal('0.1')), (Decimal('6800'), Decimal('0.3'))],
+        })
+        self.order_book = ConsolidatedOrderBook.from_order_books({
+            exchanges.BITFINEX: self.bitfinex_book,
+            exchanges.KRAKEN: self.kraken_book,
+        })
+
+    def test_from_order_books(self):
+        self.assertEqual(self.order_book.asks, [
+            (Decimal('7000'), Decimal('0.3')),
+            (Decimal('7100'), Decimal('0.1')),
+            (Decimal('7200'), Decimal('0.5')),
+            (Decimal('7200'), Decimal('0.2')),
+        ])
+        self.assertEqual(self.order_book.ask_exchanges, [
+            exchanges.BITFINEX, exchanges.KRAKEN, exchanges.BITFINEX, exchanges.KRAKEN])
+        self.assertEqual(self.order_book.tagged_levels('bids'), [
+            (Decimal('6950'), Decimal('0.1'), exchanges.KRAKEN),
+            (Decimal('6900'), Decimal('0.2'), exchanges.BITFINEX),
+            (Decimal('6800'), Decimal('0.3'), exchanges.KRAKEN),
+            (Decimal('6700'), Decimal('0.4'), exchanges.BITFINEX),
+        ])
+        self.assertEqual(self.order_book.order_books[exchanges.KRAKEN], self.kraken_book)
+
+    def test_price_impact_queries(self):
+        # (7000 * 0.3 + 7100 * 0.1 + 7200 * 0.1) / 0.5 = 7060
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.BUY, self.order_book, Decimal('0.5')), Decimal('7060'))
+        self.assertEqual(worst_order_price(
+            exchanges.SELL, self.order_book, Decimal('0.4')), Decimal('6800'))
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to buy 2 volume'):
+            worst_order_price(exchanges.BUY, self.order_book, Decimal('2'))
+
+    def test_update(self):
+        self.order_book.update(exchanges.KRAKEN, OrderBook({
+            "asks": [(Decimal('6990'), Decimal('1'))],
+            "bids": [],
+        }))
+        self.assertEqual(self.order_book.tagged_levels('asks'), [
+            (Decimal('6990'), Decimal('1'), exchanges.KRAKEN),
+            (Decimal('7000'), Decimal('0.3'), exchanges.BITFINEX),
+            (Decimal('7200'), Decimal('0.5'), exchanges.BITFINEX),
+        ])
+        self.assertEqual(self.order_book.bid_exchanges,
+                         [exchanges.BITFINEX, exchanges.BITFINEX])
+        self.assertEqual(worst_order_price(
+            exchanges.BUY, self.order_book, Decimal('1.1')), Decimal('7000'))
+
+        # new exchanges are merged in as well
+        self.order_book.update(exchanges.OKEX, OrderBook({
+            "asks": [], "bids": [(Decimal('7000'), Decimal('2'))],
+        }))
+        self.assertEqual(self.order_book.tagged_levels('bids')[0],
+                         (Decimal('7000'), Decimal('2'), exchanges.OKEX))
+        self.assertEqual(set(self.order_book.order_books),
+                         {exchanges.BITFINEX, exchanges.KRAKEN, exchanges.OKEX})
+
+    def test_update_invalidates_depth_index(self):
+        self.assertEqual(self.order_book.depth_index('asks').total, Decimal('1.1'))
+        self.order_book.update(exchanges.KRAKEN, OrderBook({"asks": [], "bids": []}))
+        self.assertEqual(self.order_book.depth_index('asks').total, Decimal('0.8'))
+
+    def test_remove(self):
+        self.order_book.remove(exchanges.BITFINEX)
+        self.assertEqual(self.order_book.asks, list(self.kraken_book.asks))
+        self.assertEqual(self.order_book.bid_exchanges, [exchanges.KRAKEN] * 2)
+        self.assertEqual(list(self.order_book.order_books), [exchanges.KRAKEN])
+
+    def test_limit_depth(self):
+        self.order_book.limit_depth(1)
+        self.assertEqual(self.order_book.tagged_levels('asks'), [
+            (Decimal('7000'), Decimal('0.3'), exchanges.BITFINEX)])
+        self.assertEqual(self.order_book.bid_exchanges, [exchanges.KRAKEN])
+
+    def test_pickle(self):
+        order_book = pickle.loads(pickle.dumps(self.order_book))
+        self.assertEqual(order_book, self.order_book)
+        self.assertEqual(list(order_book.order_books),
+                         [exchanges.BITFINEX, exchanges.KRAKEN])
+
+    def test_not_serializable(self):
+        with self.assertRaisesRegexp(ValueError,
+                                     'Can not serialize ConsolidatedOrderBook models'):
+            dumps(self.order_book)
@@ -0,0 +1,134 @@
+import pickle
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models.arrays import array_order_book
+from xchange.models.base import OrderBook
+from xchange.models.compact import compact_model
+from xchange.models.depth import (
+    DepthIndex, BufferDepthIndex, FixedDepthIndex, build_depth_index)
+from xchange.models.fixed import Precision, FixedPriceLevels, fixed_order_book
+
+ORDER_BOOK = {
+    "asks": [
+        (Decimal('7000'), Decimal('0.3')),
+        (Decimal('8000'), Decimal('0.4')),
+        (Decimal('9000'), Decimal('0.1')),
+    ],
+    "bids": [
+        (Decimal('3000'), Decimal('0.3')),
+        (Decimal('2000'), Decimal('0.4')),
+        (Decimal('1000'), Decimal('0.1')),
+    ]
+}
+
+
+class DepthIndexTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.index = build_depth_index(ORDER_BOOK['asks'])
+
+    def test_cumulative_sums(self):
+        self.assertIsInstance(self.index, DepthIndex)
+        self.assertEqual(self.index.volumes,
+                         [Decimal('0.3'), Decimal('0.7'), Decimal('0.8')])
+        self.assertEqual(self.index.notionals,
+                         [Decimal('2100'), Decimal('5300'), Decimal('6200')])
+        self.assertEqual(self.index.total, Decimal('0.8'))
+
+    def test_worst_price(self):
+        self.assertEqual(self.index.worst_price(Decimal('0.1')), Decimal('7000'))
+        # a level fully used is still the worst one
+        self.assertEqual(self.index.worst_price(Decimal('0.3')), Decimal('7000'))
+        self.assertEqual(self.index.worst_price(Decimal('0.5')), Decimal('8000'))
+        self.assertEqual(self.index.worst_price(Decimal('0.8')), Decimal('9000'))
+
+    def test_average_price(self):
+        self.assertEqual(self.index.average_price(Decimal('0.1')), Decimal('7000'))
+        # (7000 * 0.3 + 8000 * 0.2) / 0.5 = 7400
+        self.assertEqual(self.index.average_price(Decimal('0.5')), Decimal('7400'))
+        # 6200 / 0.8 = 7750
+        self.assertEqual(self.index.average_price(Decimal('0.8')), Decimal('7750'))
+        self.assertEqual(self.index.scale_amount(0.5), Decimal('0.5'))
+        self.assertEqual(self.index.average_price(self.index.scale_amount(0.5)),
+                         Decimal('7400'))
+
+    def test_empty_side(self):
+        index = build_depth_index([])
+        self.assertEqual(index.total, Decimal('0'))
+        self.assertIsNone(index.worst_price(Decimal('0')))
+        self.assertIsNone(index.average_price(Decimal('0')))
+
+    def test_buffers(self):
+        index = build_depth_index(array_order_book(OrderBook)(ORDER_BOOK).asks)
+        self.assertIsInstance(index, BufferDepthIndex)
+        self.assertEqual(index.total, 0.8)
+        self.assertEqual(index.worst_price(index.scale_amount('0.5')), Decimal('8000'))
+        self.assertEqual(index.average_price(index.scale_amount('0.5')), Decimal('7400'))
+        # float rounding of the cumulative volumes doesn't skip the last level
+        self.assertEqual(index.worst_price(index.total), Decimal('9000'))
+
+    def test_fixed(self):
+        precision = Precision(tick_size='1', lot_size='0.1')
+        levels = FixedPriceLevels.from_levels(ORDER_BOOK['asks'], precision)
+        index = build_depth_index(levels)
+        self.assertIsInstance(index, FixedDepthIndex)
+        self.assertEqual(index.volumes, [3, 7, 8])
+        self.assertEqual(index.notionals, [21000, 53000, 62000])
+        self.assertEqual(index.scale_amount(Decimal('0.5')), 5)
+        self.assertEqual(index.worst_price(5), Decimal('8000'))
+        self.assertEqual(index.average_price(5), Decimal('7400'))
+        with self.assertRaisesRegexp(ValueError, 'has more than 1 decimal places'):
+            index.scale_amount(Decimal('0.55'))
+
+
+class OrderBookDepthIndexTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.order_book = OrderBook(ORDER_BOOK)
+
+    def test_cached(self):
+        index = self.order_book.depth_index('asks')
+        self.assertIs(self.order_book.depth_index('asks'), index)
+        self.assertIsNot(self.order_book.depth_index('bids'), index)
+        self.assertEqual(self.order_book.depth_index('bids').total, Decimal('0.8'))
+
+    def test_built_on_second_query(self):
+        self.assertIsNone(self.order_book.depth_index('asks', build=False))
+        index = self.order_book.depth_index('asks', build=False)
+        self.assertIsInstance(index, DepthIndex)
+        self.assertIs(self.order_book.depth_index('asks', build=False), index)
+
+        # replaced sides start over
+        self.order_book.limit_depth(1)
+        self.assertIsNone(self.order_book.depth_index('asks', build=False))
+        order_book = compact_model(OrderBook)(ORDER_BOOK)
+        self.assertIsNone(order_book.depth_index('asks', build=False))
+
+    def test_invalidated_when_side_changes(self):
+        index = self.order_book.depth_index('asks')
+        self.order_book.limit_depth(2)
+        self.assertIsNot(self.order_book.depth_index('asks'), index)
+        self.assertEqual(self.order_book.depth_index('asks').total, Decimal('0.7'))
+
+        self.order_book['bids'] = [(Decimal('3000'), Decimal('1'))]
+        self.assertEqual(self.order_book.depth_index('bids').total, Decimal('1'))
+
+    def test_pickle(self):
+        self.order_book.depth_index('asks')
+        order_book = pickle.loads(pickle.dumps(self.order_book))
+        self.assertEqual(order_book, self.order_book)
+        self.assertNotIn('_depth_indexes', order_book.__dict__)
+        self.assertEqual(order_book.depth_index('asks').total, Decimal('0.8'))
+
+    def test_variants(self):
+        precision = Precision(tick_size='1', lot_size='0.1')
+        for model_class in (array_order_book(OrderBook),
+                            fixed_order_book(OrderBook, precision)):
+            order_book = model_class(ORDER_BOOK)
+            index = order_book.depth_index('bids')
+            self.assertIs(order_book.depth_index('bids'), index)
+
+        # compact books have no instance dict, the index isn't cached
+        order_book = compact_model(OrderBook)(ORDER_BOOK)
+        self.assertEqual(order_book.depth_index('asks').total, Decimal('0.8'))
@@ -0,0 +1,121 @@
+import pickle
+from array import array
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange import exceptions
+from xchange.constants import exchanges
+from xchange.models.base import OrderBook
+from xchange.models.fixed import (
+    Precision, FixedPriceLevels, FixedPointOrderBook, fixed_order_book,
+    to_scaled_int, from_scaled_int
+)
+from xchange.utils import volume_weighted_average_price, worst_order_price
+
+
+class ScaledIntTestCase(BaseXchangeTestCase):
+
+    def test_to_scaled_int(self):
+        self.assertEqual(to_scaled_int('4626.12300', 3), 4626123)
+        self.assertEqual(to_scaled_int(Decimal('0.014'), 8), 1400000)
+        self.assertEqual(to_scaled_int(411.75, 2), 41175)
+        self.assertEqual(to_scaled_int(12, 2), 1200)
+        with self.assertRaisesRegexp(ValueError,
+                                     '"4626.1234" has more than 3 decimal places'):
+            to_scaled_int('4626.1234', 3)
+        self.assertEqual(to_scaled_int('0.123456789', 8, round_down=True), 12345678)
+
+    def test_from_scaled_int(self):
+        self.assertEqual(from_scaled_int(4626123, 3), Decimal('4626.123'))
+        self.assertEqual(from_scaled_int(1, 8), Decimal('0.00000001'))
+
+    def test_precision(self):
+        precision = Precision(tick_size='0.01', lot_size='0.00000001')
+        self.assertEqual((precision.price_places, precision.amount_places), (2, 8))
+        self.assertEqual(Precision('1', '0.5').price_places, 0)
+        self.assertEqual(Precision('1', '0.5').amount_places, 1)
+        self.assertEqual(precision, Precision(Decimal('0.01'), '1E-8'))
+        self.assertNotEqual(precision, Precision('0.1', '0.00000001'))
+        self.assertEqual(pickle.loads(pickle.dumps(precision)), precision)
+
+
+class FixedPriceLevelsTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.precision = Precision(tick_size='0.001', lot_size='0.001')
+        self.levels = FixedPriceLevels.from_levels([
+            (Decimal('4610.5'), Decimal('12')),
+            (Decimal('4620.234'), Decimal('0.4567')),
+        ], self.precision)
+
+    def test_buffers(self):
+        self.assertEqual(self.levels.prices, array('q', [4610500, 4620234]))
+        # amounts finer than the lot size are rounded down
+        self.assertEqual(self.levels.amounts, array('q', [12000, 456]))
+
+    def test_sequence_view(self):
+        self.assertEqual(self.levels, [(Decimal('4610.5'), Decimal('12')),
+                                       (Decimal('4620.234'), Decimal('0.456'))])
+        self.assertEqual(self.levels[1:], [(Decimal('4620.234'), Decimal('0.456'))])
+        self.assertEqual(self.levels[1:].precision, self.precision)
+
+    def test_price_off_tick_size(self):
+        with self.assertRaisesRegexp(ValueError, 'has more than 3 decimal places'):
+            FixedPriceLevels.from_levels([(Decimal('4610.5001'), Decimal('1'))],
+                                         self.precision)
+
+    def test_equality(self):
+        other = FixedPriceLevels.from_levels(list(self.levels), Precision('0.001', '0.01'))
+        self.assertNotEqual(self.levels, other)
+        self.assertEqual(pickle.loads(pickle.dumps(self.levels)), self.levels)
+
+
+class FixedOrderBookTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.precision = Precision(tick_size='1', lot_size='0.1')
+        self.order_book = fixed_order_book(OrderBook, self.precision)({
+            "asks": [
+                (Decimal('9000'), Decimal('0.1')),
+                (Decimal('8000'), Decimal('0.4')),
+                (Decimal('7000'), Decimal('0.3')),
+            ],
+            "bids": [
+                (Decimal('3000'), Decimal('0.3')),
+                (Decimal('2000'), Decimal('0.4')),
+                (Decimal('1000'), Decimal('0.1')),
+            ]
+        })
+
+    def test_fixed_order_book(self):
+        FixedOrderBook = fixed_order_book(OrderBook, Precision('1', '0.1'))
+        self.assertIs(type(self.order_book), FixedOrderBook)
+        self.assertEqual(FixedOrderBook.__name__, 'FixedOrderBook_0_1')
+        self.assertTrue(issubclass(FixedOrderBook, FixedPointOrderBook))
+        self.assertTrue(issubclass(FixedOrderBook, OrderBook))
+        self.assertEqual(self.order_book.asks.prices, array('q', [7000, 8000, 9000]))
+        self.assertEqual(self.order_book.bids.amounts, array('q', [3, 4, 1]))
+        self.assertEqual(pickle.loads(pickle.dumps(self.order_book)), self.order_book)
+
+    def test_volume_weighted_average_price(self):
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.BUY, self.order_book, Decimal('0.5')), Decimal('7400'))
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.SELL, self.order_book, Decimal('0.5')), Decimal('2600'))
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.BUY, self.order_book, '0.8'), Decimal('7750'))
+
+    def test_worst_order_price(self):
+        self.assertEqual(worst_order_price(
+            exchanges.BUY, self.order_book, Decimal('0.5')), Decimal('8000'))
+        self.assertEqual(worst_order_price(
+            exchanges.SELL, self.order_book, Decimal('0.3')), Decimal('3000'))
+
+    def test_insufficient_depth(self):
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to sell 2.0 volume'):
+            worst_order_price(exchanges.SELL, self.order_book, Decimal('2.0'))
+
+    def test_amount_finer_than_lot_size(self):
+        with self.assertRaisesRegexp(ValueError, 'has more than 1 decimal places'):
+            volume_weighted_average_price(exchanges.BUY, self.order_book, Decimal('0.25'))
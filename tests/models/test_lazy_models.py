@@ -0,0 +1,105 @@
+import pickle
+import threading
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models.base import Order
+from xchange.models.lazy import LazyExchangeModel, lazy_model
+from xchange.models.kraken import KrakenOrder
+from xchange.models.bitfinex import BitfinexOrder
+
+
+class LazyModelTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        super(LazyModelTestCase, self).setUp()
+        self.json_response = {
+            'id': 3848275544,
+            'is_live': True,
+            'original_amount': '1.0',
+            'price': '2.0',
+            'side': 'buy',
+            'symbol': 'btcusd',
+            'type': 'limit',
+        }
+        self.LazyOrder = lazy_model(BitfinexOrder)
+        self.order = self.LazyOrder(self.json_response)
+
+    def test_lazy_model(self):
+        self.assertIs(lazy_model(BitfinexOrder), self.LazyOrder)
+        self.assertTrue(issubclass(self.LazyOrder, LazyExchangeModel))
+        self.assertEqual(self.LazyOrder.__name__, 'LazyBitfinexOrder')
+
+    def test_lazy_conversion(self):
+        """Should convert fields on first access, only once"""
+        self.assertEqual(self.order._raw['price'], '2.0')
+        price = self.order.price
+        self.assertEqual(price, Decimal('2.0'))
+        self.assertNotIn('price', self.order._raw)
+        self.assertIs(self.order.price, price)
+        self.assertIs(self.order['price'], price)
+        self.assertEqual(self.order.symbol_pair, 'btc_usd')
+
+    def test_mapping_interface(self):
+        """Should behave as the dict based model"""
+        order = BitfinexOrder(self.json_response)
+        self.assertEqual(sorted(self.order.keys()), sorted(order.keys()))
+        # listing keys doesn't convert anything
+        self.assertEqual(len(self.order._raw), 7)
+        self.assertIn('price', self.order)
+        self.assertEqual(self.order, order)
+        self.assertEqual(dict(self.order), order)
+
+        self.order['price'] = Decimal('3')
+        self.assertEqual(self.order.price, Decimal('3'))
+
+    def test_invalid_values(self):
+        """Should only validate values once they are read"""
+        self.json_response['side'] = 'foobar'
+        order = self.LazyOrder(self.json_response)
+        self.assertEqual(order.id, '3848275544')
+        with self.assertRaisesRegexp(ValueError, '"foobar" is not a valid value'):
+            order.action
+        # the field is kept, later reads raise the same error
+        self.assertIn('action', order)
+        self.assertIn('action', order.keys())
+        with self.assertRaisesRegexp(ValueError, '"foobar" is not a valid value'):
+            order.action
+
+    def test_concurrent_reads(self):
+        """Should convert the field once, readers never see it missing"""
+        orders = [self.LazyOrder(self.json_response) for _ in range(200)]
+        errors = []
+
+        def read():
+            for order in orders:
+                try:
+                    self.assertEqual(order.price, Decimal('2.0'))
+                except Exception as exc:
+                    errors.append(exc)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_unknown_fields(self):
+        with self.assertRaisesRegexp(ValueError,
+                                     'Unknown field "foo" for class Order'):
+            lazy_model(Order)({'foo': 'bar'})
+
+    def test_unset_fields(self):
+        order = lazy_model(KrakenOrder)({'id': 'OGYUJ3'})
+        self.assertEqual(order, {'id': 'OGYUJ3'})
+        self.assertNotIn('price', order)
+        with self.assertRaisesRegexp(AttributeError,
+                                     'Object LazyKrakenOrder has not attribute "price"'):
+            order.price
+
+    def test_pickle(self):
+        self.order.price
+        order = pickle.loads(pickle.dumps(self.order))
+        self.assertIs(type(order), self.LazyOrder)
+        self.assertEqual(order, self.order)
@@ -0,0 +1,109 @@
+import pickle
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.models.arrays import array_order_book
+from xchange.models.bitfinex import (
+    BitfinexAccountBalance, BitfinexOrder, BitfinexPosition)
+from xchange.models.compact import compact_model
+from xchange.models.fixed import Precision, fixed_order_book
+from xchange.models.kraken import KrakenOrderBook, KrakenTicker
+from xchange.models.lazy import lazy_model
+from xchange.models.okex import OkexOrderBook
+from xchange.models.serialization import (
+    HEADER, MAGIC, VERSION, KIND_MODEL, dumps, loads)
+
+
+ORDER_BOOK_RESPONSE = {'error': [], 'result': {'XXBTZUSD': {
+    'asks': [['775.78000', '4.798', 1525637947],
+             ['775.82000', '4.398', 1525637948]],
+    'bids': [['774.45000', '0.167', 1525637949],
+             ['773.73000', '2.699', 1525637947]]}}}
+TICKER_RESPONSE = {
+    'a': ['3809.00000', '1', '1.000'],
+    'b': ['3803.60000', '1', '1.000'],
+    'c': ['3809.30000', '0.08000000'],
+    'v': ['3025.47370040', '3579.29127153'],
+    'p': ['3808.41380', '3810.61245'],
+    't': [4893, 7120],
+    'l': ['3750.00000', '3750.00000'],
+    'h': ['3860.00000', '3860.00000'],
+    'o': '3810.00000'}
+ORDER_RESPONSE = {
+    'id': 3864975544, 'side': 'buy', 'original_amount': '1.0',
+    'remaining_amount': '1.0', 'price': '2.0', 'symbol': 'btcusd',
+    'type': 'limit', 'is_live': True}
+POSITION_RESPONSE = {
+    'id': 34546527, 'amount': '-0.01209215', 'base': '4118.0',
+    'pl': '-0.10928401484', 'status': 'ACTIVE', 'swap': '0.0',
+    'symbol': 'ethusd', 'timestamp': '1503264460.0'}
+
+
+class SerializationTestCase(BaseXchangeTestCase):
+
+    def assertRoundTrip(self, model):
+        loaded = loads(dumps(model))
+        self.assertEqual(type(loaded), type(model))
+        self.assertEqual(loaded, model)
+        return loaded
+
+    def test_models(self):
+        for model in (KrakenTicker(TICKER_RESPONSE),
+                      BitfinexOrder(ORDER_RESPONSE),
+                      BitfinexPosition(POSITION_RESPONSE),
+                      BitfinexAccountBalance({'currency': 'btc', 'available': '0.5'})):
+            loaded = self.assertRoundTrip(model)
+            for field, value in model.items():
+                self.assertEqual(str(loaded[field]), str(value))
+
+    def test_model_variants(self):
+        self.assertRoundTrip(compact_model(BitfinexOrder)(ORDER_RESPONSE))
+        loaded = self.assertRoundTrip(lazy_model(BitfinexOrder)(ORDER_RESPONSE))
+        self.assertEqual(loaded.price, Decimal('2.0'))
+
+    def test_order_book(self):
+        order_book = KrakenOrderBook(ORDER_BOOK_RESPONSE)
+        data = dumps(order_book)
+        self.assertLess(len(data), len(pickle.dumps(order_book)))
+        loaded = self.assertRoundTrip(order_book)
+        # exponents are kept as well
+        self.assertEqual(str(loaded.asks[0][0]), '775.78000')
+
+    def test_order_book_text_levels(self):
+        """Should keep values not fitting an int64 coefficient"""
+        order_book = OkexOrderBook({'asks': [[411.8, 6]], 'bids': []})
+        order_book['asks'] = [(Decimal('411.8'), Decimal(6) / Decimal(7))]
+        self.assertRoundTrip(order_book)
+
+    def test_array_order_book(self):
+        """Should read the buffers without copying them"""
+        order_book = array_order_book(KrakenOrderBook)(ORDER_BOOK_RESPONSE)
+        data = bytearray(dumps(order_book))
+        loaded = self.assertRoundTrip(order_book)
+        loaded = loads(data)
+        self.assertEqual(type(loaded.asks.prices), memoryview)
+        data[-8:] = bytes(8)
+        self.assertEqual(loaded.bids[-1], (Decimal('773.73'), Decimal('0.0')))
+        self.assertEqual(pickle.loads(pickle.dumps(loaded)), loaded)
+
+    def test_fixed_order_book(self):
+        precision = Precision(tick_size='0.01', lot_size='0.001')
+        order_book = fixed_order_book(KrakenOrderBook, precision)(ORDER_BOOK_RESPONSE)
+        loaded = self.assertRoundTrip(order_book)
+        self.assertEqual(loaded.asks.precision, precision)
+        self.assertEqual(loaded.limit_depth(1), None)
+        self.assertEqual(loaded.asks, [(Decimal('775.78'), Decimal('4.798'))])
+
+    def test_empty_order_book(self):
+        self.assertRoundTrip(KrakenOrderBook({'error': [], 'result': {
+            'XXBTZUSD': {'asks': [], 'bids': []}}}))
+
+    def test_invalid_data(self):
+        with self.assertRaisesRegexp(ValueError, 'Not a serialized model'):
+            loads(b'\x00' * 16)
+
+    def test_invalid_class_path(self):
+        for path in (b'os:system', b'xchange.models.utils:as_decimal'):
+            data = HEADER.pack(MAGIC, VERSION, KIND_MODEL, 0, len(path)) + path
+            with self.assertRaisesRegexp(ValueError, 'Not a model class path'):
+                loads(data)
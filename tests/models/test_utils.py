@@ -3,10 +3,11 @@ from decimal import Decimal
 from tests import BaseXchangeTestCase
 from xchange.constants import currencies
 from xchange.models.utils import (
-    object_of_class, sorted_list, restricted_to_values,
+    as_decimal, object_of_class, sorted_list, restricted_to_values,
     normalized_symbol, normalized_symbol_pair,
-    contracts_to_crypto, crypto_to_contracts
+    contracts_to_crypto, contracts_to_crypto_factor, crypto_to_contracts
 )
+from xchange.models.okex import OkexOrderBook, OkexTicker
 
 class ValidatorsTestCase(BaseXchangeTestCase):
 
@@ -50,6 +51,17 @@ class ValidatorsTestCase(BaseXchangeTestCase):
             ]
         )
 
+    def test_sorted_list_presorted(self):
+        """Should keep sorted lists and reverse the ones sorted the other way"""
+        func = sorted_list(lambda x: x, 'asc')
+        l = [1, 2, 2, 3]
+        self.assertIs(func(l), l)
+        l = [3, 2, 2, 1]
+        self.assertEqual(func(l), [1, 2, 2, 3])
+        self.assertEqual(l, [3, 2, 2, 1])
+        self.assertEqual(func(iter([2, 3, 1])), [1, 2, 3])
+        self.assertEqual(func([]), [])
+
     def test_restricted_to_values(self):
         func = restricted_to_values(['Hello', 'World'])
         func('Hello')
@@ -85,6 +97,32 @@ class ConvertersTestCase(BaseXchangeTestCase):
         # 0.0375 = 3 * (100 / 8000)
         self.assertEqual(amount_in_crypto,  Decimal('0.0375'))
 
+    def test_contracts_to_crypto_factor(self):
+        factor = contracts_to_crypto_factor(crypto_last_price=8000, unit_amount=100)
+        self.assertEqual(factor, Decimal('0.0125'))
+        self.assertEqual(3 * factor, contracts_to_crypto(3, 8000, 100))
+
+    def test_okex_order_book_contracts(self):
+        """Should convert every level with the factor of the book"""
+        OkexOrderBook.TICKER = OkexTicker({'ticker': {
+            'buy': 7990, 'sell': 8010, 'high': 8100, 'low': 7900,
+            'last': 8000, 'vol': 100}})
+        OkexOrderBook.SYMBOL = 'btc_usd'
+        OkexOrderBook.CONTRACT_UNIT_AMOUNTS = {'btc_usd': 100}
+        try:
+            order_book = OkexOrderBook({'asks': [[8010, 3], [8020, 4]],
+                                        'bids': [[7990, 8]]})
+            self.assertEqual(OkexOrderBook.normalize_level([8010, 3]),
+                             (Decimal('8010'), Decimal('0.0375')))
+        finally:
+            OkexOrderBook.TICKER = OkexOrderBook.SYMBOL = None
+            OkexOrderBook.CONTRACT_UNIT_AMOUNTS = None
+        self.assertEqual(order_book.asks, [(Decimal('8010'), Decimal('0.0375')),
+                                           (Decimal('8020'), Decimal('0.05'))])
+        self.assertEqual(order_book.bids, [(Decimal('7990'), Decimal('0.1'))])
+        self.assertEqual(OkexOrderBook.normalize_level([8010, 3]),
+                         (Decimal('8010'), Decimal('3')))
+
     def test_crypto_to_contracts(self):
         amount_in_contracts = crypto_to_contracts(
             amount_in_crypto=Decimal('0.0375'),
@@ -94,3 +132,15 @@ class ConvertersTestCase(BaseXchangeTestCase):
         # amount_in_contracts = (amount_in_crypto * crypto_last_price) / unit_amount
         # 3 = (0.0375 * 8000) / 100
         self.assertEqual(amount_in_contracts,  3)
+
+
+class AsDecimalTestCase(BaseXchangeTestCase):
+
+    def test_as_decimal(self):
+        self.assertEqual(as_decimal('9315.49'), Decimal('9315.49'))
+        self.assertEqual(as_decimal(9315.49), Decimal('9315.49'))
+        self.assertEqual(as_decimal(5), Decimal('5'))
+
+    def test_as_decimal_keeps_decimal(self):
+        value = Decimal('0.1000000000000000055511')
+        self.assertIs(as_decimal(value), value)
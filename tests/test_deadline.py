@@ -0,0 +1,43 @@
+import time
+
+from tests import BaseXchangeTestCase
+from xchange.exceptions import TimeoutException
+from xchange.deadline import Deadline, as_deadline
+
+
+class DeadlineTestCase(BaseXchangeTestCase):
+
+    def test_remaining(self):
+        deadline = Deadline(10)
+        self.assertLessEqual(deadline.remaining(), 10)
+        self.assertGreater(deadline.remaining(), 9)
+        self.assertFalse(deadline.expired)
+
+    def test_expired(self):
+        deadline = Deadline(0.05)
+        time.sleep(0.06)
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertTrue(deadline.expired)
+        with self.assertRaisesRegexp(TimeoutException, 'Deadline of 0.05 seconds exceeded'):
+            deadline.check()
+
+    def test_cap_timeout(self):
+        deadline = Deadline(2)
+        self.assertEqual(deadline.cap(1), 1)
+        self.assertLessEqual(deadline.cap(5), 2)
+
+    def test_cap_connect_read_timeout(self):
+        connect_timeout, read_timeout = Deadline(2).cap((1, 5))
+        self.assertEqual(connect_timeout, 1)
+        self.assertLessEqual(read_timeout, 2)
+
+    def test_cap_expired(self):
+        deadline = Deadline(0)
+        with self.assertRaises(TimeoutException):
+            deadline.cap((1, 1))
+
+    def test_as_deadline(self):
+        deadline = Deadline(1)
+        self.assertIs(as_deadline(deadline), deadline)
+        self.assertIsNone(as_deadline(None))
+        self.assertEqual(type(as_deadline(3)), Deadline)
@@ -0,0 +1,44 @@
+import unittest
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange import json_backends
+
+
+CONTENT = b'{"asks": [[9315.49, 5], [0.1000000000000000055511, 77]], "ok": true}'
+
+
+class JSONBackendsTestCase(BaseXchangeTestCase):
+
+    def test_decimal_backend(self):
+        """Should parse decimal numbers straight into exact Decimal objects"""
+        loads = json_backends.get_loads(json_backends.DECIMAL)
+        data = loads(CONTENT)
+        self.assertEqual(data['asks'][0], [Decimal('9315.49'), 5])
+        self.assertEqual(data['asks'][1][0], Decimal('0.1000000000000000055511'))
+        self.assertEqual(type(data['asks'][0][1]), int)
+        self.assertEqual(data['ok'], True)
+
+    def test_default_backend(self):
+        self.assertEqual(json_backends.get_loads(),
+                         json_backends.get_loads(json_backends.DECIMAL))
+
+    def test_stdlib_backend(self):
+        loads = json_backends.get_loads(json_backends.STDLIB)
+        self.assertEqual(loads(CONTENT)['asks'][0], [9315.49, 5])
+
+    @unittest.skipIf(json_backends.orjson is None, 'orjson is not installed')
+    def test_orjson_backend(self):
+        loads = json_backends.get_loads(json_backends.ORJSON)
+        self.assertEqual(loads(CONTENT)['asks'][0], [9315.49, 5])
+        with self.assertRaises(ValueError):
+            loads(b'{"not-valid-json"}')
+
+    @unittest.skipIf(json_backends.ujson is None, 'ujson is not installed')
+    def test_ujson_backend(self):
+        loads = json_backends.get_loads(json_backends.UJSON)
+        self.assertEqual(loads(CONTENT)['asks'][0], [9315.49, 5])
+
+    def test_invalid_backend(self):
+        with self.assertRaisesRegexp(ValueError, 'Invalid "foobar" JSON backend'):
+            json_backends.get_loads('foobar')
@@ -0,0 +1,74 @@
+import time
+import threading
+
+from tests import BaseXchangeTestCase
+from xchange.exceptions import RateLimitException
+from xchange.ratelimit import TokenBucket, RateLimiter
+
+
+class TokenBucketTestCase(BaseXchangeTestCase):
+
+    def test_reserve_within_capacity(self):
+        bucket = TokenBucket(capacity=2, refill_rate=1)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_reserve_queues_when_empty(self):
+        """Should return increasing waits for consecutive reservations over capacity"""
+        bucket = TokenBucket(capacity=1, refill_rate=10)
+        bucket.reserve()
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_reserve_free_cost(self):
+        bucket = TokenBucket(capacity=1, refill_rate=1)
+        bucket.reserve()
+        self.assertEqual(bucket.reserve(cost=0), 0)
+
+    def test_reserve_max_wait(self):
+        """Should fail without taking tokens when the wait is too long"""
+        bucket = TokenBucket(capacity=1, refill_rate=1)
+        bucket.reserve()
+        with self.assertRaises(RateLimitException):
+            bucket.reserve(max_wait=0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1, places=2)
+
+    def test_reserve_is_thread_safe(self):
+        bucket = TokenBucket(capacity=50, refill_rate=0.001)
+        threads = [threading.Thread(target=bucket.reserve) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertAlmostEqual(bucket.tokens, 0, places=2)
+
+
+class RateLimiterTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.limiter = RateLimiter(
+            buckets={'public': (1, 10), 'private': (4, 10)},
+            endpoints=(
+                ('/public/', 'public', 1),
+                ('/private/Cancel', 'private', 0),
+                ('/private/', 'private', 2),
+            ))
+
+    def test_reserve_charges_matching_bucket(self):
+        self.limiter.reserve('/private/Balance')
+        self.assertAlmostEqual(self.limiter.buckets['private'].tokens, 2, places=1)
+        self.assertAlmostEqual(self.limiter.buckets['public'].tokens, 1, places=1)
+
+    def test_reserve_first_prefix_wins(self):
+        self.limiter.reserve('/private/Cancel')
+        self.assertAlmostEqual(self.limiter.buckets['private'].tokens, 4, places=1)
+
+    def test_reserve_unmatched_path(self):
+        for _ in range(10):
+            self.assertEqual(self.limiter.reserve('/other?foo=bar'), 0)
+
+    def test_acquire_waits(self):
+        self.limiter.acquire('/public/Ticker?pair=XBTUSD')
+        start = time.time()
+        self.limiter.acquire('/public/Ticker?pair=XBTUSD')
+        self.assertGreaterEqual(time.time() - start, 0.08)
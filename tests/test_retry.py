@@ -0,0 +1,48 @@
+import time
+from email.utils import formatdate
+
+from tests import BaseXchangeTestCase
+from xchange.retry import RetryPolicy
+
+
+class RetryPolicyTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_retries=2, backoff_factor=1, max_backoff=30)
+
+    def test_can_retry_idempotent_method(self):
+        self.assertTrue(self.policy.can_retry('GET', 0))
+        self.assertTrue(self.policy.can_retry('get', 1))
+        self.assertFalse(self.policy.can_retry('GET', 2))
+
+    def test_can_retry_non_idempotent_method(self):
+        """Should only retry POST requests that didn't reach the server"""
+        self.assertFalse(self.policy.can_retry('POST', 0))
+        self.assertTrue(self.policy.can_retry('POST', 0, sent=False))
+        self.assertFalse(self.policy.can_retry('POST', 2, sent=False))
+
+    def test_retries_disabled_by_default(self):
+        self.assertFalse(RetryPolicy().can_retry('GET', 0))
+
+    def test_should_retry_status(self):
+        self.assertTrue(self.policy.should_retry_status('GET', 0, 429))
+        self.assertTrue(self.policy.should_retry_status('GET', 0, 503))
+        self.assertFalse(self.policy.should_retry_status('GET', 0, 400))
+        self.assertFalse(self.policy.should_retry_status('POST', 0, 503))
+
+    def test_get_backoff_jitter(self):
+        for attempt in range(5):
+            backoff = self.policy.get_backoff(attempt)
+            self.assertGreaterEqual(backoff, 0)
+            self.assertLessEqual(backoff, min(2 ** attempt, 30))
+
+    def test_get_backoff_retry_after_seconds(self):
+        self.assertEqual(self.policy.get_backoff(0, '3'), 3)
+        self.assertEqual(self.policy.get_backoff(0, '120'), 30)
+
+    def test_get_backoff_retry_after_date(self):
+        retry_after = formatdate(time.time() + 10, usegmt=True)
+        self.assertAlmostEqual(self.policy.get_backoff(0, retry_after), 10, delta=1.5)
+
+    def test_get_backoff_invalid_retry_after(self):
+        self.assertLessEqual(self.policy.get_backoff(0, 'soon'), 1)
@@ -0,0 +1,139 @@
+import time
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange import exceptions
+from xchange.clients.multi import MultiExchangeClient
+from xchange.constants import exchanges, currencies
+from xchange.models.arrays import array_order_book
+from xchange.models.base import OrderBook
+from xchange.routing import Route, SmartOrderRouter, split_order
+
+
+class FakeClient:
+    def __init__(self, order_book, delay=0, error=None):
+        self.order_book = order_book
+        self.delay = delay
+        self.error = error
+        self.orders = []
+
+    def get_order_book(self, symbol_pair, depth=None, deadline=None):
+        return self.order_book
+
+    def open_order(self, action, amount, symbol_pair, price, order_type, deadline=None):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.orders.append((action, amount, symbol_pair, price, order_type))
+        return {'id': str(len(self.orders)), 'amount': amount, 'price': price}
+
+    def close(self):
+        pass
+
+
+class SplitOrderTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.order_books = {
+            exchanges.BITFINEX: OrderBook({
+                "asks": [(Decimal('7000'), Decimal('0.3')), (Decimal('7200'), Decimal('0.5'))],
+                "bids": [(Decimal('6900'), Decimal('0.2')), (Decimal('6700'), Decimal('0.4'))],
+            }),
+            exchanges.KRAKEN: array_order_book(OrderBook)({
+                "asks": [(Decimal('7100'), Decimal('0.1')), (Decimal('7150'), Decimal('0.2'))],
+                "bids": [(Decimal('6950'), Decimal('0.1')), (Decimal('6800'), Decimal('0.3'))],
+            }),
+        }
+
+    def test_split_buy_order(self):
+        routes = split_order(exchanges.BUY, self.order_books, Decimal('0.5'))
+        self.assertEqual(routes, {
+            exchanges.BITFINEX: Route(exchanges.BITFINEX, Decimal('0.3'), Decimal('7000')),
+            exchanges.KRAKEN: Route(exchanges.KRAKEN, Decimal('0.2'), Decimal('7150')),
+        })
+        # (7100 * 0.1 + 7150 * 0.1) / 0.2 = 7125
+        self.assertEqual(routes[exchanges.KRAKEN].average_price, Decimal('7125'))
+
+    def test_split_sell_order(self):
+        routes = split_order(exchanges.SELL, self.order_books, '0.25')
+        self.assertEqual(routes, {
+            exchanges.KRAKEN: Route(exchanges.KRAKEN, Decimal('0.1'), Decimal('6950')),
+            exchanges.BITFINEX: Route(exchanges.BITFINEX, Decimal('0.15'), Decimal('6900')),
+        })
+
+    def test_single_exchange(self):
+        routes = split_order(exchanges.BUY, self.order_books, Decimal('0.2'))
+        self.assertEqual(list(routes), [exchanges.BITFINEX])
+
+    def test_no_market_depth(self):
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBooks to buy 2 volume'):
+            split_order(exchanges.BUY, self.order_books, Decimal('2'))
+
+    def test_invalid_amount(self):
+        with self.assertRaisesRegexp(ValueError, "Given value didn't pass provided test"):
+            split_order(exchanges.BUY, self.order_books, Decimal('-1'))
+
+
+class SmartOrderRouterTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.clients = {
+            exchanges.BITFINEX: FakeClient(OrderBook({
+                "asks": [(Decimal('7000'), Decimal('0.3')), (Decimal('7200'), Decimal('0.5'))],
+                "bids": [],
+            }), delay=0.2),
+            exchanges.KRAKEN: FakeClient(OrderBook({
+                "asks": [(Decimal('7100'), Decimal('0.1')), (Decimal('7150'), Decimal('0.2'))],
+                "bids": [],
+            }), delay=0.2),
+        }
+        self.multi_client = MultiExchangeClient(self.clients)
+        self.router = SmartOrderRouter(self.multi_client)
+
+    def tearDown(self):
+        self.multi_client.close()
+
+    def test_open_order(self):
+        start = time.time()
+        response = self.router.open_order(exchanges.BUY, Decimal('0.5'), currencies.BTC_USD)
+        elapsed = time.time() - start
+
+        self.assertTrue(response.ok)
+        self.assertEqual(self.clients[exchanges.BITFINEX].orders, [
+            (exchanges.BUY, Decimal('0.3'), currencies.BTC_USD, Decimal('7000'), exchanges.LIMIT)])
+        self.assertEqual(self.clients[exchanges.KRAKEN].orders, [
+            (exchanges.BUY, Decimal('0.2'), currencies.BTC_USD, Decimal('7150'), exchanges.LIMIT)])
+        self.assertEqual(response.results[exchanges.KRAKEN]['amount'], Decimal('0.2'))
+        # (7000 * 0.3 + 7100 * 0.1 + 7150 * 0.1) / 0.5 = 7050
+        self.assertEqual(response.average_price, Decimal('7050'))
+
+        # child orders are sent concurrently
+        self.assertEqual(set(response.timings), set(self.clients))
+        self.assertGreaterEqual(response.timings[exchanges.KRAKEN], 0.2)
+        self.assertLess(response.elapsed, 0.35)
+        self.assertLess(elapsed, 0.35)
+
+    def test_open_order_given_order_books(self):
+        order_books = {exchanges.KRAKEN: self.clients[exchanges.KRAKEN].order_book}
+        response = self.router.open_order(
+            exchanges.BUY, Decimal('0.1'), currencies.BTC_USD, order_books=order_books)
+        self.assertEqual(list(response.routes), [exchanges.KRAKEN])
+        self.assertEqual(self.clients[exchanges.BITFINEX].orders, [])
+
+    def test_open_order_partial_errors(self):
+        self.clients[exchanges.KRAKEN].error = exceptions.KrakenException('Insufficient funds')
+        response = self.router.open_order(exchanges.BUY, Decimal('0.5'), currencies.BTC_USD)
+        self.assertFalse(response.ok)
+        self.assertEqual(list(response.results), [exchanges.BITFINEX])
+        self.assertEqual(type(response.errors[exchanges.KRAKEN]), exceptions.KrakenException)
+        self.assertIn(exchanges.KRAKEN, response.timings)
+
+    def test_open_order_waits_for_slow_children(self):
+        """Child orders answering past the timeout should not be abandoned"""
+        self.clients[exchanges.KRAKEN].delay = 0.4
+        response = self.router.open_order(
+            exchanges.BUY, Decimal('0.5'), currencies.BTC_USD, timeout=0.1)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.results[exchanges.KRAKEN]['amount'], Decimal('0.2'))
+        self.assertGreaterEqual(response.timings[exchanges.KRAKEN], 0.4)
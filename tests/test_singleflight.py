@@ -0,0 +1,118 @@
+import time
+import asyncio
+import threading
+
+from tests import BaseXchangeTestCase
+from xchange.exceptions import TimeoutException
+from xchange.clients.aio.singleflight import AsyncSingleFlight
+from xchange.singleflight import SingleFlight
+
+
+class SingleFlightTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.calls = []
+
+    def slow_call(self, value):
+        self.calls.append(value)
+        time.sleep(0.1)
+        return {'value': value}
+
+    def failing_call(self):
+        self.calls.append(None)
+        time.sleep(0.1)
+        raise ValueError('Something went wrong')
+
+    def run_threads(self, target, count=5):
+        results = []
+        def worker():
+            try:
+                results.append(target())
+            except Exception as exc:
+                results.append(exc)
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_are_coalesced(self):
+        results = self.run_threads(
+            lambda: self.single_flight.do('key', self.slow_call, 1))
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_errors_are_shared(self):
+        results = self.run_threads(
+            lambda: self.single_flight.do('key', self.failing_call))
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_waiting_timeout(self):
+        leader = threading.Thread(
+            target=lambda: self.single_flight.do('key', self.slow_call, 1))
+        leader.start()
+        time.sleep(0.02)
+        with self.assertRaisesRegexp(TimeoutException,
+                                     'Coalesced call did not finish within 0.010 seconds'):
+            self.single_flight.do('key', self.slow_call, 1, timeout=0.01)
+        leader.join()
+        self.assertEqual(self.calls, [1])
+
+    def test_different_keys_are_not_coalesced(self):
+        self.single_flight.do('key-1', self.slow_call, 1)
+        self.single_flight.do('key-2', self.slow_call, 2)
+        self.single_flight.do('key-1', self.slow_call, 1)
+        self.assertEqual(self.calls, [1, 2, 1])
+
+
+class AsyncSingleFlightTestCase(BaseXchangeTestCase):
+
+    def test_concurrent_calls_are_coalesced(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow_call():
+            calls.append(None)
+            await asyncio.sleep(0.05)
+            return {'value': 1}
+
+        async def run():
+            return await asyncio.gather(
+                *[single_flight.do('key', slow_call) for _ in range(5)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(single_flight._calls, {})
+
+    def test_waiting_timeout(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow_call():
+            calls.append(None)
+            await asyncio.sleep(0.1)
+            return {'value': 1}
+
+        async def run():
+            leader = asyncio.ensure_future(single_flight.do('key', slow_call))
+            await asyncio.sleep(0)
+            with self.assertRaises(TimeoutException):
+                await single_flight.do('key', slow_call, timeout=0.01)
+            # the shared call isn't cancelled
+            return await leader
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertEqual(result, {'value': 1})
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,80 @@
+import json
+from decimal import Decimal
+
+from tests import BaseXchangeTestCase
+from xchange.streaming import OrderBookStreamParser
+from xchange.models.kraken import KrakenOrderBook
+
+
+KRAKEN_DEPTH = json.dumps({
+    'error': [],
+    'result': {
+        'XXBTZUSD': {
+            'asks': [
+                ['775.95000', '5.000', 1487274155],
+                ['776.55900', '1.000', 1487274173],
+                ['776.95300', '0.600', 1487274147],
+            ],
+            'bids': [
+                ['775.00100', '0.590', 1487274173],
+                ['775.00000', '11.183', 1487274153],
+            ],
+        },
+    },
+    'meta': {'unicode': 'café', 'float': -1.5e3, 'flags': [True, None]},
+}).encode('utf8')
+
+
+def feed_in_chunks(parser, content, chunk_size):
+    for index in range(0, len(content), chunk_size):
+        if parser.feed(content[index:index + chunk_size]):
+            return index + chunk_size
+    return len(content)
+
+
+class OrderBookStreamParserTestCase(BaseXchangeTestCase):
+
+    def test_parse(self):
+        """Should return the same document, whatever the chunks size"""
+        expected = json.loads(KRAKEN_DEPTH.decode('utf8'), parse_float=Decimal)
+        for chunk_size in (1, 2, 7, 64, 4096):
+            parser = OrderBookStreamParser()
+            feed_in_chunks(parser, KRAKEN_DEPTH, chunk_size)
+            self.assertEqual(parser.close(), expected)
+            self.assertEqual(parser.asks, expected['result']['XXBTZUSD']['asks'])
+            self.assertEqual(parser.bids, expected['result']['XXBTZUSD']['bids'])
+
+    def test_normalize_level(self):
+        parser = OrderBookStreamParser(KrakenOrderBook.normalize_level)
+        feed_in_chunks(parser, KRAKEN_DEPTH, 5)
+        parser.close()
+        self.assertEqual(parser.asks[0], (Decimal('775.95000'), Decimal('5.000')))
+        self.assertEqual(parser.bids[1], (Decimal('775.00000'), Decimal('11.183')))
+
+    def test_depth(self):
+        """Should stop consuming data once both sides reached the depth"""
+        parser = OrderBookStreamParser(KrakenOrderBook.normalize_level, depth=1)
+        consumed = feed_in_chunks(parser, KRAKEN_DEPTH, 8)
+        self.assertTrue(parser.done)
+        self.assertTrue(consumed < len(KRAKEN_DEPTH))
+        self.assertEqual(parser.close()['error'], [])
+        self.assertEqual(parser.asks, [(Decimal('775.95000'), Decimal('5.000'))])
+        self.assertEqual(parser.bids, [(Decimal('775.00100'), Decimal('0.590'))])
+
+    def test_depth_greater_than_levels(self):
+        """Should stop consuming data once both sides are closed"""
+        parser = OrderBookStreamParser(depth=10)
+        feed_in_chunks(parser, KRAKEN_DEPTH, 8)
+        self.assertTrue(parser.done)
+        self.assertNotIn('meta', parser.close())
+        self.assertEqual(len(parser.asks), 3)
+        self.assertEqual(len(parser.bids), 2)
+
+    def test_invalid_json(self):
+        for content in (b'{"asks": [[1, 2],', b'{"asks" [[1, 2]]}',
+                        b'{"asks": [[1, 2]]} []', b'{"asks": [[1, 2],]}',
+                        b'{"asks": 1.}', b''):
+            parser = OrderBookStreamParser()
+            with self.assertRaises(ValueError):
+                parser.feed(content)
+                parser.close()
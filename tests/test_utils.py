@@ -3,8 +3,37 @@ from decimal import Decimal
 from xchange import exceptions
 from tests import BaseXchangeTestCase
 from xchange.constants import exchanges
+from xchange.models.arrays import PriceLevels, array_order_book
 from xchange.models.base import OrderBook
-from xchange.utils import volume_weighted_average_price, worst_order_price
+from xchange.models.fixed import Precision, fixed_order_book
+from xchange.utils import (
+    volume_weighted_average_price, worst_order_price, vwap_curve, worst_price_curve,
+    max_amount_within_price, max_amount_within_slippage)
+
+
+ORDER_BOOK = {
+    "asks": [
+        # (price_in_btc, amount_in_btc),
+        (Decimal('9000'), Decimal('0.1')),
+        (Decimal('8000'), Decimal('0.4')),
+        (Decimal('7000'), Decimal('0.3')),
+    ],
+    "bids": [
+        # (price_in_btc, amount_in_btc),
+        (Decimal('3000'), Decimal('0.3')),
+        (Decimal('2000'), Decimal('0.4')),
+        (Decimal('1000'), Decimal('0.1')),
+    ]
+}
+
+
+def order_book_variants(json_response):
+    """The Decimal, float64 array and fixed-point order books of `json_response`"""
+    return [
+        OrderBook(json_response),
+        array_order_book(OrderBook)(json_response),
+        fixed_order_book(OrderBook, Precision('1', '0.1'))(json_response),
+    ]
 
 
 class VolumeWeightedAveragePriceTestCase(BaseXchangeTestCase):
@@ -43,6 +72,18 @@ class VolumeWeightedAveragePriceTestCase(BaseXchangeTestCase):
         # (3000 * 0.3 + 2000 * 0.2) / 0.5 = 2600
         self.assertEqual(avg_price, Decimal('2600'))
 
+    def test_volume_weighted_average_price_float_amount(self):
+        order_book = OrderBook({
+            "asks": [(Decimal('100'), Decimal('2')), (Decimal('101'), Decimal('1'))],
+            "bids": [],
+        })
+        # the first query scans the levels, the second one uses the depth index
+        for _ in range(2):
+            self.assertEqual(volume_weighted_average_price(
+                exchanges.BUY, order_book, 1.5), Decimal('100'))
+            self.assertEqual(volume_weighted_average_price(
+                exchanges.BUY, order_book, 2.5), Decimal('100.2'))
+
     def test_volume_weighted_average_price_no_market_depth(self):
         with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
                                      'Not enough depth in OrderBook to sell 2.0 volume'):
@@ -111,3 +152,141 @@ class WorstOrderPriceTestCase(BaseXchangeTestCase):
                 self.order_book,
                 Decimal('2.0')
             )
+
+
+class ArrayOrderBookUtilsTestCase(BaseXchangeTestCase):
+    """Same scenarios, running on the float64 buffers of array order books"""
+
+    def setUp(self):
+        self.order_book = array_order_book(OrderBook)(ORDER_BOOK)
+        self.assertIsInstance(self.order_book.asks, PriceLevels)
+
+    def test_volume_weighted_average_price(self):
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.BUY, self.order_book, Decimal('0.5')), Decimal('7400'))
+        self.assertEqual(volume_weighted_average_price(
+            exchanges.SELL, self.order_book, Decimal('0.5')), Decimal('2600'))
+
+    def test_whole_side(self):
+        # first query scans the buffers, the second one uses the depth index
+        for _ in range(2):
+            self.assertEqual(worst_order_price(
+                exchanges.BUY, self.order_book, Decimal('0.8')), Decimal('9000'))
+            self.assertEqual(worst_order_price(
+                exchanges.SELL, self.order_book, Decimal('0.8')), Decimal('1000'))
+            self.assertEqual(volume_weighted_average_price(
+                exchanges.SELL, self.order_book, Decimal('0.8')), Decimal('2250'))
+
+    def test_worst_order_price(self):
+        self.assertEqual(worst_order_price(
+            exchanges.BUY, self.order_book, Decimal('0.5')), Decimal('8000'))
+        self.assertEqual(worst_order_price(
+            exchanges.BUY, self.order_book, Decimal('0.3')), Decimal('7000'))
+        self.assertEqual(worst_order_price(
+            exchanges.SELL, self.order_book, Decimal('0.8')), Decimal('1000'))
+
+    def test_no_market_depth(self):
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to sell 2.0 volume'):
+            worst_order_price(exchanges.SELL, self.order_book, Decimal('2.0'))
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to buy 2.0 volume'):
+            volume_weighted_average_price(exchanges.BUY, self.order_book, Decimal('2.0'))
+
+
+class PriceCurveTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.order_books = order_book_variants(ORDER_BOOK)
+
+    def test_vwap_curve(self):
+        amounts = [Decimal('0.5'), Decimal('0.1'), Decimal('0.8'), Decimal('0.3')]
+        # exact arithmetic, float64 books differ at the last digits
+        for order_book in (self.order_books[0], self.order_books[2]):
+            self.assertEqual(
+                vwap_curve(exchanges.BUY, order_book, amounts),
+                [Decimal('7400'), Decimal('7000'), Decimal('7750'), Decimal('7000')])
+            self.assertEqual(
+                vwap_curve(exchanges.SELL, order_book, amounts),
+                [Decimal('2600'), Decimal('3000'), Decimal('2250'), Decimal('3000')])
+        for order_book in self.order_books:
+            # same results as one call per amount
+            self.assertEqual(
+                vwap_curve(exchanges.BUY, order_book, amounts),
+                [volume_weighted_average_price(exchanges.BUY, order_book, amount)
+                 for amount in amounts])
+
+    def test_worst_price_curve(self):
+        amounts = [Decimal('0.8'), Decimal('0.3'), Decimal('0.4'), Decimal('0.1')]
+        for order_book in self.order_books:
+            self.assertEqual(
+                worst_price_curve(exchanges.BUY, order_book, amounts),
+                [Decimal('9000'), Decimal('7000'), Decimal('8000'), Decimal('7000')])
+            self.assertEqual(
+                worst_price_curve(exchanges.SELL, order_book, amounts),
+                [Decimal('1000'), Decimal('3000'), Decimal('2000'), Decimal('3000')])
+
+    def test_float_amounts(self):
+        order_book = OrderBook({
+            "asks": [(Decimal('100'), Decimal('2')), (Decimal('101'), Decimal('1'))],
+            "bids": [],
+        })
+        self.assertEqual(vwap_curve(exchanges.BUY, order_book, [1.5, 2]),
+                         [Decimal('100'), Decimal('100')])
+        self.assertEqual(worst_price_curve(exchanges.BUY, order_book, [2.5, 1.5]),
+                         [Decimal('101'), Decimal('100')])
+
+    def test_empty_amounts(self):
+        self.assertEqual(vwap_curve(exchanges.BUY, self.order_books[0], []), [])
+
+    def test_no_market_depth(self):
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to buy 2.0 volume'):
+            vwap_curve(exchanges.BUY, self.order_books[0],
+                       [Decimal('0.1'), Decimal('2.0'), Decimal('0.5')])
+        with self.assertRaisesRegexp(exceptions.InsufficientMarketDepth,
+                                     'Not enough depth in OrderBook to sell 2.0 volume'):
+            worst_price_curve(exchanges.SELL, self.order_books[1], [Decimal('2.0')])
+
+
+class MaxAmountTestCase(BaseXchangeTestCase):
+
+    def setUp(self):
+        self.order_books = order_book_variants(ORDER_BOOK)
+
+    def test_max_amount_within_price(self):
+        for order_book in self.order_books:
+            for action, limit_price, amount in (
+                    (exchanges.BUY, Decimal('8000'), Decimal('0.7')),
+                    (exchanges.BUY, '7999.5', Decimal('0.3')),
+                    (exchanges.BUY, 6999, Decimal('0')),
+                    (exchanges.BUY, Decimal('10000'), Decimal('0.8')),
+                    (exchanges.SELL, Decimal('2000'), Decimal('0.7')),
+                    (exchanges.SELL, 3000.5, Decimal('0')),
+                    (exchanges.SELL, Decimal('500'), Decimal('0.8'))):
+                self.assertEqual(
+                    max_amount_within_price(action, order_book, limit_price), amount)
+
+    def test_max_amount_within_slippage(self):
+        for order_book in self.order_books:
+            # 7000 * 1.15 = 8050
+            self.assertEqual(max_amount_within_slippage(
+                exchanges.BUY, order_book, 1500), Decimal('0.7'))
+            self.assertEqual(max_amount_within_slippage(
+                exchanges.BUY, order_book, Decimal('0')), Decimal('0.3'))
+            # 3000 * 0.6 = 1800
+            self.assertEqual(max_amount_within_slippage(
+                exchanges.SELL, order_book, '4000'), Decimal('0.7'))
+
+    def test_empty_side(self):
+        order_book = OrderBook({"asks": [], "bids": []})
+        self.assertEqual(max_amount_within_price(
+            exchanges.BUY, order_book, Decimal('8000')), Decimal('0'))
+        self.assertEqual(max_amount_within_slippage(
+            exchanges.SELL, order_book, 100), Decimal('0'))
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegexp(ValueError, 'Invalid "hold" value'):
+            max_amount_within_price('hold', self.order_books[0], Decimal('8000'))
+        with self.assertRaisesRegexp(ValueError, "Given value didn't pass provided test"):
+            max_amount_within_slippage(exchanges.BUY, self.order_books[0], -5)
@@ -0,0 +1,5 @@
+from xchange.clients.aio.bitfinex import AsyncBitfinexClient
+from xchange.clients.aio.kraken import AsyncKrakenClient
+from xchange.clients.aio.okex import AsyncOkexClient
+
+__all__ = [AsyncBitfinexClient, AsyncKrakenClient, AsyncOkexClient]
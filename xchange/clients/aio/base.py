@@ -0,0 +1,155 @@
+import asyncio
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+if aiohttp is not None:
+    # errors raised before the request could reach the exchange
+    CONNECT_ERRORS = (aiohttp.ClientConnectorError, )
+    CONNECTION_ERRORS = (aiohttp.ClientConnectionError, )
+else:
+    CONNECT_ERRORS = CONNECTION_ERRORS = ()
+
+from xchange import exceptions
+from xchange.clients.base import BaseExchangeClient
+from xchange.clients.aio.singleflight import AsyncSingleFlight
+from xchange.deadline import as_deadline
+
+
+class AsyncResponse:
+    """
+    Minimal response wrapper exposing the same interface of
+    `requests.Response` used by `BaseExchangeClient._process_response`.
+    """
+
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class AsyncBaseExchangeClient(BaseExchangeClient):
+    """
+    asyncio version of `BaseExchangeClient`.
+
+    Requests are sent through a long-lived `aiohttp.ClientSession`,
+    and every endpoint method returns an awaitable. Request building,
+    payload signing and response processing are inherited from the
+    synchronous clients, so both families behave the same.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __enter__(self):
+        raise TypeError('Use "async with" for {}'.format(self.__class__.__name__))
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def _build_single_flight(self):
+        return AsyncSingleFlight()
+
+    def _build_session(self):
+        if aiohttp is None:
+            raise ImportError(
+                'aiohttp is required for async clients, install it '
+                'with: pip install xchange[async]')
+        connector = aiohttp.TCPConnector(limit=self.pool_maxsize)
+        return aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """Release all pooled connections owned by the client."""
+        session = self._session
+        if session is not None and self._owns_session:
+            self._session = None
+            await session.close()
+
+    async def _request(self, method, path, headers=None, body=None,
+                       transformation=None, model_class=None, timeout=None,
+                       deadline=None, stream=False, depth=None):
+        args = (method, path, headers, body, transformation, model_class,
+                timeout or self.timeout, as_deadline(deadline), stream, depth)
+        key = self._request_key(
+            method, path, headers, body, transformation, model_class,
+            stream, depth)
+        if key is None:
+            return await self._send_request(*args)
+        # identical requests may carry different deadlines, each caller
+        # only waits for the shared one within its own
+        deadline = args[7]
+        return await self._single_flight.do(
+            key, self._send_request, *args,
+            timeout=deadline.remaining() if deadline is not None else None)
+
+    def _client_timeout(self, timeout, deadline):
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        if aiohttp is None:
+            return timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return aiohttp.ClientTimeout(
+                total=deadline.remaining() if deadline is not None else None,
+                connect=connect_timeout,
+                sock_read=read_timeout)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def _read_stream(self, response, parser):
+        try:
+            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                if parser.feed(chunk):
+                    break
+        except ValueError as exc:
+            raise self.ERROR_CLASS(
+                'Could not decode JSON response, got: {}'.format(exc))
+        return parser
+
+    async def _send_request(self, method, path, headers=None, body=None,
+                            transformation=None, model_class=None, timeout=None,
+                            deadline=None, stream=False, depth=None):
+        attempt = 0
+        while True:
+            max_wait = deadline.remaining() if deadline is not None else None
+            wait = self.rate_limiter.reserve(path, max_wait)
+            if wait:
+                await asyncio.sleep(wait)
+            retry_after = None
+            try:
+                async with self.session.request(
+                        method, self.BASE_API_URL + path,
+                        data=body, headers=headers,
+                        timeout=self._client_timeout(timeout, deadline)) as response:
+                    if stream and response.status == 200:
+                        # the parser replaces the content, levels are
+                        # normalized while the response is downloaded
+                        content = await self._read_stream(
+                            response, self._build_stream_parser(model_class, depth))
+                    else:
+                        content = await response.read()
+                    response = AsyncResponse(
+                        response.status, content, response.headers)
+            except asyncio.TimeoutError:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise exceptions.TimeoutException()
+            except CONNECT_ERRORS:
+                if not self.retry_policy.can_retry(method, attempt, sent=False):
+                    raise
+            except CONNECTION_ERRORS:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise
+            else:
+                if not self.retry_policy.should_retry_status(
+                        method, attempt, response.status_code):
+                    break
+                retry_after = response.headers.get('Retry-After')
+            await asyncio.sleep(self._get_backoff(attempt, retry_after, deadline))
+            attempt += 1
+
+        if stream and response.status_code == 200:
+            return self._process_stream_result(response.content, model_class, depth)
+        return self._process_response(response, model_class, transformation, depth)
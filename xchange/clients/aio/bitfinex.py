@@ -0,0 +1,114 @@
+import time
+
+from xchange.constants import currencies, exchanges
+from xchange.clients.bitfinex import BitfinexClient
+from xchange.clients.aio.base import AsyncBaseExchangeClient
+from xchange.deadline import as_deadline
+from xchange.validators import is_restricted_to_values
+from xchange.models.bitfinex import (
+    BitfinexAccountBalance, BitfinexOrder, BitfinexPosition)
+
+
+class AsyncBitfinexClient(AsyncBaseExchangeClient, BitfinexClient):
+    """
+    asyncio version of `BitfinexClient`.
+
+    Endpoints that map to a single request (`get_ticker`, `get_order_book`,
+    `open_order`, `cancel_order`) are inherited as they are, since they
+    already return the awaitable built by `_get`/`_post`.
+    """
+
+    # authenticated endpoints
+
+    async def get_account_balance(self, symbol=None, **kwargs):
+        is_restricted_to_values(symbol, currencies.SYMBOLS + [None])
+
+        path = '/v1/balances'
+        payload = {
+            'request': path,
+            'nonce': str(time.time())
+        }
+        signed_payload = self._sign_payload(payload)
+        data = await self._post(path, headers=signed_payload,
+                                transformation=self._transform_account_balance,
+                                model_class=BitfinexAccountBalance, **kwargs)
+        if symbol is None:
+            return data
+        for symbol_balance in data:
+            if symbol_balance.symbol == symbol:
+                return symbol_balance
+        return self._empty_account_balance(symbol)
+
+    async def get_open_orders(self, symbol_pair, **kwargs):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        path = '/v1/orders'
+        payload = {
+            'request': path,
+            'nonce': str(time.time())
+        }
+        signed_payload = self._sign_payload(payload)
+        data = await self._post(path, headers=signed_payload,
+                                model_class=BitfinexOrder, **kwargs)
+        return self._filter_symbol_pair(data, symbol_pair)
+
+    async def cancel_all_orders(self, symbol_pair, deadline=None, **kwargs):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        # share the same deadline between both requests
+        deadline = as_deadline(deadline)
+
+        path = '/v1/order/cancel/multi'
+        orders = await self.get_open_orders(symbol_pair=symbol_pair, deadline=deadline)
+        if not orders:
+            return
+        payload = {
+            'request': path,
+            'nonce': str(time.time()),
+            'order_ids': [order.id for order in orders]
+        }
+        signed_payload = self._sign_payload(payload)
+        return await self._post(path, headers=signed_payload, deadline=deadline,
+                                **kwargs)
+
+    async def get_open_positions(self, symbol_pair, **kwargs):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        path = '/v1/positions'
+        payload = {
+            'request': path,
+            'nonce': str(time.time()),
+        }
+        signed_payload = self._sign_payload(payload)
+        positions = await self._post(path, headers=signed_payload,
+                                     model_class=BitfinexPosition, **kwargs)
+        return self._filter_symbol_pair(positions, symbol_pair)
+
+    async def close_position(self, position_id, symbol_pair, deadline=None, **kwargs):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+        positions = await self.get_open_positions(symbol_pair, deadline=deadline)
+        try:
+            pos = [pos for pos in positions if pos.id == position_id][0]
+        except IndexError:
+            raise self.ERROR_CLASS('Could not find position with '
+                                   'ID: "{}"'.format(position_id))
+
+        # as we want to close the position,
+        # we need to performe the opposite action to the given one.
+        action = exchanges.SELL if pos.action == exchanges.BUY else exchanges.BUY
+
+        return await self.open_order(
+            action, pos.amount, pos.symbol_pair, pos.price,
+            exchanges.MARKET, deadline=deadline, **kwargs)
+
+    async def close_all_positions(self, symbol_pair, deadline=None, **kwargs):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+        positions = await self.get_open_positions(
+            symbol_pair=symbol_pair, deadline=deadline)
+        for pos in positions:
+            await self.close_position(pos.id, pos.symbol_pair,
+                                      deadline=deadline, **kwargs)
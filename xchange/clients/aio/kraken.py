@@ -0,0 +1,106 @@
+import time
+
+from xchange.constants import currencies, exchanges
+from xchange.clients.kraken import KrakenClient
+from xchange.clients.aio.base import AsyncBaseExchangeClient
+from xchange.deadline import as_deadline
+from xchange.validators import is_restricted_to_values
+from xchange.models.kraken import (
+    KrakenAccountBalance, KrakenOrder, KrakenPosition)
+
+
+class AsyncKrakenClient(AsyncBaseExchangeClient, KrakenClient):
+    """
+    asyncio version of `KrakenClient`.
+
+    Endpoints that map to a single request (`get_ticker`, `get_order_book`,
+    `open_order`, `cancel_order`, `cancel_all_orders`) are inherited as
+    they are, since they already return the awaitable built by `_get`/`_post`.
+    """
+
+    # authenticated endpoints
+
+    async def get_account_balance(self, symbol=None, deadline=None):
+        is_restricted_to_values(symbol, currencies.SYMBOLS + [None])
+
+        path = '/0/private/Balance'
+        payload = {
+            'nonce': int(1000 * time.time()),
+        }
+        headers = {
+            'API-Key': self.api_key,
+            'API-Sign': self._sign_payload(path, payload)
+        }
+        data = await self._post(path, headers=headers, body=payload,
+                                transformation=self._transform_account_balance,
+                                model_class=KrakenAccountBalance, deadline=deadline)
+
+        if symbol is None:
+            return data
+        for symbol_balance in data:
+            if symbol_balance.symbol == symbol:
+                return symbol_balance
+        return self._empty_account_balance(symbol)
+
+    async def get_open_orders(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        path = '/0/private/OpenOrders'
+        payload = {
+            'nonce': int(1000 * time.time()),
+        }
+        headers = {
+            'API-Key': self.api_key,
+            'API-Sign': self._sign_payload(path, payload)
+        }
+        data = await self._post(path, headers=headers, body=payload,
+                                transformation=self._transform_open_orders,
+                                model_class=KrakenOrder, deadline=deadline)
+        return self._filter_symbol_pair(data, symbol_pair)
+
+    async def get_open_positions(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        path = '/0/private/OpenPositions'
+        payload = {
+            'nonce': int(1000 * time.time()),
+            'docalcs': True,
+        }
+        headers = {
+            'API-Key': self.api_key,
+            'API-Sign': self._sign_payload(path, payload)
+        }
+        positions = await self._post(path, headers=headers, body=payload,
+                                     transformation=self._transform_open_positions,
+                                     model_class=KrakenPosition,
+                                     deadline=deadline)
+        return self._filter_symbol_pair(positions, symbol_pair)
+
+    async def close_position(self, position_id, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        # share the same deadline between both requests
+        deadline = as_deadline(deadline)
+
+        positions = await self.get_open_positions(symbol_pair, deadline=deadline)
+        try:
+            pos = [pos for pos in positions if pos.id == position_id][0]
+        except IndexError:
+            raise self.ERROR_CLASS('Could not find position with ID: "{}"'.format(position_id))
+
+        # as we want to close the position,
+        # we need to performe the opposite action to the given one.
+        action = exchanges.SELL if pos.action == exchanges.BUY else exchanges.BUY
+
+        return await self.open_order(
+            action, pos.amount, pos.symbol_pair, pos.price, exchanges.MARKET,
+            deadline=deadline)
+
+    async def close_all_positions(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+
+        positions = await self.get_open_positions(symbol_pair=symbol_pair, deadline=deadline)
+        for pos in positions:
+            await self.close_position(pos.id, pos.symbol_pair, deadline=deadline)
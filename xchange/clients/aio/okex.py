@@ -0,0 +1,173 @@
+import time
+
+from xchange.constants import currencies, exchanges
+from xchange.clients.okex import OkexClient
+from xchange.clients.aio.base import AsyncBaseExchangeClient
+from xchange.deadline import as_deadline
+from xchange.validators import is_restricted_to_values, is_instance, passes_test
+from xchange.models.okex import OkexOrderBook, OkexAccountBalance, OkexOrder
+
+
+class AsyncOkexClient(AsyncBaseExchangeClient, OkexClient):
+    """
+    asyncio version of `OkexClient`.
+
+    Endpoints that map to a single request (`get_ticker`,
+    `get_open_positions`) are inherited as they are, since they already
+    return the awaitable built by `_get`/`_post`.
+    """
+    async def _refresh_ticker(self, symbol_pair, deadline=None):
+        """
+        Makes sure the `<symbol_pair>_ticker` cached property read by
+        `OkexClient._ticker` holds a fresh ticker, fetching it when needed.
+        """
+        attr_name = '{}_ticker'.format(self.SYMBOLS_MAPPING[symbol_pair])
+        cached = self.__dict__.get(attr_name)
+        if cached is None or time.time() - cached[1] > self.TICKER_TTL:
+            setattr(self, attr_name,
+                    await self.get_ticker(symbol_pair, deadline=deadline))
+        return getattr(self, attr_name)
+
+    # public endpoints
+
+    async def get_order_book(self, symbol_pair, stream=False, depth=None,
+                             deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+        size = self._order_book_depth(depth) or self.DEFAULT_ORDER_BOOK_DEPTH
+        ticker = await self._refresh_ticker(symbol_pair, deadline)
+        model_class = self._order_book_class(OkexOrderBook, symbol_pair)
+        symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
+        data = await self._get('/v1/future_depth.do?size={}&symbol={}&contract_type=quarter'
+                               ''.format(size, symbol_pair), stream=stream,
+                               depth=depth, deadline=deadline)
+        # class attributes are set right before building the model, so
+        # concurrent tasks requesting other symbol pairs can't interleave.
+        OkexOrderBook.TICKER = ticker
+        OkexOrderBook.SYMBOL = symbol_pair
+        OkexOrderBook.CONTRACT_UNIT_AMOUNTS = self.CONTRACT_UNIT_AMOUNTS
+        order_book = self._build_model(
+            self._get_model_class(model_class), lambda cls: cls(data))
+        if depth is not None:
+            order_book.limit_depth(depth)
+        return order_book
+
+    # authenticated endpoints
+
+    async def get_account_balance(self, symbol=None, deadline=None):
+        is_restricted_to_values(symbol, currencies.SYMBOLS + [None])
+
+        path = '/v1/future_userinfo.do'
+        params = {}
+        params['api_key'] = self.api_key
+        params['sign'] = self._sign_params(params)
+        data = await self._post(path, params=params,
+                                transformation=self._transform_account_balance,
+                                model_class=OkexAccountBalance, deadline=deadline)
+        if symbol is None:
+            return data
+        for symbol_balance in data:
+            if symbol_balance.symbol == symbol:
+                return symbol_balance
+        raise self.ERROR_CLASS('Symbol "{}" was not found in the account balance'.format(symbol))
+
+    async def get_open_orders(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        path = '/v1/future_order_info.do'
+        symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
+        params = {
+            'symbol': symbol_pair,
+            'contract_type': 'quarter',
+            'status': self.ORDER_STATUS['unfilled'],
+            'order_id': -1,  # all orders with given "status"
+            'current_page': 1,
+            'page_length': 50,
+        }
+        params['api_key'] = self.api_key
+        params['sign'] = self._sign_params(params)
+        data = await self._post(path, params=params,
+                                transformation=self._transform_open_orders,
+                                model_class=OkexOrder, deadline=deadline)
+        return self._filter_symbol_pair(data, symbol_pair)
+
+    async def open_order(self, action, amount, symbol_pair, price, order_type,
+                         amount_in_contracts=False, closing=False, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+        if not amount_in_contracts:
+            await self._refresh_ticker(symbol_pair, deadline)
+        return await super(AsyncOkexClient, self).open_order(
+            action, amount, symbol_pair, price, order_type,
+            amount_in_contracts=amount_in_contracts, closing=closing,
+            deadline=deadline)
+
+    async def cancel_order(self, order_id, deadline=None):
+        is_instance(order_id, (str, ))
+        passes_test(order_id, lambda x: int(x))
+
+        # share the same deadline between all the requests
+        deadline = as_deadline(deadline)
+
+        # NOTE: OKEX doesn't provide a way of getting all orders from any
+        #       symbol pair. We need to loop through all of them until we find it.
+        order = None
+        for symbol_pair in currencies.SYMBOL_PAIRS:
+            orders = await self.get_open_orders(
+                symbol_pair=symbol_pair, deadline=deadline)
+            orders = [order for order in orders if int(order.id) == int(order_id)]
+            if orders:
+                # found order in current symbol pair, no need to keep iterating
+                order = orders[0]
+                break
+
+        if not order:
+            raise ValueError('Could not find order with ID "{}"'.format(order_id))
+
+        path = '/v1/future_cancel.do'
+        params = {
+            'symbol': order.symbol_pair,
+            'contract_type': 'quarter',
+            'order_id': int(order_id),
+        }
+        params['api_key'] = self.api_key
+        params['sign'] = self._sign_params(params)
+        return await self._post(path, params=params, deadline=deadline)
+
+    async def cancel_all_orders(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+
+        orders = await self.get_open_orders(symbol_pair=symbol_pair, deadline=deadline)
+        if not orders:
+            return
+
+        symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
+        order_ids = ','.join([order.id for order in orders])
+        path = '/v1/future_cancel.do'
+        params = {
+            'symbol': symbol_pair,
+            'contract_type': 'quarter',
+            'order_id': order_ids,
+        }
+        params['api_key'] = self.api_key
+        params['sign'] = self._sign_params(params)
+        return await self._post(path, params=params, deadline=deadline)
+
+    async def close_all_positions(self, symbol_pair, deadline=None):
+        is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
+
+        deadline = as_deadline(deadline)
+
+        positions = await self.get_open_positions(
+            symbol_pair=symbol_pair, deadline=deadline)
+        for pos in positions:
+            # as we want to close the position,
+            # we need to performe the opposite action to the given one.
+            action = exchanges.SELL if pos.action == exchanges.BUY else exchanges.BUY
+            await self.open_order(
+                action, pos.amount, pos.symbol_pair, pos.price, exchanges.MARKET,
+                amount_in_contracts=True, closing=True, deadline=deadline)
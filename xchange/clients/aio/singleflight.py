@@ -0,0 +1,23 @@
+import asyncio
+
+from xchange.singleflight import _timeout_error
+
+
+class AsyncSingleFlight:
+    """asyncio version of `SingleFlight`, for coroutine functions."""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func, *args, timeout=None, **kwargs):
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        # shielded, so a cancelled (or timed out) waiter doesn't cancel
+        # the shared call
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise _timeout_error(timeout)
@@ -1,3 +1,6 @@
+import time
+import threading
+
 import requests
 from requests.adapters import HTTPAdapter
 from decimal import Decimal
@@ -5,19 +8,168 @@ try:
     from urllib.parse import urlencode
 except ImportError:
      from urllib import urlencode
-try:
-    from json.decoder import JSONDecodeError
-except ImportError:
-    JSONDecodeError = ValueError
 
 from .. import exceptions
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..singleflight import SingleFlight
+from ..deadline import as_deadline
+from ..json_backends import get_loads
+from ..streaming import OrderBookStreamParser
+from ..validators import is_instance, passes_test
+from ..models.compact import compact_model
+from ..models.lazy import lazy_model
+from ..models.arrays import array_order_book
+from ..models.fixed import Precision, FixedPointOrderBook, fixed_order_book
+from ..models.columnar import ModelColumns, columns_class
+from ..models.base import OrderBook
 
 
 class BaseExchangeClient:
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 3
+    DEFAULT_READ_TIMEOUT = 3
+    # rate limits, as `xchange.ratelimit.RateLimiter` arguments:
+    # bucket_name -> (capacity, refill_rate in tokens per second)
+    RATE_LIMIT_BUCKETS = {}
+    # (path_prefix, bucket_name, cost)
+    RATE_LIMIT_ENDPOINTS = ()
+    RATE_LIMIT_MAX_WAIT = 30
+    # identical concurrent requests using these methods share one HTTP call
+    COALESCED_METHODS = ('GET', )
+    # bytes read at once from streamed responses
+    STREAM_CHUNK_SIZE = 16 * 1024
+    # max number of levels per side served by the order book endpoint,
+    # None when the exchange doesn't document a limit
+    ORDER_BOOK_MAX_DEPTH = None
+    # tick and lot sizes of each symbol pair, used by fixed-point order
+    # books. Missing pairs, and books with prices off the tick size, use
+    # DEFAULT_PRECISION, which is exact for any value with up to 8 decimal
+    # places.
+    PRECISIONS = {}
+    DEFAULT_PRECISION = Precision(tick_size='0.00000001', lot_size='0.00000001')
 
-    def __init__(self, api_key, api_secret):
+    def __init__(self, api_key, api_secret, session=None,
+                 pool_connections=None, pool_maxsize=None, max_retries=0,
+                 rate_limiter=None, retry_policy=None, coalesce_requests=True,
+                 connect_timeout=None, read_timeout=None, json_backend=None,
+                 compact_models=False, lazy_models=False,
+                 array_order_books=False, fixed_point=False,
+                 columnar_results=False):
+        """
+        :session:
+            optional `requests.Session` to be shared between several clients.
+            When provided, the client doesn't own it and `close()` won't
+            close it.
+        :pool_connections:
+            number of connection pools (one per host) to keep cached.
+        :pool_maxsize:
+            max number of keep-alive connections saved in each pool.
+        :max_retries:
+            number of retries for failed requests. Only idempotent
+            requests are retried once they may have reached the exchange,
+            see `xchange.retry.RetryPolicy`.
+        :rate_limiter:
+            optional `xchange.ratelimit.RateLimiter` instance. Pass the
+            same instance to every client sharing an API key. By default
+            each client builds its own from the class rate limits.
+        :retry_policy:
+            optional `xchange.retry.RetryPolicy` instance, overriding
+            `max_retries`.
+        :coalesce_requests:
+            (True|False) Whether concurrent identical GET requests share
+            a single HTTP call and parsed result.
+        :connect_timeout:
+            seconds to wait for the connection to the exchange.
+        :read_timeout:
+            seconds to wait for the exchange response, once connected.
+        :json_backend:
+            `xchange.json_backends.JSON_BACKENDS` choice used to decode
+            responses. Defaults to the standard library parsing numbers
+            straight into Decimal objects.
+        :compact_models:
+            (True|False) Whether to return `__slots__` based models (see
+            `xchange.models.compact`) instead of `dict` subclasses.
+        :lazy_models:
+            (True|False) Whether to return compact models converting each
+            field on first access (see `xchange.models.lazy`). Only cheaper
+            when most fields are never read.
+        :array_order_books:
+            (True|False) Whether order book sides are stored in float64
+            buffers (see `xchange.models.arrays.PriceLevels`).
+        :fixed_point:
+            (True|False) Whether order book sides are stored as int64
+            buffers scaled by the symbol pair precision (see
+            `xchange.models.fixed.FixedPriceLevels`).
+        :columnar_results:
+            (True|False) Whether list endpoints (balances, orders and
+            positions) return `xchange.models.columnar.ModelColumns`
+            instead of lists of models.
+        """
         self.api_key = api_key
         self.api_secret = api_secret
+        self.pool_connections = pool_connections or self.DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.DEFAULT_POOL_MAXSIZE
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self._owns_session = session is None
+        self._session = session
+        self._session_lock = threading.Lock()
+        self.rate_limiter = rate_limiter or self.build_rate_limiter()
+        self.coalesce_requests = coalesce_requests
+        self._single_flight = self._build_single_flight()
+        self.timeout = (connect_timeout or self.DEFAULT_CONNECT_TIMEOUT,
+                        read_timeout or self.DEFAULT_READ_TIMEOUT)
+        self.json_loads = get_loads(json_backend)
+        self.compact_models = compact_models
+        self.lazy_models = lazy_models
+        self.array_order_books = array_order_books
+        self.fixed_point = fixed_point
+        self.columnar_results = columnar_results
+
+    @classmethod
+    def build_rate_limiter(cls, max_wait=None):
+        return RateLimiter(
+            buckets=cls.RATE_LIMIT_BUCKETS,
+            endpoints=cls.RATE_LIMIT_ENDPOINTS,
+            max_wait=max_wait or cls.RATE_LIMIT_MAX_WAIT)
+
+    def _build_single_flight(self):
+        return SingleFlight()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def session(self):
+        """
+        Long-lived HTTP session, so consecutive requests to the same host
+        reuse already opened (keep-alive) TCP/TLS connections.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self):
+        """Release all pooled connections owned by the client."""
+        with self._session_lock:
+            if self._session is not None and self._owns_session:
+                self._session.close()
+                self._session = None
 
     def _get(self, path, headers=None, params=None,
              transformation=None, model_class=None, **kwargs):
@@ -46,9 +198,73 @@ class BaseExchangeClient:
             transformation=transformation, **kwargs
         )
 
+    def _order_book_depth(self, depth):
+        """
+        Validates the requested order book `depth` and returns the number
+        of levels to ask the exchange for. Depths the exchange can't serve
+        are enforced client-side, once the response is received.
+        """
+        if depth is None:
+            return None
+        is_instance(depth, int)
+        passes_test(depth, lambda x: x > 0)
+        if self.ORDER_BOOK_MAX_DEPTH is not None:
+            return min(depth, self.ORDER_BOOK_MAX_DEPTH)
+        return depth
+
+    def _request_key(self, method, path, headers, body,
+                     transformation, model_class, stream=False, depth=None):
+        """
+        Returns the key identifying identical requests, or None when
+        the request must not be coalesced.
+        """
+        if not self.coalesce_requests or method not in self.COALESCED_METHODS:
+            return None
+        headers = tuple(sorted(headers.items())) if headers else None
+        return (method, path, headers, body, transformation, model_class,
+                stream, depth)
+
     def _request(self, method, path, headers=None, body=None,
-                 transformation=None, model_class=None, timeout=3,
-                 max_retries=0):
+                 transformation=None, model_class=None, timeout=None,
+                 deadline=None, stream=False, depth=None):
+        """
+        :timeout:
+            number or `(connect_timeout, read_timeout)` tuple, defaults
+            to the client timeouts.
+        :deadline:
+            `xchange.deadline.Deadline` instance (or seconds from now)
+            bounding the request, including retries and rate limiting.
+        :stream:
+            (True|False) Whether to parse the order book response
+            incrementally while it's downloaded, see
+            `xchange.streaming.OrderBookStreamParser`.
+        :depth:
+            max number of levels per side kept from order book responses.
+        """
+        args = (method, path, headers, body, transformation, model_class,
+                timeout or self.timeout, as_deadline(deadline), stream, depth)
+        key = self._request_key(
+            method, path, headers, body, transformation, model_class,
+            stream, depth)
+        if key is None:
+            return self._send_request(*args)
+        # identical requests may carry different deadlines, each caller
+        # only waits for the shared one within its own
+        deadline = args[7]
+        return self._single_flight.do(
+            key, self._send_request, *args,
+            timeout=deadline.remaining() if deadline is not None else None)
+
+    def _get_backoff(self, attempt, retry_after, deadline):
+        backoff = self.retry_policy.get_backoff(attempt, retry_after)
+        if deadline is not None and backoff >= deadline.remaining():
+            raise exceptions.TimeoutException(
+                'Deadline of {} seconds exceeded'.format(deadline.timeout))
+        return backoff
+
+    def _send_request(self, method, path, headers=None, body=None,
+                      transformation=None, model_class=None, timeout=None,
+                      deadline=None, stream=False, depth=None):
         request = requests.Request(
             method=method,
             url=self.BASE_API_URL + path,
@@ -56,23 +272,140 @@ class BaseExchangeClient:
         if headers:
             request.headers.update(headers)
 
-        session = requests.Session()
-        if max_retries:
-            adapter = HTTPAdapter(max_retries=max_retries)
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)
+        prepared_request = request.prepare()
 
-        try:
-            response = session.send(
-                request.prepare(),
-                timeout=timeout)
-        except requests.exceptions.ConnectTimeout:
-            raise exceptions.TimeoutException()
+        attempt = 0
+        while True:
+            max_wait = deadline.remaining() if deadline is not None else None
+            self.rate_limiter.acquire(path, max_wait)
+            request_timeout = deadline.cap(timeout) if deadline is not None else timeout
+            retry_after = None
+            try:
+                response = self.session.send(
+                    prepared_request, timeout=request_timeout, stream=stream)
+            except requests.exceptions.ConnectTimeout:
+                # the request never reached the exchange
+                if not self.retry_policy.can_retry(method, attempt, sent=False):
+                    raise exceptions.TimeoutException()
+            except requests.exceptions.ReadTimeout:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise exceptions.TimeoutException()
+            except requests.exceptions.ConnectionError:
+                if not self.retry_policy.can_retry(method, attempt):
+                    raise
+            else:
+                if not self.retry_policy.should_retry_status(
+                        method, attempt, response.status_code):
+                    break
+                retry_after = response.headers.get('Retry-After')
+                # release the connection of the discarded response
+                response.close()
+            time.sleep(self._get_backoff(attempt, retry_after, deadline))
+            attempt += 1
 
+        if stream:
+            return self._process_stream(response, model_class, depth, deadline)
         return self._process_response(
-            response, model_class, transformation)
+            response, model_class, transformation, depth)
+
+    def _order_book_class(self, model_class, symbol_pair):
+        """
+        Returns the order book class for the given `symbol_pair`, fixed-point
+        order books depend on its precision.
+        """
+        if self.fixed_point:
+            precision = self.PRECISIONS.get(symbol_pair, self.DEFAULT_PRECISION)
+            return fixed_order_book(model_class, precision)
+        return model_class
+
+    def _build_model(self, model_class, build):
+        """
+        Returns `build(model_class)`. Fixed-point order books with prices off
+        the tick size of their symbol pair are built with `DEFAULT_PRECISION`
+        instead, and `ERROR_CLASS` is raised if they don't fit either.
+        """
+        if not issubclass(model_class, FixedPointOrderBook):
+            return build(model_class)
+        try:
+            return build(model_class)
+        except ValueError as exc:
+            if model_class.precision != self.DEFAULT_PRECISION:
+                return self._build_model(fixed_order_book(
+                    model_class._model_class, self.DEFAULT_PRECISION), build)
+            raise self.ERROR_CLASS(
+                'Order book does not fit {!r}: {}'.format(model_class.precision, exc))
+
+    def _get_model_class(self, model_class):
+        """Returns the variant of `model_class` built by the client."""
+        if issubclass(model_class, FixedPointOrderBook):
+            # already built for a single symbol pair
+            return model_class
+        if self.array_order_books and issubclass(model_class, OrderBook):
+            return array_order_book(model_class)
+        if self.lazy_models:
+            return lazy_model(model_class)
+        if self.compact_models:
+            return compact_model(model_class)
+        return model_class
+
+    def _check_response_data(self, data):
+        if isinstance(data, dict):
+            # some APIs return 200 status code, but include the error
+            # detail as part of the response payload
+            if (data.get('error') or
+                    data.get('error_code') or
+                    ('result' in data and data['result'] == False)):
+                raise self.ERROR_CLASS(data)
+
+    def _build_stream_parser(self, model_class=None, depth=None):
+        normalize_level = model_class.level_normalizer() if model_class else None
+        return OrderBookStreamParser(normalize_level, depth)
+
+    def _process_stream_result(self, parser, model_class=None, depth=None):
+        try:
+            data = parser.close()
+        except ValueError as exc:
+            raise self.ERROR_CLASS(
+                'Could not decode JSON response, got: {}'.format(exc))
+
+        self._check_response_data(data)
+
+        # when model_class is not provided, return the raw response data
+        if not model_class:
+            return data
+        levels = {'asks': parser.asks, 'bids': parser.bids}
+        data = self._build_model(
+            self._get_model_class(model_class),
+            lambda cls: cls.from_normalized(levels))
+        if depth is not None:
+            data.limit_depth(depth)
+        return data
+
+    def _process_stream(self, response, model_class=None, depth=None,
+                        deadline=None):
+        """
+        Builds the order book while the response is downloaded, closing
+        the connection as soon as `depth` levels per side were read.
+        """
+        if response.status_code != requests.status_codes.codes.ok:
+            return self._process_response(response, model_class)
 
-    def _process_response(self, response, model_class=None, transformation=None):
+        parser = self._build_stream_parser(model_class, depth)
+        try:
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                if parser.feed(chunk):
+                    break
+                if deadline is not None:
+                    deadline.check()
+        except ValueError as exc:
+            raise self.ERROR_CLASS(
+                'Could not decode JSON response, got: {}'.format(exc))
+        finally:
+            response.close()
+        return self._process_stream_result(parser, model_class, depth)
+
+    def _process_response(self, response, model_class=None, transformation=None,
+                          depth=None):
         # check for error-related status codes
         if response.status_code != requests.status_codes.codes.ok:
             raise self.ERROR_CLASS(
@@ -86,18 +419,12 @@ class BaseExchangeClient:
 
         # make sure it's a JSON valid response
         try:
-            data = response.json()
-        except JSONDecodeError as exc:
+            data = self.json_loads(response.content)
+        except ValueError as exc:
             raise self.ERROR_CLASS(
                 'Could not decode JSON response, got: {}'.format(exc))
 
-        if isinstance(data, dict):
-            # some APIs return 200 status code, but include the error
-            # detail as part of the response payload
-            if (data.get('error') or
-                    data.get('error_code') or
-                    ('result' in data and data['result'] == False)):
-                raise self.ERROR_CLASS(data)
+        self._check_response_data(data)
 
         # if a transformation function was provided, replace the original
         # JSON response with the result of the transformation function
@@ -109,12 +436,25 @@ class BaseExchangeClient:
             return data
 
         # create model instances using the response JSON data
-        if isinstance(data, list):
-            data = list(map(model_class, data))
+        if isinstance(data, list) and self.columnar_results:
+            data = columns_class(model_class).from_responses(model_class, data)
+        elif isinstance(data, list):
+            data = list(map(self._get_model_class(model_class), data))
         else:
-            data = model_class(data)
+            data = self._build_model(
+                self._get_model_class(model_class), lambda cls: cls(data))
+
+        # order books deeper than requested are truncated client-side
+        if depth is not None:
+            data.limit_depth(depth)
         return data
 
+    def _filter_symbol_pair(self, data, symbol_pair):
+        """Keeps the models of `data` belonging to `symbol_pair`."""
+        if isinstance(data, ModelColumns):
+            return data.where(symbol_pair=symbol_pair)
+        return [model for model in data if model['symbol_pair'] == symbol_pair]
+
     def _empty_account_balance(self, symbol):
         return {'symbol': symbol, 'amount': Decimal('0')}
 
@@ -123,7 +463,7 @@ class BaseExchangeClient:
     def get_ticker(self, symbol_pair, **kwargs):
         raise NotImplementedError
 
-    def get_order_book(self, symbol_pair, **kwargs):
+    def get_order_book(self, symbol_pair, stream=False, depth=None, **kwargs):
         raise NotImplementedError
 
     # authenticated endpoints
@@ -8,6 +8,7 @@ from decimal import Decimal
 from xchange import exceptions
 from xchange.constants import currencies, exchanges
 from xchange.clients.base import BaseExchangeClient
+from xchange.deadline import as_deadline
 from xchange.validators import is_restricted_to_values, is_instance, passes_test
 from xchange.models.bitfinex import (
     BitfinexOrderBook, BitfinexAccountBalance, BitfinexOrder, BitfinexTicker,
@@ -27,6 +28,25 @@ class BitfinexClient(BaseExchangeClient):
         currencies.EOS_USD: 'eosusd',
         currencies.BTG_USD: 'btgusd',
     }
+    # v1 limits are set per endpoint, in requests per minute
+    RATE_LIMIT_BUCKETS = {
+        'ticker': (30, 30 / 60.),
+        'book': (30, 30 / 60.),
+        'balances': (20, 20 / 60.),
+        'orders': (90, 90 / 60.),
+        'order_new': (90, 90 / 60.),
+        'order_cancel': (90, 90 / 60.),
+        'positions': (20, 20 / 60.),
+    }
+    RATE_LIMIT_ENDPOINTS = (
+        ('/v1/pubticker/', 'ticker', 1),
+        ('/v1/book/', 'book', 1),
+        ('/v1/balances', 'balances', 1),
+        ('/v1/orders', 'orders', 1),
+        ('/v1/order/new', 'order_new', 1),
+        ('/v1/order/cancel', 'order_cancel', 1),
+        ('/v1/positions', 'positions', 1),
+    )
 
     def _sign_payload(self, payload):
         payload_dump = json.dumps(payload)
@@ -64,12 +84,18 @@ class BitfinexClient(BaseExchangeClient):
         return self._get('/v1/pubticker/{}'.format(symbol_pair),
                          model_class=BitfinexTicker, **kwargs)
 
-    def get_order_book(self, symbol_pair, **kwargs):
+    def get_order_book(self, symbol_pair, stream=False, depth=None, **kwargs):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
+        model_class = self._order_book_class(BitfinexOrderBook, symbol_pair)
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
-        return self._get('/v1/book/{}'.format(symbol_pair),
-                         model_class=BitfinexOrderBook, **kwargs)
+        params = {}
+        limit = self._order_book_depth(depth)
+        if limit is not None:
+            params = {'limit_bids': limit, 'limit_asks': limit}
+        return self._get('/v1/book/{}'.format(symbol_pair), params=params,
+                         model_class=model_class, stream=stream,
+                         depth=depth, **kwargs)
 
     # authenticated endpoints
 
@@ -103,8 +129,7 @@ class BitfinexClient(BaseExchangeClient):
         signed_payload = self._sign_payload(payload)
         data = self._post(path, headers=signed_payload,
                           model_class=BitfinexOrder, **kwargs)
-        return [order for order in data
-                if order['symbol_pair'] == symbol_pair]
+        return self._filter_symbol_pair(data, symbol_pair)
 
     def open_order(self, action, amount, symbol_pair,
                    price, order_type, **kwargs):
@@ -161,11 +186,14 @@ class BitfinexClient(BaseExchangeClient):
         signed_payload = self._sign_payload(payload)
         return self._post(path, headers=signed_payload, **kwargs)
 
-    def cancel_all_orders(self, symbol_pair, **kwargs):
+    def cancel_all_orders(self, symbol_pair, deadline=None, **kwargs):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
+        # share the same deadline between both requests
+        deadline = as_deadline(deadline)
+
         path = '/v1/order/cancel/multi'
-        orders = self.get_open_orders(symbol_pair=symbol_pair)
+        orders = self.get_open_orders(symbol_pair=symbol_pair, deadline=deadline)
         if not orders:
             return
         payload = {
@@ -174,7 +202,7 @@ class BitfinexClient(BaseExchangeClient):
             'order_ids': [order.id for order in orders]
         }
         signed_payload = self._sign_payload(payload)
-        return self._post(path, headers=signed_payload, **kwargs)
+        return self._post(path, headers=signed_payload, deadline=deadline, **kwargs)
 
     def get_open_positions(self, symbol_pair, **kwargs):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
@@ -187,13 +215,13 @@ class BitfinexClient(BaseExchangeClient):
         signed_payload = self._sign_payload(payload)
         positions = self._post(path, headers=signed_payload,
                                model_class=BitfinexPosition, **kwargs)
-        return [pos for pos in positions
-                if pos['symbol_pair'] == symbol_pair]
+        return self._filter_symbol_pair(positions, symbol_pair)
 
-    def close_position(self, position_id, symbol_pair, **kwargs):
+    def close_position(self, position_id, symbol_pair, deadline=None, **kwargs):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        positions = self.get_open_positions(symbol_pair)
+        deadline = as_deadline(deadline)
+        positions = self.get_open_positions(symbol_pair, deadline=deadline)
         try:
             pos = [pos for pos in positions if pos.id == position_id][0]
         except IndexError:
@@ -206,11 +234,12 @@ class BitfinexClient(BaseExchangeClient):
 
         return self.open_order(
             action, pos.amount, pos.symbol_pair, pos.price,
-            exchanges.MARKET, **kwargs)
+            exchanges.MARKET, deadline=deadline, **kwargs)
 
-    def close_all_positions(self, symbol_pair, **kwargs):
+    def close_all_positions(self, symbol_pair, deadline=None, **kwargs):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        positions = self.get_open_positions(symbol_pair=symbol_pair)
+        deadline = as_deadline(deadline)
+        positions = self.get_open_positions(symbol_pair=symbol_pair, deadline=deadline)
         for pos in positions:
-            self.close_position(pos.id, pos.symbol_pair, **kwargs)
+            self.close_position(pos.id, pos.symbol_pair, deadline=deadline, **kwargs)
@@ -11,6 +11,8 @@ except ImportError:
 from xchange import exceptions
 from xchange.constants import exchanges, currencies
 from xchange.clients.base import BaseExchangeClient
+from xchange.deadline import as_deadline
+from xchange.models.fixed import Precision
 from xchange.validators import is_restricted_to_values, is_instance, passes_test
 from xchange.models.kraken import (
     KrakenOrderBook, KrakenAccountBalance, KrakenOrder, KrakenTicker,
@@ -31,6 +33,31 @@ class KrakenClient(BaseExchangeClient):
         currencies.XRP_USD: 'XRPUSD',
         currencies.EOS_USD: 'EOSUSD',
     }
+    # private calls increase a counter (max 15) which decays 0.33 per
+    # second on starter accounts. Public calls are limited to ~1 per second.
+    RATE_LIMIT_BUCKETS = {
+        'public': (1, 1),
+        'private': (15, 0.33),
+    }
+    RATE_LIMIT_ENDPOINTS = (
+        ('/0/public/', 'public', 1),
+        # order placement and cancellation are limited by the
+        # trading engine, they don't increase the call counter
+        ('/0/private/AddOrder', 'private', 0),
+        ('/0/private/CancelOrder', 'private', 0),
+        ('/0/private/', 'private', 1),
+    )
+    ORDER_BOOK_MAX_DEPTH = 500
+    # price decimals of each pair, volumes use 8 decimals
+    PRECISIONS = {
+        currencies.BTC_USD: Precision(tick_size='0.1', lot_size='0.00000001'),
+        currencies.ETH_USD: Precision(tick_size='0.01', lot_size='0.00000001'),
+        currencies.ETC_USD: Precision(tick_size='0.001', lot_size='0.00000001'),
+        currencies.LTC_USD: Precision(tick_size='0.01', lot_size='0.00000001'),
+        currencies.BCH_USD: Precision(tick_size='0.1', lot_size='0.00000001'),
+        currencies.XRP_USD: Precision(tick_size='0.00001', lot_size='0.00000001'),
+        currencies.EOS_USD: Precision(tick_size='0.0001', lot_size='0.00000001'),
+    }
 
     def _sign_payload(self, urlpath, payload):
         postdata = urlencode(payload)
@@ -171,26 +198,31 @@ class KrakenClient(BaseExchangeClient):
 
     # public endpoints
 
-    def get_ticker(self, symbol_pair):
+    def get_ticker(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
         params = {'pair': symbol_pair}
         return self._get('/0/public/Ticker', params=params,
                          transformation=self._transform_ticker,
-                         model_class=KrakenTicker)
+                         model_class=KrakenTicker, deadline=deadline)
 
-    def get_order_book(self, symbol_pair):
+    def get_order_book(self, symbol_pair, stream=False, depth=None, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
+        model_class = self._order_book_class(KrakenOrderBook, symbol_pair)
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
         params = {'pair': symbol_pair}
+        limit = self._order_book_depth(depth)
+        if limit is not None:
+            params['count'] = limit
         return self._get('/0/public/Depth', params=params,
-                         model_class=KrakenOrderBook)
+                         model_class=model_class, stream=stream,
+                         depth=depth, deadline=deadline)
 
     # authenticated endpoints
 
-    def get_account_balance(self, symbol=None):
+    def get_account_balance(self, symbol=None, deadline=None):
         is_restricted_to_values(symbol, currencies.SYMBOLS + [None])
 
         path = '/0/private/Balance'
@@ -203,7 +235,7 @@ class KrakenClient(BaseExchangeClient):
         }
         data = self._post(path, headers=headers, body=payload,
                           transformation=self._transform_account_balance,
-                          model_class=KrakenAccountBalance)
+                          model_class=KrakenAccountBalance, deadline=deadline)
 
         if symbol is None:
             return data
@@ -212,7 +244,7 @@ class KrakenClient(BaseExchangeClient):
                 return symbol_balance
         return self._empty_account_balance(symbol)
 
-    def get_open_orders(self, symbol_pair):
+    def get_open_orders(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         path = '/0/private/OpenOrders'
@@ -225,11 +257,11 @@ class KrakenClient(BaseExchangeClient):
         }
         data = self._post(path, headers=headers, body=payload,
                           transformation=self._transform_open_orders,
-                          model_class=KrakenOrder)
-        return [order for order in data
-                if order['symbol_pair'] == symbol_pair]
+                          model_class=KrakenOrder, deadline=deadline)
+        return self._filter_symbol_pair(data, symbol_pair)
 
-    def open_order(self, action, amount, symbol_pair, price, order_type):
+    def open_order(self, action, amount, symbol_pair, price, order_type,
+                   deadline=None):
         """
         Creates a new Order.
 
@@ -243,6 +275,8 @@ class KrakenClient(BaseExchangeClient):
             Decimal, float, integer or string representing number value.
         :order_type:
             exchanges.ORDER_TYPES choice
+        :deadline:
+            `xchange.deadline.Deadline` (or seconds) bounding the request
         """
         # validate arguments
         is_restricted_to_values(action, exchanges.ACTIONS)
@@ -276,9 +310,9 @@ class KrakenClient(BaseExchangeClient):
         }
         return self._post(path, headers=headers, body=payload,
                           transformation=self._transform_new_order,
-                          model_class=KrakenOrder)
+                          model_class=KrakenOrder, deadline=deadline)
 
-    def cancel_order(self, order_id):
+    def cancel_order(self, order_id, deadline=None):
         path = '/0/private/CancelOrder'
         payload = {
             'nonce': int(1000 * time.time()),
@@ -288,9 +322,9 @@ class KrakenClient(BaseExchangeClient):
             'API-Key': self.api_key,
             'API-Sign': self._sign_payload(path, payload)
         }
-        return self._post(path, headers=headers, body=payload)
+        return self._post(path, headers=headers, body=payload, deadline=deadline)
 
-    def cancel_all_orders(self, symbol_pair):
+    def cancel_all_orders(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         path = '/0/private/CancelOrder'
@@ -302,9 +336,9 @@ class KrakenClient(BaseExchangeClient):
             'API-Key': self.api_key,
             'API-Sign': self._sign_payload(path, payload)
         }
-        return self._post(path, headers=headers, body=payload)
+        return self._post(path, headers=headers, body=payload, deadline=deadline)
 
-    def get_open_positions(self, symbol_pair):
+    def get_open_positions(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         path = '/0/private/OpenPositions'
@@ -318,14 +352,16 @@ class KrakenClient(BaseExchangeClient):
         }
         positions = self._post(path, headers=headers, body=payload,
                                transformation=self._transform_open_positions,
-                               model_class=KrakenPosition)
-        return [pos for pos in positions
-                if pos['symbol_pair'] == symbol_pair]
+                               model_class=KrakenPosition, deadline=deadline)
+        return self._filter_symbol_pair(positions, symbol_pair)
 
-    def close_position(self, position_id, symbol_pair):
+    def close_position(self, position_id, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        positions = self.get_open_positions(symbol_pair)
+        # share the same deadline between both requests
+        deadline = as_deadline(deadline)
+
+        positions = self.get_open_positions(symbol_pair, deadline=deadline)
         try:
             pos = [pos for pos in positions if pos.id == position_id][0]
         except IndexError:
@@ -336,11 +372,14 @@ class KrakenClient(BaseExchangeClient):
         action = exchanges.SELL if pos.action == exchanges.BUY else exchanges.BUY
 
         return self.open_order(
-            action, pos.amount, pos.symbol_pair, pos.price, exchanges.MARKET)
+            action, pos.amount, pos.symbol_pair, pos.price, exchanges.MARKET,
+            deadline=deadline)
 
-    def close_all_positions(self, symbol_pair):
+    def close_all_positions(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        positions = self.get_open_positions(symbol_pair=symbol_pair)
+        deadline = as_deadline(deadline)
+
+        positions = self.get_open_positions(symbol_pair=symbol_pair, deadline=deadline)
         for pos in positions:
-            self.close_position(pos.id, pos.symbol_pair)
+            self.close_position(pos.id, pos.symbol_pair, deadline=deadline)
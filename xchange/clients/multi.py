@@ -0,0 +1,170 @@
+import time
+from concurrent import futures
+
+from xchange import exceptions
+from xchange.deadline import Deadline
+from xchange.factories import ExchangeClientFactory
+
+
+class MultiExchangeResponse:
+    """
+    Partial results of a request sent to several exchanges.
+
+    :results:
+        dict mapping each exchange name to the value returned by its client.
+    :errors:
+        dict mapping each exchange name to the exception raised by its
+        client, or `exceptions.TimeoutException` when the exchange didn't
+        answer within the deadline.
+    :timings:
+        dict mapping each exchange name that answered (or failed) to the
+        seconds its request took.
+    """
+
+    def __init__(self, results=None, errors=None, timings=None):
+        self.results = results or {}
+        self.errors = errors or {}
+        self.timings = timings or {}
+
+    def __repr__(self):
+        return '{}(results={!r}, errors={!r})'.format(
+            self.__class__.__name__, self.results, self.errors)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+class MultiExchangeClient:
+    """
+    Facade sending the same request to several exchange clients
+    concurrently, so the total latency is bound by the slowest exchange
+    (or the given deadline) instead of the sum of all of them.
+    """
+    DEFAULT_TIMEOUT = 5
+    # threads per exchange, calls of a slow exchange still running past
+    # the deadline only delay later requests to that same exchange
+    WORKERS_PER_EXCHANGE = 2
+
+    def __init__(self, clients, timeout=None):
+        """
+        :clients:
+            dict mapping exchange names to client instances. They are still
+            owned by the caller, `close()` won't close them.
+        :timeout:
+            default deadline (in seconds) for each fan-out request.
+        """
+        self.clients = dict(clients)
+        # exchange names of the clients built by `from_credentials`
+        self._owned_clients = set()
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self._executors = {
+            exchange_name: futures.ThreadPoolExecutor(
+                max_workers=self.WORKERS_PER_EXCHANGE)
+            for exchange_name in self.clients
+        }
+
+    @classmethod
+    def from_credentials(cls, credentials, **kwargs):
+        """
+        Creates clients for every exchange in `credentials` through
+        `ExchangeClientFactory`.
+
+        :credentials:
+            dict mapping exchange names to client constructor kwargs,
+            ie: {exchanges.KRAKEN: {'api_key': '...', 'api_secret': '...'}}
+        """
+        clients = {
+            exchange_name: ExchangeClientFactory.get_client(exchange_name)(**client_kwargs)
+            for exchange_name, client_kwargs in credentials.items()
+        }
+        multi_client = cls(clients, **kwargs)
+        multi_client._owned_clients.update(clients)
+        return multi_client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stops the executors, and closes the clients built by `from_credentials`."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        for exchange_name in self._owned_clients:
+            self.clients[exchange_name].close()
+
+    def request(self, method_name, *args, **kwargs):
+        """
+        Calls `method_name` with the given arguments on every client,
+        waiting at most `timeout` seconds (passed as keyword argument)
+        for all of them to answer.
+        """
+        timeout = kwargs.pop('timeout', None)
+        return self.request_each({
+            exchange_name: (method_name, args, kwargs) for exchange_name in self.clients
+        }, timeout=timeout)
+
+    @staticmethod
+    def _timed(timings, exchange_name, func, args, kwargs):
+        start = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[exchange_name] = time.time() - start
+
+    def request_each(self, requests, timeout=None, wait_pending=False):
+        """
+        Sends a different request to each client concurrently, waiting at
+        most `timeout` seconds for all of them to answer. Each client call
+        gets a `xchange.deadline.Deadline` of `timeout` seconds (unless its
+        kwargs set one), so it stops on its own once it's not awaited.
+
+        :requests:
+            dict mapping exchange names to `(method_name, args, kwargs)`.
+        :wait_pending:
+            (True|False) Whether requests not answered within `timeout` are
+            still waited for instead of being reported as timed out, ie: for
+            non-idempotent requests whose outcome must be known.
+        """
+        timeout = timeout or self.timeout
+        deadline = time.time() + timeout
+
+        response = MultiExchangeResponse()
+        timings = {}
+        pending = {}
+        for exchange_name, (method_name, args, kwargs) in requests.items():
+            kwargs = dict(kwargs)
+            kwargs.setdefault('deadline', Deadline(timeout))
+            future = self._executors[exchange_name].submit(
+                self._timed, timings, exchange_name,
+                getattr(self.clients[exchange_name], method_name), args, kwargs)
+            pending[future] = exchange_name
+        try:
+            for future in futures.as_completed(
+                    pending, timeout=None if wait_pending else deadline - time.time()):
+                exchange_name = pending.pop(future)
+                try:
+                    response.results[exchange_name] = future.result()
+                except Exception as exc:
+                    response.errors[exchange_name] = exc
+        except futures.TimeoutError:
+            # the remaining exchanges didn't answer on time, keep
+            # the partial results and report them as timed out.
+            for future, exchange_name in pending.items():
+                future.cancel()
+                response.errors[exchange_name] = exceptions.TimeoutException(
+                    '{} did not answer within {} seconds'.format(exchange_name, timeout))
+        # requests still running past the deadline are left out
+        response.timings = dict(timings)
+        return response
+
+    # public endpoints
+
+    def get_ticker(self, symbol_pair, timeout=None):
+        return self.request('get_ticker', symbol_pair, timeout=timeout)
+
+    def get_order_book(self, symbol_pair, depth=None, timeout=None):
+        return self.request('get_order_book', symbol_pair, depth=depth,
+                            timeout=timeout)
@@ -1,3 +1,4 @@
+import time
 import logging
 import hashlib
 from decimal import Decimal
@@ -7,6 +8,8 @@ from cached_property import cached_property_with_ttl
 from xchange import exceptions
 from xchange.constants import currencies, exchanges
 from xchange.clients.base import BaseExchangeClient
+from xchange.deadline import as_deadline
+from xchange.models.fixed import Precision
 from xchange.models.base import crypto_to_contracts
 from xchange.validators import is_restricted_to_values, is_instance, passes_test
 from xchange.models.okex import (
@@ -26,6 +29,23 @@ class OkexClient(BaseExchangeClient):
         currencies.EOS_USD: 'eos_usd',
         currencies.BTG_USD: 'btg_usd',
     }
+    # 20 requests every 2 seconds
+    RATE_LIMIT_BUCKETS = {
+        'public': (20, 10),
+        'private': (20, 10),
+    }
+    RATE_LIMIT_ENDPOINTS = (
+        ('/v1/future_ticker.do', 'public', 1),
+        ('/v1/future_depth.do', 'public', 1),
+        ('/v1/', 'private', 1),
+    )
+    ORDER_BOOK_MAX_DEPTH = 200
+    DEFAULT_ORDER_BOOK_DEPTH = 100
+    # quarter contracts tick sizes. Amounts converted from contracts are
+    # rounded down to satoshis.
+    PRECISIONS = {
+        currencies.BTC_USD: Precision(tick_size='0.01', lot_size='0.00000001'),
+    }
     ORDER_STATUS = {
         'unfilled': 1,
         'filled': 2
@@ -46,6 +66,8 @@ class OkexClient(BaseExchangeClient):
         'eos_usd': 10,
         'btg_usd': 10,
     }
+    # seconds the tickers used to convert amounts to contracts are cached
+    TICKER_TTL = 60
 
     def _sign_params(self, params):
         sign = ''
@@ -149,28 +171,45 @@ class OkexClient(BaseExchangeClient):
             })
         return positions
 
+    def _ticker(self, symbol_pair, deadline=None):
+        """
+        Returns the ticker cached in the `<symbol_pair>_ticker` property,
+        fetching it within `deadline` when it's missing or stale.
+        """
+        attr_name = '{}_ticker'.format(self.SYMBOLS_MAPPING[symbol_pair])
+        cached = self.__dict__.get(attr_name)
+        if cached is None or time.time() - cached[1] > self.TICKER_TTL:
+            setattr(self, attr_name, self.get_ticker(symbol_pair, deadline=deadline))
+        return getattr(self, attr_name)
+
     # public endpoints
 
-    def get_ticker(self, symbol_pair):
+    def get_ticker(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
         return self._get('/v1/future_ticker.do?symbol={}&contract_type=quarter'
-                         ''.format(symbol_pair), model_class=OkexTicker)
+                         ''.format(symbol_pair), model_class=OkexTicker,
+                         deadline=deadline)
 
-    def get_order_book(self, symbol_pair):
+    def get_order_book(self, symbol_pair, stream=False, depth=None, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
+        deadline = as_deadline(deadline)
+        model_class = self._order_book_class(OkexOrderBook, symbol_pair)
+        ticker = self._ticker(symbol_pair, deadline)
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
-        OkexOrderBook.TICKER = getattr(self, '{}_ticker'.format(symbol_pair))
+        size = self._order_book_depth(depth) or self.DEFAULT_ORDER_BOOK_DEPTH
+        OkexOrderBook.TICKER = ticker
         OkexOrderBook.SYMBOL = symbol_pair
         OkexOrderBook.CONTRACT_UNIT_AMOUNTS = self.CONTRACT_UNIT_AMOUNTS
-        return self._get('/v1/future_depth.do?size=100&symbol={}&contract_type=quarter'
-                         ''.format(symbol_pair), model_class=OkexOrderBook)
+        return self._get('/v1/future_depth.do?size={}&symbol={}&contract_type=quarter'
+                         ''.format(size, symbol_pair), model_class=model_class,
+                         stream=stream, depth=depth, deadline=deadline)
 
     # authenticated endpoints
 
-    def get_account_balance(self, symbol=None):
+    def get_account_balance(self, symbol=None, deadline=None):
         is_restricted_to_values(symbol, currencies.SYMBOLS + [None])
 
         path = '/v1/future_userinfo.do'
@@ -179,7 +218,7 @@ class OkexClient(BaseExchangeClient):
         params['sign'] = self._sign_params(params)
         data = self._post(path, params=params,
                           transformation=self._transform_account_balance,
-                          model_class=OkexAccountBalance)
+                          model_class=OkexAccountBalance, deadline=deadline)
         if symbol is None:
             return data
         for symbol_balance in data:
@@ -187,7 +226,7 @@ class OkexClient(BaseExchangeClient):
                 return symbol_balance
         raise self.ERROR_CLASS('Symbol "{}" was not found in the account balance'.format(symbol))
 
-    def get_open_orders(self, symbol_pair):
+    def get_open_orders(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         path = '/v1/future_order_info.do'
@@ -204,12 +243,11 @@ class OkexClient(BaseExchangeClient):
         params['sign'] = self._sign_params(params)
         data = self._post(path, params=params,
                           transformation=self._transform_open_orders,
-                          model_class=OkexOrder)
-        return [order for order in data
-                if order['symbol_pair'] == symbol_pair]
+                          model_class=OkexOrder, deadline=deadline)
+        return self._filter_symbol_pair(data, symbol_pair)
 
     def open_order(self, action, amount, symbol_pair, price, order_type,
-                   amount_in_contracts=False, closing=False):
+                   amount_in_contracts=False, closing=False, deadline=None):
         """
         Creates a new Order.
 
@@ -229,6 +267,8 @@ class OkexClient(BaseExchangeClient):
             (True|False) Whether the `amount`  argument is expressed in cryptos or contracts
         :closing:
             (True|False) Whether the order we are opening is to close an existing position or not
+        :deadline:
+            `xchange.deadline.Deadline` (or seconds) bounding the request
         """
         # validate arguments
         is_restricted_to_values(action, exchanges.ACTIONS)
@@ -248,6 +288,14 @@ class OkexClient(BaseExchangeClient):
         is_instance(amount_in_contracts, bool)
         is_instance(closing, bool)
 
+        # share the same deadline between the ticker and the order requests
+        deadline = as_deadline(deadline)
+        if not amount_in_contracts:
+            amount = crypto_to_contracts(
+                amount,
+                self._ticker(symbol_pair, deadline).last,
+                self.CONTRACT_UNIT_AMOUNTS[self.SYMBOLS_MAPPING[symbol_pair]])
+
         path = '/v1/future_trade.do'
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
         if closing:
@@ -259,12 +307,6 @@ class OkexClient(BaseExchangeClient):
                       if action == exchanges.SELL
                       else self.ACTION['open_long'])
 
-        if not amount_in_contracts:
-            amount = crypto_to_contracts(
-                amount,
-                getattr(self, '{}_ticker'.format(symbol_pair)).last,
-                self.CONTRACT_UNIT_AMOUNTS[symbol_pair])
-
         match_price = 1 if order_type == 'market' else 0
         params = {
             'symbol': symbol_pair,
@@ -277,17 +319,21 @@ class OkexClient(BaseExchangeClient):
         }
         params['api_key'] = self.api_key
         params['sign'] = self._sign_params(params)
-        return self._post(path, params=params, model_class=OkexOrder)
+        return self._post(path, params=params, model_class=OkexOrder,
+                          deadline=deadline)
 
-    def cancel_order(self, order_id):
+    def cancel_order(self, order_id, deadline=None):
         is_instance(order_id, (str, ))
         passes_test(order_id, lambda x: int(x))
 
+        # share the same deadline between all the requests
+        deadline = as_deadline(deadline)
+
         # NOTE: OKEX doesn't provide a way of getting all orders from any
         #       symbol pair. We need to loop through all of them until we find it.
         order = None
         for symbol_pair in currencies.SYMBOL_PAIRS:
-            orders = self.get_open_orders(symbol_pair=symbol_pair)
+            orders = self.get_open_orders(symbol_pair=symbol_pair, deadline=deadline)
             orders = [order for order in orders if int(order.id) == int(order_id)]
             if orders:
                 # found order in current symbol pair, no need to keep iterating
@@ -305,12 +351,14 @@ class OkexClient(BaseExchangeClient):
         }
         params['api_key'] = self.api_key
         params['sign'] = self._sign_params(params)
-        return self._post(path, params=params)
+        return self._post(path, params=params, deadline=deadline)
 
-    def cancel_all_orders(self, symbol_pair):
+    def cancel_all_orders(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        orders = self.get_open_orders(symbol_pair=symbol_pair)
+        deadline = as_deadline(deadline)
+
+        orders = self.get_open_orders(symbol_pair=symbol_pair, deadline=deadline)
         if not orders:
             return
 
@@ -324,9 +372,9 @@ class OkexClient(BaseExchangeClient):
         }
         params['api_key'] = self.api_key
         params['sign'] = self._sign_params(params)
-        return self._post(path, params=params)
+        return self._post(path, params=params, deadline=deadline)
 
-    def get_open_positions(self, symbol_pair):
+    def get_open_positions(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
         symbol_pair = self.SYMBOLS_MAPPING[symbol_pair]
@@ -339,22 +387,24 @@ class OkexClient(BaseExchangeClient):
         params['sign'] = self._sign_params(params)
         return self._post(path, params=params,
                           transformation=self._transform_open_positions,
-                          model_class=OkexPosition)
+                          model_class=OkexPosition, deadline=deadline)
 
-    def close_position(self, position_id, symbol_pair):
+    def close_position(self, position_id, symbol_pair, deadline=None):
         raise NotImplementedError('OKEX API does not support position IDs')
 
-    def close_all_positions(self, symbol_pair):
+    def close_all_positions(self, symbol_pair, deadline=None):
         is_restricted_to_values(symbol_pair, currencies.SYMBOL_PAIRS)
 
-        positions = self.get_open_positions(symbol_pair=symbol_pair)
+        deadline = as_deadline(deadline)
+
+        positions = self.get_open_positions(symbol_pair=symbol_pair, deadline=deadline)
         for pos in positions:
             # as we want to close the position,
             # we need to performe the opposite action to the given one.
             action = exchanges.SELL if pos.action == exchanges.BUY else exchanges.BUY
             self.open_order(
                 action, pos.amount, pos.symbol_pair, pos.price, exchanges.MARKET,
-                amount_in_contracts=True, closing=True)
+                amount_in_contracts=True, closing=True, deadline=deadline)
 
 
 # OkexClient.btc_usd_ticker = cached_property_with_ttl(ttl=60)(lambda self: self.get_ticker(currencies.BTC_USD))
@@ -362,4 +412,4 @@ for symbol_pair in OkexClient.SYMBOLS_MAPPING:
     attr_name = '{}_ticker'.format(symbol_pair)
     fun = lambda self: self.get_ticker(symbol_pair)
     fun.__name__ = attr_name
-    setattr(OkexClient, attr_name, cached_property_with_ttl(ttl=60)(fun))
+    setattr(OkexClient, attr_name, cached_property_with_ttl(ttl=OkexClient.TICKER_TTL)(fun))
@@ -0,0 +1,55 @@
+import time
+
+from xchange import exceptions
+
+
+class Deadline:
+    """
+    End-to-end time budget, shared by every request sent on behalf of a
+    composite operation (ie: fetching open orders and then cancelling
+    them), so the whole operation finishes or fails within `timeout`
+    seconds.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def __repr__(self):
+        return '{}(remaining={:.3f})'.format(
+            self.__class__.__name__, self.remaining())
+
+    def remaining(self):
+        """Seconds left before the deadline expires."""
+        return max(self.expires_at - time.monotonic(), 0)
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raises `exceptions.TimeoutException` once the deadline expired."""
+        if self.expired:
+            raise exceptions.TimeoutException(
+                'Deadline of {} seconds exceeded'.format(self.timeout))
+
+    def cap(self, timeout):
+        """
+        Bounds a request `timeout` to the remaining budget. `timeout` is
+        either a number or a `(connect_timeout, read_timeout)` tuple.
+        """
+        self.check()
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(min(value, remaining) for value in timeout)
+        return min(timeout, remaining)
+
+
+def as_deadline(value):
+    """
+    Returns a `Deadline` for `value`, which is either a `Deadline`
+    instance, a number of seconds from now, or None (no deadline).
+    """
+    if value is None or isinstance(value, Deadline):
+        return value
+    return Deadline(value)
@@ -39,6 +39,10 @@ class TimeoutException(BaseXchangeException):
     pass
 
 
+class RateLimitException(BaseXchangeException):
+    pass
+
+
 # exchange exceptions
 class BitfinexException(BaseXchangeException):
     pass
@@ -19,3 +19,17 @@ class ExchangeClientFactory:
             '{}Client'.format(exchange_name.title())
         )
         return ClientClass
+
+    @classmethod
+    def get_async_client(self, exchange_name):
+        if not exchange_name in exchanges.EXCHANGES:
+            raise NotImplementedError(
+                'Client for exchange "{}" is not implemented'.format(exchange_name))
+
+        namespace = 'xchange.clients.aio.{}'.format(exchange_name)
+        clients_module = importlib.import_module(namespace)
+        ClientClass = getattr(
+            clients_module,
+            'Async{}Client'.format(exchange_name.title())
+        )
+        return ClientClass
@@ -0,0 +1,62 @@
+import json
+from decimal import Decimal
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+# exact: JSON numbers with decimals are parsed straight into Decimal objects
+DECIMAL = 'decimal'
+# standard library, numbers with decimals are parsed into floats
+STDLIB = 'json'
+# faster third-party parsers, numbers with decimals are parsed into floats
+ORJSON = 'orjson'
+UJSON = 'ujson'
+
+JSON_BACKENDS = [
+    DECIMAL,
+    STDLIB,
+    ORJSON,
+    UJSON,
+]
+DEFAULT_JSON_BACKEND = DECIMAL
+
+
+def _decimal_loads(content):
+    if isinstance(content, bytes):
+        content = content.decode('utf8')
+    return json.loads(content, parse_float=Decimal)
+
+
+def _stdlib_loads(content):
+    if isinstance(content, bytes):
+        content = content.decode('utf8')
+    return json.loads(content)
+
+
+def get_loads(backend=None):
+    """
+    Returns the function used to decode JSON responses for the given
+    `backend` (one of JSON_BACKENDS), which must raise `ValueError`
+    on invalid content.
+    """
+    backend = backend or DEFAULT_JSON_BACKEND
+    if backend == DECIMAL:
+        return _decimal_loads
+    if backend == STDLIB:
+        return _stdlib_loads
+    if backend == ORJSON:
+        if orjson is None:
+            raise ImportError('orjson JSON backend is not installed')
+        return orjson.loads
+    if backend == UJSON:
+        if ujson is None:
+            raise ImportError('ujson JSON backend is not installed')
+        return ujson.loads
+    raise ValueError('Invalid "{}" JSON backend, expected any of: {}'
+                     ''.format(backend, JSON_BACKENDS))
@@ -0,0 +1,119 @@
+from array import array
+from decimal import Decimal
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from xchange.models.utils import class_variant
+
+
+def to_decimal(value):
+    """
+    Converts a float64 value back to Decimal through its shortest
+    representation, which is exact for values of up to 15 significant
+    digits (ie: any price or amount sent by the exchanges as string).
+    """
+    return Decimal(repr(value))
+
+
+class PriceLevels:
+    """
+    Order book side stored as two contiguous float64 buffers, using
+    16 bytes per level instead of a list of `(Decimal, Decimal)` tuples.
+
+    It behaves as a read-only sequence of `(price, amount)` Decimal tuples,
+    so code written for list based order books keeps working, while
+    `xchange.utils` functions run directly on the `prices` and `amounts`
+    buffers.
+    """
+    __slots__ = ('prices', 'amounts')
+    TYPECODE = 'd'
+    NUMPY_DTYPE = 'float64'
+
+    def __init__(self, prices=None, amounts=None):
+        self.prices = prices if prices is not None else array(self.TYPECODE)
+        self.amounts = amounts if amounts is not None else array(self.TYPECODE)
+
+    @classmethod
+    def from_levels(cls, levels):
+        """Builds the buffers out of `(price, amount)` tuples."""
+        return cls(array(cls.TYPECODE, [float(level[0]) for level in levels]),
+                   array(cls.TYPECODE, [float(level[1]) for level in levels]))
+
+    def __len__(self):
+        return len(self.prices)
+
+    def _level(self, price, amount):
+        """Converts the buffer values of a level to a Decimal tuple."""
+        return (to_decimal(price), to_decimal(amount))
+
+    def _copy(self, prices, amounts):
+        return self.__class__(prices, amounts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._copy(self.prices[index], self.amounts[index])
+        return self._level(self.prices[index], self.amounts[index])
+
+    def __iter__(self):
+        for price, amount in zip(self.prices, self.amounts):
+            yield self._level(price, amount)
+
+    def __reversed__(self):
+        for index in range(len(self.prices) - 1, -1, -1):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, PriceLevels):
+            return (type(self) is type(other) and
+                    self.__getstate__() == other.__getstate__())
+        if isinstance(other, (list, tuple)):
+            return list(self) == [tuple(level) for level in other]
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, list(self))
+
+    def _array(self, buffer):
+        # buffers loaded by `xchange.models.serialization` are memoryviews
+        return buffer if isinstance(buffer, array) else array(self.TYPECODE, buffer)
+
+    def __getstate__(self):
+        return (self._array(self.prices), self._array(self.amounts))
+
+    def __setstate__(self, state):
+        self.prices, self.amounts = state
+
+    def as_numpy(self):
+        """
+        Returns `(prices, amounts)` NumPy arrays sharing the memory
+        of the buffers (no copy).
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required for PriceLevels.as_numpy()')
+        return (numpy.frombuffer(self.prices, dtype=self.NUMPY_DTYPE),
+                numpy.frombuffer(self.amounts, dtype=self.NUMPY_DTYPE))
+
+
+@class_variant
+def array_order_book(model_class):
+    """
+    Returns the version of the given `OrderBook` subclass storing both
+    sides as `PriceLevels`.
+    """
+    schema = dict(model_class.schema)
+    for side in ('asks', 'bids'):
+        schema[side] = (lambda levels, sort=schema[side]:
+                        PriceLevels.from_levels(sort(levels)))
+    return type('Array{}'.format(model_class.__name__), (model_class, ), {
+        '__doc__': model_class.__doc__,
+        '_model_class': model_class,
+        'schema': schema,
+    })
@@ -1,19 +1,26 @@
+from operator import itemgetter
+
 from xchange import exceptions
 from xchange.constants import currencies
 from xchange.models.utils import (
     as_decimal, sorted_list, restricted_to_values,
     normalized_symbol, normalized_symbol_pair,
-    contracts_to_crypto, crypto_to_contracts
+    contracts_to_crypto, contracts_to_crypto_factor, crypto_to_contracts
 )
+from xchange.models.compiler import get_constructor
+from xchange.models.depth import DepthIndex, build_depth_index
 
 
 class BaseExchangeModel(dict):
     schema = {}
+    # declarative alternative to `normalize_response`, mapping each field
+    # to the key, path (tuple of keys) or function reading its value
+    # from the original response.
+    response_fields = None
 
     def __init__(self, json_response):
-        super(BaseExchangeModel, self).__init__()
-        parsed_response = self.normalize_response(json_response)
-        self.assign_dynamic_attributes(parsed_response)
+        # the dict is already empty, `dict.__init__` isn't needed
+        get_constructor(self.__class__)(self, json_response)
 
     def __getattr__(self, key):
         try:
@@ -23,9 +30,30 @@ class BaseExchangeModel(dict):
                 'Object {} has not attribute "{}"'
                 ''.format(self.__class__.__name__, key))
 
+    @classmethod
+    def from_normalized(cls, parsed_response):
+        """
+        Builds the model out of an already normalized response, ie: the
+        order book levels collected by `xchange.streaming.OrderBookStreamParser`.
+        """
+        model = cls.__new__(cls)
+        model.assign_dynamic_attributes(parsed_response)
+        return model
+
     def normalize_response(self, json_response):
-        """As this is the base class, don't perform any transformation"""
-        return json_response
+        """As this is the base class, only apply `response_fields`"""
+        if self.response_fields is None:
+            return json_response
+        parsed_response = {}
+        for field, source in self.response_fields.items():
+            if callable(source):
+                value = source(json_response)
+            else:
+                value = json_response
+                for key in (source if isinstance(source, tuple) else (source, )):
+                    value = value[key]
+            parsed_response[field] = value
+        return parsed_response
 
     def assign_dynamic_attributes(self, parsed_response):
         """
@@ -60,8 +88,8 @@ class OrderBook(BaseExchangeModel):
     {
         "asks": [
             # (price_in_btc, amount_in_btc),
-            (Decimal('4630.12300'), Decimal('0.014')),
             (Decimal('4620.23450'), Decimal('0.456')),
+            (Decimal('4630.12300'), Decimal('0.014')),
         ],
         "bids": [
             # (price_in_btc, amount_in_btc),
@@ -69,12 +97,73 @@ class OrderBook(BaseExchangeModel):
             (Decimal('4600.78952'), Decimal('0.125')),
         ]
     }
+
+    Both sides are sorted best level first: asks by ascending price and
+    bids by descending price.
     """
     schema = {
-        'asks': sorted_list(key=lambda l: l[0], sorting_type='desc'),
-        'bids': sorted_list(key=lambda l: l[0], sorting_type='desc'),
+        'asks': sorted_list(key=itemgetter(0), sorting_type='asc'),
+        'bids': sorted_list(key=itemgetter(0), sorting_type='desc'),
     }
 
+    @classmethod
+    def normalize_level(cls, level):
+        """
+        Transforms a single level of the original response into
+        a `(price, amount)` tuple.
+        """
+        return (as_decimal(level[0]), as_decimal(level[1]))
+
+    @classmethod
+    def level_normalizer(cls):
+        """
+        Returns the function normalizing the levels of a single book,
+        where state shared by all its levels can be computed once.
+        """
+        return cls.normalize_level
+
+    def limit_depth(self, depth):
+        """Keeps only the best `depth` levels of each side."""
+        self['asks'] = self['asks'][:depth]
+        self['bids'] = self['bids'][:depth]
+
+    def depth_index(self, side, build=True):
+        """
+        Returns the `xchange.models.depth.DepthIndex` (cumulative volume
+        and notional) of the 'asks' or 'bids' side, built on first use and
+        cached until the side is replaced (ie: by `limit_depth`). Sides
+        are not expected to be mutated in place.
+
+        :build:
+            (True|False) With False, the index is built only if the side was
+            already queried since it was set, None is returned otherwise.
+            One-off queries are cheaper as a single scan of the levels.
+        """
+        levels = self[side]
+        # compact and lazy variants have no instance dict, nothing is cached
+        cache = getattr(self, '__dict__', None)
+        if cache is None:
+            return build_depth_index(levels) if build else None
+        indexes = cache.setdefault('_depth_indexes', {})
+        index = indexes.get(side)
+        if isinstance(index, DepthIndex):
+            if index.levels is levels and len(index.volumes) == len(levels):
+                return index
+        elif index is levels:
+            # the side was queried once already
+            build = True
+        if not build:
+            indexes[side] = levels
+            return None
+        index = indexes[side] = build_depth_index(levels)
+        return index
+
+    def __getstate__(self):
+        # the depth indexes are rebuilt on demand
+        state = dict(self.__dict__)
+        state.pop('_depth_indexes', None)
+        return state
+
 
 class AccountBalance(BaseExchangeModel):
     schema = {
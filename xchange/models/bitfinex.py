@@ -16,15 +16,14 @@ class BitfinexTicker(Ticker):
      'mid': '3780.15',
      'timestamp': '1506170236.287525866'}
     """
-    def normalize_response(self, json_response):
-        return {
-            'ask': json_response['ask'],
-            'bid': json_response['bid'],
-            'low': json_response['low'],
-            'high': json_response['high'],
-            'last': json_response['last_price'],
-            'volume': json_response['volume'],
-        }
+    response_fields = {
+        'ask': 'ask',
+        'bid': 'bid',
+        'low': 'low',
+        'high': 'high',
+        'last': 'last_price',
+        'volume': 'volume',
+    }
 
 
 class BitfinexAccountBalance(AccountBalance):
@@ -37,11 +36,10 @@ class BitfinexAccountBalance(AccountBalance):
         'type': 'deposit'
     },
     """
-    def normalize_response(self, json_response):
-        return {
-            'symbol': json_response['currency'],
-            'amount': json_response['available']
-        }
+    response_fields = {
+        'symbol': 'currency',
+        'amount': 'available',
+    }
 
 
 class BitfinexOrderBook(OrderBook):
@@ -63,12 +61,15 @@ class BitfinexOrderBook(OrderBook):
     }
     """
 
+    @classmethod
+    def normalize_level(cls, level):
+        return (Decimal(level['price']), Decimal(level['amount']))
+
     def normalize_response(self, json_response):
+        normalize_level = self.level_normalizer()
         return {
-            'asks': [(Decimal(doc['price']), Decimal(doc['amount']))
-                     for doc in json_response['asks']],
-            'bids': [(Decimal(doc['price']), Decimal(doc['amount']))
-                     for doc in json_response['bids']],
+            'asks': [normalize_level(doc) for doc in json_response['asks']],
+            'bids': [normalize_level(doc) for doc in json_response['bids']],
         }
 
 
@@ -96,16 +97,15 @@ class BitfinexOrder(Order):
       'type': 'limit',
       'was_forced': False}
     """
-    def normalize_response(self, json_response):
-        return {
-            'id': json_response['id'],
-            'action': json_response['side'],
-            'amount': json_response['original_amount'],
-            'price': json_response['price'],
-            'symbol_pair': json_response['symbol'],
-            'type': json_response['type'],
-            'status': 'open' if json_response['is_live'] else 'closed'
-        }
+    response_fields = {
+        'id': 'id',
+        'action': 'side',
+        'amount': 'original_amount',
+        'price': 'price',
+        'symbol_pair': 'symbol',
+        'type': 'type',
+        'status': lambda doc: 'open' if doc['is_live'] else 'closed',
+    }
 
 
 class BitfinexPosition(Position):
@@ -120,16 +120,11 @@ class BitfinexPosition(Position):
      'symbol': u'btcusd',
      'timestamp': u'1503264460.0'}]
     """
-    def normalize_response(self, json_response):
-        if Decimal(json_response['amount']) > 0:
-            action = 'buy'
-        else:
-            action = 'sell'
-        return {
-            'id': json_response['id'],
-            'action': action,
-            'amount': abs(Decimal(json_response['amount'])),
-            'price': json_response['base'],
-            'symbol_pair': json_response['symbol'],
-            'profit_loss': json_response['pl'],
-        }
+    response_fields = {
+        'id': 'id',
+        'action': lambda doc: 'buy' if Decimal(doc['amount']) > 0 else 'sell',
+        'amount': lambda doc: abs(Decimal(doc['amount'])),
+        'price': 'base',
+        'symbol_pair': 'symbol',
+        'profit_loss': 'pl',
+    }
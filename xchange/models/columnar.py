@@ -0,0 +1,168 @@
+import operator
+from itertools import compress, repeat
+
+from xchange.models.base import AccountBalance, Order, Position
+from xchange.models.compiler import get_extractor
+
+
+class _Unset:
+    """Marks the fields missing in a response row."""
+
+    def __repr__(self):
+        return 'UNSET'
+
+    def __reduce__(self):
+        return 'UNSET'
+
+
+UNSET = _Unset()
+
+
+class ModelColumns:
+    """
+    Columnar alternative to lists of models. Each field of `model_class`
+    is stored as a list of values converted by the schema, exactly as the
+    model would (`UNSET` for fields missing in the response), built in a
+    single pass over the response rows.
+
+    Rows are materialized as `model_class` instances only when read, and
+    filters are computed column-wise, ie:
+
+    >>> orders.where(symbol_pair=currencies.BTC_USD)
+    """
+
+    def __init__(self, model_class, columns, length):
+        self.model_class = model_class
+        self.columns = columns
+        self._length = length
+
+    @classmethod
+    def from_responses(cls, model_class, json_responses):
+        """Builds the columns out of the original response rows."""
+        schema = model_class.schema
+        fields = frozenset(schema)
+        columns = {field: [] for field in schema}
+        appenders = [(field, columns[field].append, func)
+                     for field, func in schema.items()]
+        normalize = get_extractor(model_class)
+        if normalize is None:
+            normalize = model_class.__new__(model_class).normalize_response
+
+        length = 0
+        for json_response in json_responses:
+            parsed_response = normalize(json_response)
+            if not fields.issuperset(parsed_response):
+                for field in parsed_response:
+                    if field not in fields:
+                        raise ValueError(
+                            'Unknown field "{}" for class {}'
+                            ''.format(field, model_class.__name__))
+            for field, append, func in appenders:
+                value = parsed_response.get(field, UNSET)
+                append(UNSET if value is UNSET else func(value))
+            length += 1
+        return cls(model_class, columns, length)
+
+    def __len__(self):
+        return self._length
+
+    def row(self, index):
+        """Returns the `model_class` instance of the row at `index`."""
+        model = self.model_class.__new__(self.model_class)
+        for field, column in self.columns.items():
+            value = column[index]
+            if value is not UNSET:
+                model[field] = value
+        return model
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self.columns[index]
+        if isinstance(index, slice):
+            return self.__class__(
+                self.model_class,
+                {field: column[index] for field, column in self.columns.items()},
+                len(range(*index.indices(self._length))))
+        return self.row(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.row(index)
+
+    def mask(self, **values):
+        """
+        Returns the list of booleans telling which rows have all the given
+        field values. Each column is compared in a single `map()` call,
+        still one Python comparison per row: columns hold Decimals and
+        strings, so there is no typed array to vectorize on.
+        """
+        mask = None
+        for field, value in values.items():
+            field_mask = list(map(operator.eq, self.columns[field], repeat(value)))
+            mask = field_mask if mask is None else list(map(operator.and_, mask, field_mask))
+        return mask if mask is not None else [True] * self._length
+
+    def compress(self, mask):
+        """Returns the rows selected by the boolean `mask`."""
+        return self.__class__(
+            self.model_class,
+            {field: list(compress(column, mask)) for field, column in self.columns.items()},
+            sum(mask))
+
+    def where(self, **values):
+        """Returns the rows having all the given field values."""
+        return self.compress(self.mask(**values))
+
+    def to_list(self):
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, ModelColumns):
+            return (self.model_class is other.model_class and
+                    self.columns == other.columns)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.to_list())
+
+
+class OrderList(ModelColumns):
+    """Columnar list of `Order` models."""
+
+
+class PositionList(ModelColumns):
+    """Columnar list of `Position` models."""
+
+
+class BalanceSheet(ModelColumns):
+    """Columnar list of `AccountBalance` models."""
+
+    def balance(self, symbol):
+        """Returns the balance of `symbol`, or None if it's not listed."""
+        try:
+            return self.row(self.columns['symbol'].index(symbol))
+        except ValueError:
+            return None
+
+
+COLUMNS_CLASSES = (
+    (Order, OrderList),
+    (Position, PositionList),
+    (AccountBalance, BalanceSheet),
+)
+
+
+def columns_class(model_class):
+    """Returns the columnar result class for lists of `model_class`."""
+    for base_class, result_class in COLUMNS_CLASSES:
+        if issubclass(model_class, base_class):
+            return result_class
+    return ModelColumns
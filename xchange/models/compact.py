@@ -0,0 +1,129 @@
+import types
+
+from xchange.models.compiler import get_constructor
+from xchange.models.utils import class_variant
+
+
+class CompactExchangeModel:
+    """
+    Compact alternative to the `dict` based models. Fields are stored in
+    `__slots__`, so instances don't carry a dict and attribute access is
+    a plain attribute lookup.
+
+    Instances are still usable as read-mostly mappings: `model['field']`,
+    `keys()`, `items()`, `dict(model)` and equality against dicts work
+    as for the regular models.
+
+    Classes are built out of regular models with `compact_model()`, which
+    reuses their `schema`, `response_fields` and `normalize_response`.
+    """
+    __slots__ = ()
+    _model_class = None
+    _fields = ()
+    schema = {}
+
+    def __init__(self, json_response):
+        get_constructor(self._model_class, attributes=True)(self, json_response)
+
+    def __getattr__(self, key):
+        # class attributes and methods of the original model
+        # (ie: OkexOrder.ORDER_TYPE), unset fields end up here as well
+        if not key.startswith('__') and key not in self._fields:
+            try:
+                value = getattr(self._model_class, key)
+            except AttributeError:
+                pass
+            else:
+                if isinstance(value, types.FunctionType):
+                    return types.MethodType(value, self)
+                return value
+        raise AttributeError(
+            'Object {} has not attribute "{}"'
+            ''.format(self.__class__.__name__, key))
+
+    @classmethod
+    def from_normalized(cls, parsed_response):
+        model = cls.__new__(cls)
+        model.assign_dynamic_attributes(parsed_response)
+        return model
+
+    def assign_dynamic_attributes(self, parsed_response):
+        for field, value in parsed_response.items():
+            func = self.schema.get(field)
+            if not func:
+                raise ValueError(
+                    'Unknown field "{}" for class {}'
+                    ''.format(field, self._model_class.__name__))
+            setattr(self, field, func(value))
+
+    # mapping interface
+
+    def _has_field(self, key):
+        return hasattr(self, key)
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._fields and self._has_field(key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        return [key for key in self._fields if self._has_field(key)]
+
+    def values(self):
+        return [getattr(self, key) for key in self.keys()]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, CompactExchangeModel)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.to_dict())
+
+
+@class_variant
+def compact_model(model_class):
+    """
+    Returns the compact (`__slots__` based) version of the given
+    `BaseExchangeModel` subclass.
+    """
+    return type('Compact{}'.format(model_class.__name__), (CompactExchangeModel, ), {
+        '__slots__': tuple(model_class.schema),
+        '_fields': tuple(model_class.schema),
+        '__doc__': model_class.__doc__,
+        '_model_class': model_class,
+        'schema': model_class.schema,
+        'normalize_response': model_class.normalize_response,
+    })
@@ -0,0 +1,130 @@
+"""
+Per-class model constructors.
+
+The generic construction path normalizes the response into an
+intermediate dict, then looks up the formatting function of each field
+in the model `schema`. Instead, the first time a model class is
+instantiated, a constructor specialized for its schema is generated, so
+each field costs a single conversion call and assignment.
+
+Models declaring `response_fields` go further: values are read straight
+from the original response, without building the intermediate dict.
+"""
+
+_item_constructors = {}
+_attribute_constructors = {}
+_extractors = {}
+
+
+def _unknown_field(model_class, field):
+    return ValueError(
+        'Unknown field "{}" for class {}'.format(field, model_class.__name__))
+
+
+def _source_expression(field, source, namespace):
+    """
+    Returns the expression reading the value of `field` from `json_response`.
+    `source` is a key, a tuple of keys (path) or a function.
+    """
+    if callable(source):
+        name = 'source_{}'.format(field)
+        namespace[name] = source
+        return '{}(json_response)'.format(name)
+    if not isinstance(source, tuple):
+        source = (source, )
+    return 'json_response' + ''.join('[{!r}]'.format(key) for key in source)
+
+
+def _target_expression(field, attributes):
+    if attributes:
+        return 'self.{}'.format(field)
+    return 'self[{!r}]'.format(field)
+
+
+def compile_constructor(model_class, attributes=False):
+    """
+    Generates the constructor of `model_class`, a function called with
+    the model instance and the original JSON response.
+
+    :attributes:
+        (True|False) Whether fields are assigned as attributes (slotted
+        models) or as items (dict based models).
+    """
+    schema = model_class.schema
+    namespace = {'unknown_field': _unknown_field, 'model_class': model_class}
+    lines = ['def construct(self, json_response):']
+
+    for field, func in schema.items():
+        if attributes and not field.isidentifier():
+            raise ValueError('Invalid field name "{}"'.format(field))
+        namespace['convert_{}'.format(field)] = func
+
+    response_fields = model_class.response_fields
+    if response_fields is not None:
+        for field, source in response_fields.items():
+            if field not in schema:
+                raise _unknown_field(model_class, field)
+            lines.append('    {} = convert_{}({})'.format(
+                _target_expression(field, attributes), field,
+                _source_expression(field, source, namespace)))
+    else:
+        namespace['fields'] = frozenset(schema)
+        lines.extend([
+            '    parsed_response = self.normalize_response(json_response)',
+            '    if not fields.issuperset(parsed_response):',
+            '        for field in parsed_response:',
+            '            if field not in fields:',
+            '                raise unknown_field(model_class, field)',
+        ])
+        for field in schema:
+            lines.extend([
+                '    if {!r} in parsed_response:'.format(field),
+                '        {} = convert_{}(parsed_response[{!r}])'.format(
+                    _target_expression(field, attributes), field, field),
+            ])
+    lines.append('    return self')
+
+    exec(compile('\n'.join(lines), '<{} constructor>'.format(model_class.__name__),
+                 'exec'), namespace)
+    return namespace['construct']
+
+
+def compile_extractor(model_class):
+    """
+    Generates the function reading the raw (unconverted) field values of
+    `model_class` out of the original response, as a dict. Returns None
+    for models without `response_fields`.
+    """
+    response_fields = model_class.response_fields
+    if response_fields is None:
+        return None
+    namespace = {}
+    items = []
+    for field, source in response_fields.items():
+        if field not in model_class.schema:
+            raise _unknown_field(model_class, field)
+        items.append('{!r}: {}'.format(
+            field, _source_expression(field, source, namespace)))
+    source = 'def extract(json_response):\n    return {{{}}}'.format(', '.join(items))
+    exec(compile(source, '<{} extractor>'.format(model_class.__name__), 'exec'),
+         namespace)
+    return namespace['extract']
+
+
+def get_extractor(model_class):
+    """Returns the (cached) extractor of `model_class`."""
+    try:
+        return _extractors[model_class]
+    except KeyError:
+        extractor = _extractors[model_class] = compile_extractor(model_class)
+        return extractor
+
+
+def get_constructor(model_class, attributes=False):
+    """Returns the (cached) constructor of `model_class`."""
+    constructors = _attribute_constructors if attributes else _item_constructors
+    constructor = constructors.get(model_class)
+    if constructor is None:
+        constructor = constructors[model_class] = compile_constructor(
+            model_class, attributes)
+    return constructor
@@ -0,0 +1,119 @@
+import heapq
+from itertools import repeat
+
+from xchange.models.base import OrderBook
+
+
+def _level_price(item):
+    return item[0][0]
+
+
+def merge_levels(order_books, side):
+    """
+    Lazily merges the (already sorted) `side` of the given
+    `{exchange: order_book}` books, best level first, yielding
+    `(level, exchange)` pairs. O(log k) per level for k books.
+    """
+    return heapq.merge(
+        *[zip(order_book[side], repeat(exchange))
+          for exchange, order_book in order_books.items()],
+        key=_level_price, reverse=side == 'bids')
+
+
+class ConsolidatedOrderBook(OrderBook):
+    """
+    Order book merging the (already sorted) sides of the order books of
+    several exchanges, ie: a synthetic BTC_USD book out of the Bitfinex,
+    Kraken and OKEx ones.
+
+    >>> book = ConsolidatedOrderBook.from_order_books({
+    ...     exchanges.BITFINEX: bitfinex_book,
+    ...     exchanges.KRAKEN: kraken_book,
+    ... })
+    >>> volume_weighted_average_price(exchanges.BUY, book, Decimal('10'))
+
+    Normalized format:
+    {
+        "asks": [
+            (Decimal('4620.2'), Decimal('0.456')),
+            (Decimal('4620.4'), Decimal('1.2')),
+        ],
+        "bids": [...],
+        "ask_exchanges": ['kraken', 'bitfinex'],
+        "bid_exchanges": [...]
+    }
+
+    `asks` and `bids` are `(price, amount)` levels as in any order book, so
+    `xchange.utils` functions work unchanged, while `ask_exchanges` and
+    `bid_exchanges` tell the exchange of each level.
+    """
+    schema = {
+        'asks': list,
+        'bids': list,
+        'ask_exchanges': list,
+        'bid_exchanges': list,
+    }
+    EXCHANGES_FIELDS = {
+        'asks': 'ask_exchanges',
+        'bids': 'bid_exchanges',
+    }
+
+    @classmethod
+    def from_order_books(cls, order_books):
+        """
+        Merges the sides of the given `{exchange: order_book}` books in
+        O(n log k), where k is the number of exchanges.
+        """
+        book = cls.__new__(cls)
+        for side in ('asks', 'bids'):
+            book._set_side(side, merge_levels(order_books, side))
+        book.order_books.update(order_books)
+        return book
+
+    @property
+    def order_books(self):
+        """The `{exchange: order_book}` books merged."""
+        return self.__dict__.setdefault('_order_books', {})
+
+    def _set_side(self, side, tagged_levels):
+        levels, exchanges = [], []
+        for level, exchange in tagged_levels:
+            levels.append(level)
+            exchanges.append(exchange)
+        self[side] = levels
+        self[self.EXCHANGES_FIELDS[side]] = exchanges
+
+    def _other_levels(self, side, exchange):
+        """Levels of `side`, tagged with their exchange, except those of `exchange`."""
+        return ((level, level_exchange) for level, level_exchange
+                in zip(self[side], self[self.EXCHANGES_FIELDS[side]])
+                if level_exchange != exchange)
+
+    def tagged_levels(self, side):
+        """Returns the `(price, amount, exchange)` levels of the 'asks' or 'bids' side."""
+        return [(price, amount, exchange) for (price, amount), exchange
+                in zip(self[side], self[self.EXCHANGES_FIELDS[side]])]
+
+    def update(self, exchange, order_book):
+        """
+        Replaces the levels of `exchange` (or adds them) with the ones of
+        its refreshed `order_book`. The levels of the other exchanges are
+        kept in order, so this is a single linear merge.
+        """
+        for side in ('asks', 'bids'):
+            self._set_side(side, heapq.merge(
+                self._other_levels(side, exchange),
+                zip(order_book[side], repeat(exchange)),
+                key=_level_price, reverse=side == 'bids'))
+        self.order_books[exchange] = order_book
+
+    def remove(self, exchange):
+        """Drops the levels of `exchange`, ie: when its book gets stale."""
+        for side in ('asks', 'bids'):
+            self._set_side(side, self._other_levels(side, exchange))
+        self.order_books.pop(exchange, None)
+
+    def limit_depth(self, depth):
+        super(ConsolidatedOrderBook, self).limit_depth(depth)
+        self['ask_exchanges'] = self['ask_exchanges'][:depth]
+        self['bid_exchanges'] = self['bid_exchanges'][:depth]
@@ -0,0 +1,203 @@
+import math
+import operator
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+from itertools import accumulate
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from xchange.models.arrays import PriceLevels, to_decimal
+from xchange.models.fixed import FixedPriceLevels
+from xchange.models.utils import as_decimal
+
+
+class DepthIndex:
+    """
+    Cumulative volume and notional of an order book side (sorted best
+    level first). Price impact queries for any amount are answered with
+    a binary search plus the partial use of one level.
+
+    Amounts passed to the queries must be scaled with `scale_amount()`
+    and not exceed `total`.
+    """
+    __slots__ = ('levels', 'volumes', 'notionals', 'total')
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.volumes = list(accumulate(amount for _, amount in levels))
+        self.notionals = list(accumulate(price * amount for price, amount in levels))
+        self.total = self.volumes[-1] if self.volumes else Decimal('0')
+
+    def scale_amount(self, amount):
+        """Converts a requested amount to the unit of the cumulative volumes."""
+        return as_decimal(amount)
+
+    def _price(self, position):
+        return self.levels[position][0]
+
+    def _to_price(self, price):
+        """Converts a price of the index to Decimal."""
+        return price
+
+    def _average(self, notional, amount):
+        return notional / amount
+
+    def _position(self, amount):
+        """Returns the position of the level where `amount` is reached."""
+        return bisect_left(self.volumes, amount)
+
+    def _positions(self, amounts):
+        """
+        Returns the positions of the levels where the ascending `amounts`
+        are reached, sweeping the cumulative volumes once.
+        """
+        volumes = self.volumes
+        last = len(volumes) - 1
+        position = 0
+        for amount in amounts:
+            while position < last and volumes[position] < amount:
+                position += 1
+            yield position
+
+    def _average_at(self, position, amount):
+        if position:
+            volume = self.volumes[position - 1]
+            notional = self.notionals[position - 1]
+            notional += self._price(position) * (amount - volume)
+        else:
+            notional = self._price(position) * amount
+        return self._average(notional, amount)
+
+    def worst_price(self, amount):
+        if not self.volumes:
+            return None
+        return self._to_price(self._price(self._position(amount)))
+
+    def average_price(self, amount):
+        if not self.volumes:
+            return None
+        return self._average_at(self._position(amount), amount)
+
+    def _to_amount(self, volume):
+        """Converts a cumulative volume of the index to Decimal."""
+        return volume
+
+    def best_price(self):
+        if not self.volumes:
+            return None
+        return self._to_price(self._price(0))
+
+    def volume_within(self, limit_price, ascending):
+        """
+        Returns the volume of the levels priced at `limit_price` or better,
+        found with a binary search of the prices. `ascending` tells the
+        order of the side (True for asks).
+        """
+        low, high = 0, len(self.volumes)
+        while low < high:
+            middle = (low + high) // 2
+            price = self._to_price(self._price(middle))
+            if price <= limit_price if ascending else price >= limit_price:
+                low = middle + 1
+            else:
+                high = middle
+        return self._to_amount(self.volumes[low - 1]) if low else Decimal('0')
+
+    def worst_prices(self, amounts):
+        """`worst_price` of each of the ascending `amounts`."""
+        if not self.volumes:
+            return [None] * len(amounts)
+        return [self._to_price(self._price(position))
+                for position in self._positions(amounts)]
+
+    def average_prices(self, amounts):
+        """`average_price` of each of the ascending `amounts`."""
+        if not self.volumes:
+            return [None] * len(amounts)
+        return [self._average_at(position, amount)
+                for position, amount in zip(self._positions(amounts), amounts)]
+
+
+class BufferDepthIndex(DepthIndex):
+    """`DepthIndex` of `PriceLevels` float64 buffers."""
+    __slots__ = ()
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.volumes = array('d', accumulate(levels.amounts))
+        self.notionals = array('d', accumulate(
+            map(operator.mul, levels.prices, levels.amounts)))
+        self.total = math.fsum(levels.amounts)
+
+    def scale_amount(self, amount):
+        return float(amount)
+
+    def _position(self, amount):
+        # float rounding may leave the last cumulative volume a hair
+        # below `total`, the last level is the worst one then
+        return min(bisect_left(self.volumes, amount), len(self.volumes) - 1)
+
+    def _positions(self, amounts):
+        # with NumPy, a vectorized binary search of all the amounts
+        if numpy is None:
+            return super(BufferDepthIndex, self)._positions(amounts)
+        positions = numpy.searchsorted(
+            numpy.frombuffer(self.volumes, dtype='float64'),
+            numpy.asarray(amounts, dtype='float64'))
+        return numpy.minimum(positions, len(self.volumes) - 1).tolist()
+
+    def _price(self, position):
+        return self.levels.prices[position]
+
+    def _to_price(self, price):
+        return to_decimal(price)
+
+    def _to_amount(self, volume):
+        # cumulative sums carry float rounding errors past the 15
+        # significant digits `to_decimal` relies on
+        return Decimal('{:.15g}'.format(volume))
+
+    def _average(self, notional, amount):
+        return to_decimal(notional / amount)
+
+
+class FixedDepthIndex(DepthIndex):
+    """`DepthIndex` of `FixedPriceLevels` int64 buffers, using exact integers."""
+    __slots__ = ()
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.volumes = list(accumulate(levels.amounts))
+        self.notionals = list(accumulate(
+            map(operator.mul, levels.prices, levels.amounts)))
+        self.total = self.volumes[-1] if self.volumes else 0
+
+    def scale_amount(self, amount):
+        """Amounts finer than the lot size are rejected with `ValueError`."""
+        return self.levels.precision.amount_to_int(amount)
+
+    def _price(self, position):
+        return self.levels.prices[position]
+
+    def _to_price(self, price):
+        return self.levels.precision.price_to_decimal(price)
+
+    def _to_amount(self, volume):
+        return self.levels.precision.amount_to_decimal(volume)
+
+    def _average(self, notional, amount):
+        # the only Decimal operation, scaled amounts cancel out
+        return self.levels.precision.price_to_decimal(
+            Decimal(notional) / Decimal(amount))
+
+
+def build_depth_index(levels):
+    """Returns the `DepthIndex` matching the storage of `levels`."""
+    if isinstance(levels, FixedPriceLevels):
+        return FixedDepthIndex(levels)
+    if isinstance(levels, PriceLevels):
+        return BufferDepthIndex(levels)
+    return DepthIndex(levels)
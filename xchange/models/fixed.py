@@ -0,0 +1,156 @@
+from array import array
+from decimal import Decimal
+
+from xchange.models.arrays import PriceLevels
+from xchange.models.utils import as_decimal, class_variant
+
+
+def to_scaled_int(value, places, round_down=False):
+    """
+    Returns `value` as an int scaled by `10 ** places`.
+
+    :round_down:
+        (True|False) Whether values with more decimal places are rounded
+        down instead of raising `ValueError`.
+    """
+    scaled = as_decimal(value).scaleb(places)
+    integral = int(scaled)
+    if integral != scaled and not round_down:
+        raise ValueError(
+            '"{}" has more than {} decimal places'.format(value, places))
+    return integral
+
+
+def from_scaled_int(value, places):
+    """Returns the Decimal represented by the scaled int `value`."""
+    return Decimal(value).scaleb(-places)
+
+
+class Precision:
+    """
+    Tick (price) and lot (amount) sizes of an instrument. Prices and
+    amounts are stored as ints scaled by `10 ** places`, where `places`
+    is the number of decimal places of the tick and lot sizes.
+    """
+    __slots__ = ('price_places', 'amount_places')
+
+    def __init__(self, tick_size, lot_size):
+        self.price_places = self._places(tick_size)
+        self.amount_places = self._places(lot_size)
+
+    @classmethod
+    def from_places(cls, price_places, amount_places):
+        precision = cls.__new__(cls)
+        precision.price_places = price_places
+        precision.amount_places = amount_places
+        return precision
+
+    @staticmethod
+    def _places(size):
+        return max(-as_decimal(size).normalize().as_tuple().exponent, 0)
+
+    def __eq__(self, other):
+        if isinstance(other, Precision):
+            return (self.price_places, self.amount_places) == (
+                other.price_places, other.amount_places)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((self.price_places, self.amount_places))
+
+    def __repr__(self):
+        return '{}(tick_size={}, lot_size={})'.format(
+            self.__class__.__name__, from_scaled_int(1, self.price_places),
+            from_scaled_int(1, self.amount_places))
+
+    def __getstate__(self):
+        return (self.price_places, self.amount_places)
+
+    def __setstate__(self, state):
+        self.price_places, self.amount_places = state
+
+    def price_to_int(self, price):
+        """Prices off the tick size are rejected with `ValueError`."""
+        return to_scaled_int(price, self.price_places)
+
+    def amount_to_int(self, amount, round_down=False):
+        return to_scaled_int(amount, self.amount_places, round_down)
+
+    def price_to_decimal(self, price):
+        return from_scaled_int(price, self.price_places)
+
+    def amount_to_decimal(self, amount):
+        return from_scaled_int(amount, self.amount_places)
+
+
+class FixedPriceLevels(PriceLevels):
+    """
+    `PriceLevels` storing prices and amounts as int64 scaled by the
+    instrument `precision`, so order book arithmetic is exact integer
+    arithmetic. Levels are still read as `(price, amount)` Decimal tuples.
+    """
+    __slots__ = ('precision', )
+    TYPECODE = 'q'
+    NUMPY_DTYPE = 'int64'
+
+    def __init__(self, prices=None, amounts=None, precision=None):
+        super(FixedPriceLevels, self).__init__(prices, amounts)
+        self.precision = precision
+
+    @classmethod
+    def from_levels(cls, levels, precision):
+        """
+        Builds the buffers out of `(price, amount)` tuples. Amounts finer
+        than the lot size (ie: converted from contracts) are rounded down,
+        since fractions of a lot can't be operated.
+        """
+        return cls(
+            array(cls.TYPECODE, [precision.price_to_int(level[0]) for level in levels]),
+            array(cls.TYPECODE, [precision.amount_to_int(level[1], round_down=True)
+                                 for level in levels]),
+            precision)
+
+    def _level(self, price, amount):
+        return (self.precision.price_to_decimal(price),
+                self.precision.amount_to_decimal(amount))
+
+    def _copy(self, prices, amounts):
+        return self.__class__(prices, amounts, self.precision)
+
+    def __getstate__(self):
+        return (self._array(self.prices), self._array(self.amounts), self.precision)
+
+    def __setstate__(self, state):
+        self.prices, self.amounts, self.precision = state
+
+
+class FixedPointOrderBook:
+    """
+    Mixin of the order book classes built by `fixed_order_book()`,
+    their `precision` is bound to a single instrument.
+    """
+    precision = None
+
+
+@class_variant
+def fixed_order_book(model_class, precision):
+    """
+    Returns the version of the given `OrderBook` subclass storing both
+    sides as `FixedPriceLevels` with the given `precision`.
+    """
+    name = 'Fixed{}_{}_{}'.format(
+        model_class.__name__, precision.price_places, precision.amount_places)
+    schema = dict(model_class.schema)
+    for side in ('asks', 'bids'):
+        schema[side] = (lambda levels, sort=schema[side]:
+                        FixedPriceLevels.from_levels(sort(levels), precision))
+    return type(name, (FixedPointOrderBook, model_class), {
+        '__doc__': model_class.__doc__,
+        '_model_class': model_class,
+        'schema': schema,
+        'precision': precision,
+    })
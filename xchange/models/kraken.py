@@ -1,7 +1,5 @@
-from decimal import Decimal
-
 from xchange.models.base import (
-    Ticker, AccountBalance, OrderBook, Order, Position)
+    Ticker, AccountBalance, OrderBook, Order, Position, as_decimal)
 
 
 class KrakenTicker(Ticker):
@@ -17,15 +15,14 @@ class KrakenTicker(Ticker):
      't': [6565, 14224],
      'v': ['2204.84583619', '4523.49526430']}
     """
-    def normalize_response(self, json_response):
-        return {
-            'ask': json_response['a'][0],
-            'bid': json_response['b'][0],
-            'low': json_response['l'][0],
-            'high': json_response['h'][0],
-            'last': json_response['c'][0],
-            'volume': json_response['v'][0],
-        }
+    response_fields = {
+        'ask': ('a', 0),
+        'bid': ('b', 0),
+        'low': ('l', 0),
+        'high': ('h', 0),
+        'last': ('c', 0),
+        'volume': ('v', 0),
+    }
 
 
 class KrakenOrderBook(OrderBook):
@@ -54,10 +51,11 @@ class KrakenOrderBook(OrderBook):
 
     def normalize_response(self, json_response):
         symbol = list(json_response['result'].keys())[0]
+        normalize_level = self.level_normalizer()
         return {
-            'asks': [(Decimal(str(l[0])), Decimal(str(l[1])))
+            'asks': [normalize_level(l)
                      for l in json_response['result'][symbol]['asks']],
-            'bids': [(Decimal(str(l[0])), Decimal(str(l[1])))
+            'bids': [normalize_level(l)
                      for l in json_response['result'][symbol]['bids']],
         }
 
@@ -70,11 +68,10 @@ class KrakenAccountBalance(AccountBalance):
         'currency': 'ZUSD',
     }
     """
-    def normalize_response(self, json_response):
-        return {
-            'symbol': json_response['currency'],
-            'amount': json_response['amount']
-        }
+    response_fields = {
+        'symbol': 'currency',
+        'amount': 'amount',
+    }
 
 
 class KrakenOrder(Order):
@@ -143,12 +140,11 @@ class KrakenPosition(Position):
      'vol': '0.01700000',
      'vol_closed': '0.00000000'}
     """
-    def normalize_response(self, json_response):
-        return {
-            'id': json_response['id'],
-            'action': json_response['type'],
-            'amount': json_response['vol'],
-            'price': Decimal(str(json_response['cost'])) / Decimal(str(json_response['vol'])),
-            'symbol_pair': json_response['pair'],
-            'profit_loss': json_response['net'],
-        }
+    response_fields = {
+        'id': 'id',
+        'action': 'type',
+        'amount': 'vol',
+        'price': lambda doc: as_decimal(doc['cost']) / as_decimal(doc['vol']),
+        'symbol_pair': 'pair',
+        'profit_loss': 'net',
+    }
@@ -0,0 +1,101 @@
+from xchange.models.compact import CompactExchangeModel
+from xchange.models.compiler import get_extractor
+from xchange.models.utils import class_variant
+
+
+class LazyField:
+    """
+    Descriptor converting (and validating) the raw value of a field
+    on first access, then caching the result in a slot.
+    """
+    __slots__ = ('name', 'convert', 'slot')
+
+    def __init__(self, name, convert, slot):
+        self.name = name
+        self.convert = convert
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        try:
+            value = instance._raw[self.name]
+        except KeyError:
+            # converted meanwhile by another thread (the slot is set before
+            # the raw value is dropped), or the field is not set and
+            # `__getattr__` takes care of it
+            return self.slot.__get__(instance, owner)
+        # the raw value is kept if the conversion fails, so the field is
+        # still listed and every read raises the same `ValueError`
+        value = self.convert(value)
+        self.slot.__set__(instance, value)
+        instance._raw.pop(self.name, None)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+        instance._raw.pop(self.name, None)
+
+
+class LazyExchangeModel(CompactExchangeModel):
+    """
+    Compact model keeping the raw values of the response, each field is
+    converted through the model `schema` the first time it's read.
+
+    Construction only validates field names, and invalid values raise
+    their `ValueError` on first access instead. Each first read goes
+    through a descriptor, so these models are not faster than the
+    compiled constructors of the regular ones (see `benchmarks.models`)
+    unless most of their fields are never read.
+    """
+    __slots__ = ('_raw', )
+
+    def __init__(self, json_response):
+        extract = get_extractor(self._model_class)
+        if extract is not None:
+            # field names were validated when compiling the extractor
+            self._raw = extract(json_response)
+        else:
+            self.assign_dynamic_attributes(self.normalize_response(json_response))
+
+    def assign_dynamic_attributes(self, parsed_response):
+        for field in parsed_response:
+            if field not in self.schema:
+                raise ValueError(
+                    'Unknown field "{}" for class {}'
+                    ''.format(field, self._model_class.__name__))
+        self._raw = dict(parsed_response)
+
+    def _has_field(self, key):
+        """Checks whether the field is set, without converting it."""
+        if key in self._raw:
+            return True
+        try:
+            getattr(self.__class__, key).slot.__get__(self, self.__class__)
+        except AttributeError:
+            return False
+        return True
+
+
+@class_variant
+def lazy_model(model_class):
+    """Returns the lazy version of the given `BaseExchangeModel` subclass."""
+    fields = tuple(model_class.schema)
+    slots = tuple('_{}_value'.format(field) for field in fields)
+    lazy_class = type('Lazy{}'.format(model_class.__name__), (LazyExchangeModel, ), {
+        '__slots__': slots,
+        '__doc__': model_class.__doc__,
+        '_model_class': model_class,
+        '_fields': fields,
+        'schema': model_class.schema,
+        'response_fields': model_class.response_fields,
+        'normalize_response': model_class.normalize_response,
+    })
+    for field, slot in zip(fields, slots):
+        setattr(lazy_class, field, LazyField(
+            field, model_class.schema[field], lazy_class.__dict__[slot]))
+    return lazy_class
@@ -1,7 +1,5 @@
-from decimal import Decimal
-
 from xchange.models.base import (Ticker, AccountBalance, OrderBook, Order,
-                                 Position, contracts_to_crypto)
+                                 Position, contracts_to_crypto_factor, as_decimal)
 
 
 class OkexTicker(Ticker):
@@ -21,15 +19,14 @@ class OkexTicker(Ticker):
         'unit_amount': 100,
         'vol': 3181196}}
     """
-    def normalize_response(self, json_response):
-        return {
-            'ask': json_response['ticker']['sell'],
-            'bid': json_response['ticker']['buy'],
-            'low': json_response['ticker']['low'],
-            'high': json_response['ticker']['high'],
-            'last': json_response['ticker']['last'],
-            'volume': json_response['ticker']['vol'],
-        }
+    response_fields = {
+        'ask': ('ticker', 'sell'),
+        'bid': ('ticker', 'buy'),
+        'low': ('ticker', 'low'),
+        'high': ('ticker', 'high'),
+        'last': ('ticker', 'last'),
+        'volume': ('ticker', 'vol'),
+    }
 
 
 class OkexOrderBook(OrderBook):
@@ -57,27 +54,30 @@ class OkexOrderBook(OrderBook):
     SYMBOL = None
     CONTRACT_UNIT_AMOUNTS = None
 
+    @classmethod
+    def normalize_level(cls, level):
+        return cls.level_normalizer()(level)
+
+    @classmethod
+    def level_normalizer(cls):
+        if not all([cls.TICKER, cls.SYMBOL, cls.CONTRACT_UNIT_AMOUNTS]):
+            return super(OkexOrderBook, cls).normalize_level
+        # if class atributes are provided, all contract amounts
+        # are transformed to BTC amounts based on the ticker last price.
+        # The factor is the same for every level of the book.
+        factor = contracts_to_crypto_factor(
+            cls.TICKER.last, cls.CONTRACT_UNIT_AMOUNTS[cls.SYMBOL])
+
+        def normalize_level(level):
+            return (as_decimal(level[0]), as_decimal(level[1]) * factor)
+        return normalize_level
+
     def normalize_response(self, json_response):
-        if all([self.TICKER, self.SYMBOL, self.CONTRACT_UNIT_AMOUNTS]):
-            # if class atributes are provided, all contract amounts
-            # are transformed to BTC amounts based on the ticker last price.
-            last_price = self.TICKER.last
-            unit_amount = self.CONTRACT_UNIT_AMOUNTS[self.SYMBOL]
-            return {
-                'asks': [(Decimal(str(doc[0])),
-                          contracts_to_crypto(Decimal(str(doc[1])), last_price, unit_amount))
-                         for doc in json_response['asks']],
-                'bids': [(Decimal(str(doc[0])),
-                          contracts_to_crypto(Decimal(str(doc[1])), last_price, unit_amount))
-                         for doc in json_response['bids']],
-            }
-        else:
-            return {
-                'asks': [(Decimal(str(doc[0])), Decimal(str(doc[1])))
-                         for doc in json_response['asks']],
-                'bids': [(Decimal(str(doc[0])), Decimal(str(doc[1])))
-                         for doc in json_response['bids']],
-            }
+        normalize_level = self.level_normalizer()
+        return {
+            'asks': [normalize_level(doc) for doc in json_response['asks']],
+            'bids': [normalize_level(doc) for doc in json_response['bids']],
+        }
 
 
 class OkexAccountBalance(AccountBalance):
@@ -88,11 +88,10 @@ class OkexAccountBalance(AccountBalance):
         'currency': 'btc',
     }
     """
-    def normalize_response(self, json_response):
-        return {
-            'symbol': json_response['currency'],
-            'amount': json_response['amount']
-        }
+    response_fields = {
+        'symbol': 'currency',
+        'amount': 'amount',
+    }
 
 
 class OkexOrder(Order):
@@ -158,12 +157,11 @@ class OkexPosition(Position):
       'profit_loss': -5.432e-05,
       'symbol_pair': 'btc_usd'}]
     """
-    def normalize_response(self, json_response):
-        return {
-            'id': json_response['id'],
-            'action': json_response['action'],
-            'amount': json_response['amount'],
-            'price': json_response['price'],
-            'symbol_pair': json_response['symbol_pair'],
-            'profit_loss': json_response['profit_loss'],
-        }
+    response_fields = {
+        'id': 'id',
+        'action': 'action',
+        'amount': 'amount',
+        'price': 'price',
+        'symbol_pair': 'symbol_pair',
+        'profit_loss': 'profit_loss',
+    }
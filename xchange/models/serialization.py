@@ -0,0 +1,314 @@
+"""
+Compact binary serialization of models, to ship them between processes
+(ie: from a market data poller to strategy processes) or to store them
+in caches.
+
+Layout, little-endian:
+
+    header          magic, version, kind, variant and class path length
+    class path      '<module>:<name>' of the model class, padded to 8 bytes boundary
+    body
+
+Tickers, orders, positions and balances encode each field of their
+schema in order. Order books encode each side as contiguous arrays,
+aligned to 8 bytes. `loads()` reads the arrays through `memoryview`
+casts without copying them, and array based order books keep those
+views as their buffers.
+"""
+import sys
+import struct
+import importlib
+from array import array
+from decimal import Decimal
+
+from xchange.models.arrays import PriceLevels, array_order_book
+from xchange.models.base import BaseExchangeModel, OrderBook
+from xchange.models.compact import CompactExchangeModel, compact_model
+from xchange.models.fixed import (
+    Precision, FixedPriceLevels, FixedPointOrderBook, fixed_order_book)
+from xchange.models.lazy import LazyExchangeModel, lazy_model
+
+MAGIC = b'XCHG'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBBBxI')
+SIDE_HEADER = struct.Struct('<BbbxI')
+UINT32 = struct.Struct('<I')
+DECIMAL = struct.Struct('<bq')
+
+KIND_MODEL = 1
+KIND_ORDER_BOOK = 2
+
+VARIANT_PLAIN = 0
+VARIANT_COMPACT = 1
+VARIANT_LAZY = 2
+VARIANT_ARRAY = 3
+VARIANT_FIXED = 4
+
+# field value tags of scalar models
+TAG_MISSING = 0
+TAG_DECIMAL = 1
+TAG_DECIMAL_TEXT = 2
+TAG_STR = 3
+
+# order book side encodings
+SIDE_DECIMAL = 1
+SIDE_DECIMAL_TEXT = 2
+SIDE_FLOAT = 3
+SIDE_FIXED = 4
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_classes = {}
+
+
+def _padding(size):
+    return b'\x00' * (-size % 8)
+
+
+def _split_class(model_class):
+    """Returns the variant of `model_class` and the class it's built from."""
+    if issubclass(model_class, LazyExchangeModel):
+        return VARIANT_LAZY, model_class._model_class
+    if issubclass(model_class, CompactExchangeModel):
+        return VARIANT_COMPACT, model_class._model_class
+    if issubclass(model_class, FixedPointOrderBook):
+        return VARIANT_FIXED, model_class._model_class
+    if '_model_class' in model_class.__dict__:
+        return VARIANT_ARRAY, model_class._model_class
+    return VARIANT_PLAIN, model_class
+
+
+def _join_class(variant, model_class, precision=None):
+    if variant == VARIANT_LAZY:
+        return lazy_model(model_class)
+    if variant == VARIANT_COMPACT:
+        return compact_model(model_class)
+    if variant == VARIANT_FIXED:
+        return fixed_order_book(model_class, precision)
+    if variant == VARIANT_ARRAY:
+        return array_order_book(model_class)
+    return model_class
+
+
+def _import_class(path):
+    """
+    Returns the model class of a `'<module>:<name>'` path. Only models of
+    the `xchange.models` package are accepted, so untrusted data can't
+    import arbitrary modules.
+    """
+    model_class = _classes.get(path)
+    if model_class is None:
+        module_name, _, class_name = path.partition(':')
+        if not (module_name + '.').startswith('xchange.models.'):
+            raise ValueError('Not a model class path "{}"'.format(path))
+        model_class = getattr(importlib.import_module(module_name), class_name, None)
+        if not (isinstance(model_class, type) and
+                issubclass(model_class, BaseExchangeModel)):
+            raise ValueError('Not a model class path "{}"'.format(path))
+        _classes[path] = model_class
+    return model_class
+
+
+def _decimal_parts(value):
+    """
+    Returns the `(exponent, coefficient)` of `value`, or None when they
+    don't fit in an int8 and an int64.
+    """
+    if not value.is_finite():
+        return None
+    text = str(value)
+    if 'E' in text or text.startswith('-0'):
+        # scientific notation and negative values above -1, which
+        # may be a negative zero
+        sign, digits, exponent = value.as_tuple()
+        if sign and not any(digits):
+            return None
+        coefficient = int(value.scaleb(-exponent))
+    else:
+        integral, _, fractional = text.partition('.')
+        exponent = -len(fractional)
+        coefficient = int(integral + fractional)
+    if not -128 <= exponent <= 127:
+        return None
+    if not INT64_MIN <= coefficient <= INT64_MAX:
+        return None
+    return exponent, coefficient
+
+
+def _to_bytes(buffer):
+    if not LITTLE_ENDIAN:
+        buffer = array(buffer.typecode, buffer)
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def _cast(view, typecode):
+    if LITTLE_ENDIAN:
+        return view.cast(typecode)
+    buffer = array(typecode, view.tobytes())
+    buffer.byteswap()
+    return buffer
+
+
+# dumps
+
+def _dump_value(value):
+    if value is None:
+        return bytes((TAG_MISSING, ))
+    if isinstance(value, Decimal):
+        parts = _decimal_parts(value)
+        if parts is not None:
+            return bytes((TAG_DECIMAL, )) + DECIMAL.pack(*parts)
+        text = str(value).encode('ascii')
+        return bytes((TAG_DECIMAL_TEXT, )) + UINT32.pack(len(text)) + text
+    if isinstance(value, str):
+        text = value.encode('utf-8')
+        return bytes((TAG_STR, )) + UINT32.pack(len(text)) + text
+    raise ValueError('Can not serialize value {!r}'.format(value))
+
+
+def _dump_side(levels):
+    if isinstance(levels, FixedPriceLevels):
+        return [SIDE_HEADER.pack(SIDE_FIXED, levels.precision.price_places,
+                                 levels.precision.amount_places, len(levels)),
+                _to_bytes(levels._array(levels.prices)),
+                _to_bytes(levels._array(levels.amounts))]
+    if isinstance(levels, PriceLevels):
+        return [SIDE_HEADER.pack(SIDE_FLOAT, 0, 0, len(levels)),
+                _to_bytes(levels._array(levels.prices)),
+                _to_bytes(levels._array(levels.amounts))]
+
+    prices, amounts = array('q'), array('q')
+    price_exponents, amount_exponents = array('b'), array('b')
+    for price, amount in levels:
+        price_parts = _decimal_parts(price)
+        amount_parts = _decimal_parts(amount)
+        if price_parts is None or amount_parts is None:
+            # ie: amounts converted from contracts, with 28 digits
+            text = '\n'.join('{} {}'.format(price, amount)
+                             for price, amount in levels).encode('ascii')
+            return [SIDE_HEADER.pack(SIDE_DECIMAL_TEXT, 0, 0, len(text)),
+                    text, _padding(len(text))]
+        price_exponents.append(price_parts[0])
+        prices.append(price_parts[1])
+        amount_exponents.append(amount_parts[0])
+        amounts.append(amount_parts[1])
+    return [SIDE_HEADER.pack(SIDE_DECIMAL, 0, 0, len(levels)),
+            _to_bytes(prices), _to_bytes(amounts),
+            price_exponents.tobytes(), amount_exponents.tobytes(),
+            _padding(2 * len(levels))]
+
+
+def dumps(model):
+    """
+    Serializes a ticker, order book, order, position or account balance
+    model (any of its variants) into bytes.
+    """
+    variant, model_class = _split_class(model.__class__)
+    path = '{}:{}'.format(model_class.__module__, model_class.__name__).encode('ascii')
+    kind = KIND_ORDER_BOOK if issubclass(model_class, OrderBook) else KIND_MODEL
+    if kind == KIND_ORDER_BOOK and set(model_class.schema) != {'asks', 'bids'}:
+        # ie: consolidated books, whose extra fields would be lost
+        raise ValueError('Can not serialize {} models'.format(model_class.__name__))
+    parts = [HEADER.pack(MAGIC, VERSION, kind, variant, len(path)),
+             path, _padding(HEADER.size + len(path))]
+    if kind == KIND_ORDER_BOOK:
+        for side in ('asks', 'bids'):
+            parts.extend(_dump_side(model[side]))
+    else:
+        for field in model_class.schema:
+            parts.append(_dump_value(model.get(field)))
+    return b''.join(parts)
+
+
+# loads
+
+def _load_value(view, offset):
+    tag = view[offset]
+    offset += 1
+    if tag == TAG_MISSING:
+        return None, offset
+    if tag == TAG_DECIMAL:
+        exponent, coefficient = DECIMAL.unpack_from(view, offset)
+        return Decimal(coefficient).scaleb(exponent), offset + DECIMAL.size
+    size, = UINT32.unpack_from(view, offset)
+    offset += UINT32.size
+    text = str(view[offset:offset + size], 'utf-8')
+    if tag == TAG_DECIMAL_TEXT:
+        return Decimal(text), offset + size
+    if tag == TAG_STR:
+        return text, offset + size
+    raise ValueError('Unknown value tag {}'.format(tag))
+
+
+def _load_side(view, offset):
+    """Returns the levels of the side starting at `offset`, and its end."""
+    mode, price_places, amount_places, size = SIDE_HEADER.unpack_from(view, offset)
+    offset += SIDE_HEADER.size
+
+    if mode == SIDE_DECIMAL_TEXT:
+        text = str(view[offset:offset + size], 'ascii')
+        levels = [tuple(map(Decimal, line.split(' ')))
+                  for line in text.split('\n')] if text else []
+        return levels, offset + size + len(_padding(size))
+
+    # contiguous arrays, read without copies
+    end = offset + 16 * size
+    prices = _cast(view[offset:offset + 8 * size], 'd' if mode == SIDE_FLOAT else 'q')
+    amounts = _cast(view[offset + 8 * size:end], 'd' if mode == SIDE_FLOAT else 'q')
+    if mode == SIDE_FLOAT:
+        return PriceLevels(prices, amounts), end
+    if mode == SIDE_FIXED:
+        precision = Precision.from_places(price_places, amount_places)
+        return FixedPriceLevels(prices, amounts, precision), end
+    if mode == SIDE_DECIMAL:
+        price_exponents = view[end:end + size].cast('b')
+        amount_exponents = view[end + size:end + 2 * size].cast('b')
+        levels = [(Decimal(price).scaleb(price_exponent),
+                   Decimal(amount).scaleb(amount_exponent))
+                  for price, amount, price_exponent, amount_exponent
+                  in zip(prices, amounts, price_exponents, amount_exponents)]
+        return levels, end + 2 * size + len(_padding(2 * size))
+    raise ValueError('Unknown order book side encoding {}'.format(mode))
+
+
+def _new_model(model_class):
+    model = model_class.__new__(model_class)
+    if isinstance(model, LazyExchangeModel):
+        # values are already converted
+        model._raw = {}
+    return model
+
+
+def loads(data):
+    """
+    Deserializes the bytes (or any buffer, ie: shared memory) built by
+    `dumps()` into a model of the original class.
+    """
+    view = memoryview(data)
+    magic, version, kind, variant, path_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError('Not a serialized model')
+    if version != VERSION:
+        raise ValueError('Unsupported serialization version {}'.format(version))
+    offset = HEADER.size
+    model_class = _import_class(str(view[offset:offset + path_size], 'ascii'))
+    offset += path_size + len(_padding(offset + path_size))
+
+    values = {}
+    if kind == KIND_ORDER_BOOK:
+        for side in ('asks', 'bids'):
+            values[side], offset = _load_side(view, offset)
+        precision = getattr(values['asks'], 'precision', None)
+    else:
+        for field in model_class.schema:
+            values[field], offset = _load_value(view, offset)
+        precision = None
+
+    model = _new_model(_join_class(variant, model_class, precision))
+    for field, value in values.items():
+        if value is not None:
+            model[field] = value
+    return model
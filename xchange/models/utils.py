@@ -1,12 +1,38 @@
+import sys
+import functools
 from decimal import Decimal
 
 from xchange.constants import currencies
 
 
 def as_decimal(value):
+    if isinstance(value, Decimal):
+        # already parsed by the JSON backend, avoid re-stringifying it
+        return value
     return Decimal(str(value))
 
 
+def class_variant(build):
+    """
+    Decorator of the functions building a variant of a model class (ie:
+    its compact version) out of their arguments. Each variant is built
+    once, and registered as a global of the module defining `build`,
+    under its class name, so instances of the variant can be pickled.
+    """
+    variants = {}
+    module = sys.modules[build.__module__]
+
+    @functools.wraps(build)
+    def get_variant(*args):
+        variant = variants.get(args)
+        if variant is None:
+            variant = variants[args] = build(*args)
+            variant.__module__ = module.__name__
+            setattr(module, variant.__name__, variant)
+        return variant
+    return get_variant
+
+
 def object_of_class(class_name):
     def func(obj):
         if obj.__class__.__name__ != class_name:
@@ -15,9 +41,27 @@ def object_of_class(class_name):
     return func
 
 
+def _is_sorted(keys, reverse):
+    if reverse:
+        return all(a >= b for a, b in zip(keys, keys[1:]))
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+
 def sorted_list(key, sorting_type):
+    """
+    Exchanges usually send lists already sorted, so they are checked in
+    linear time first: sorted lists are kept as they are, lists sorted the
+    other way around are reversed, and only unsorted ones are sorted.
+    """
+    reverse = False if sorting_type == 'asc' else True
     def func(original_list):
-        reverse = False if sorting_type == 'asc' else True
+        if not isinstance(original_list, list):
+            original_list = list(original_list)
+        keys = [key(elem) for elem in original_list]
+        if _is_sorted(keys, reverse):
+            return original_list
+        if _is_sorted(keys, not reverse):
+            return original_list[::-1]
         return sorted(original_list, key=key, reverse=reverse)
     return func
 
@@ -56,6 +100,17 @@ def normalized_symbol_pair(original_pair):
     raise ValueError('Could not normalize {} symbol pair'.format(original_pair))
 
 
+def contracts_to_crypto_factor(crypto_last_price, unit_amount):
+    """
+    Returns the factor transforming amounts of contracts to amounts of
+    crypto, so converting many amounts (ie: order book levels) with the
+    same last price costs a single multiplication each.
+
+    factor = unit_amount / crypto_last_price
+    """
+    return Decimal(unit_amount) / Decimal(crypto_last_price)
+
+
 def contracts_to_crypto(amount_in_contracts, crypto_last_price, unit_amount):
     """
     Transforms the amount of contracts to amount of given cryptos based
@@ -65,10 +120,8 @@ def contracts_to_crypto(amount_in_contracts, crypto_last_price, unit_amount):
 
     amount_in_crypto = amount_in_contracts * (unit_amount / crypto_last_price)
     """
-    # convert all given values to Decimal
-    amount_in_contracts, crypto_last_price, unit_amount = list(
-        map(Decimal, [amount_in_contracts, crypto_last_price, unit_amount]))
-    return amount_in_contracts * (unit_amount / crypto_last_price)
+    return Decimal(amount_in_contracts) * contracts_to_crypto_factor(
+        crypto_last_price, unit_amount)
 
 
 def crypto_to_contracts(amount_in_crypto, crypto_last_price, unit_amount):
@@ -0,0 +1,91 @@
+import time
+import threading
+
+from xchange import exceptions
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens and refills `refill_rate`
+    tokens per second. Reservations are allowed to take the bucket below
+    zero, so concurrent callers queue up behind each other in FIFO order
+    instead of failing.
+    """
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def reserve(self, cost=1, max_wait=None):
+        """
+        Takes `cost` tokens from the bucket and returns the number of
+        seconds the caller needs to wait before sending its request.
+
+        Raises `exceptions.RateLimitException` (without taking any token)
+        when the wait would be longer than `max_wait` seconds.
+        """
+        if not cost:
+            return 0
+        with self._lock:
+            self._refill(time.monotonic())
+            missing = cost - self.tokens
+            wait = missing / self.refill_rate if missing > 0 else 0
+            if max_wait is not None and wait > max_wait:
+                raise exceptions.RateLimitException(
+                    'Rate limit would be exceeded for the next {:.2f} seconds'
+                    ''.format(wait))
+            self.tokens -= cost
+            return wait
+
+
+class RateLimiter:
+    """
+    Paces requests of an API client according to per-endpoint costs.
+
+    :buckets:
+        dict mapping bucket names to `(capacity, refill_rate)` tuples.
+    :endpoints:
+        iterable of `(path_prefix, bucket_name, cost)` tuples. The first
+        prefix matching the request path decides which bucket is charged,
+        and how many tokens it costs. Unmatched paths are not limited.
+    :max_wait:
+        max seconds a request may be queued before failing with
+        `exceptions.RateLimitException`. `None` waits indefinitely.
+    """
+
+    def __init__(self, buckets=None, endpoints=(), max_wait=None):
+        self.buckets = {
+            name: TokenBucket(capacity, refill_rate)
+            for name, (capacity, refill_rate) in (buckets or {}).items()
+        }
+        self.endpoints = tuple(endpoints)
+        self.max_wait = max_wait
+
+    def reserve(self, path, max_wait=None):
+        """
+        Charges the bucket matching `path` and returns the number of
+        seconds to wait before sending the request. `max_wait` can
+        only shorten the limiter `max_wait`.
+        """
+        if self.max_wait is not None:
+            max_wait = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        for path_prefix, bucket_name, cost in self.endpoints:
+            if path.startswith(path_prefix):
+                return self.buckets[bucket_name].reserve(cost, max_wait)
+        return 0
+
+    def acquire(self, path, max_wait=None):
+        """Blocks the current thread until the request for `path` is allowed."""
+        wait = self.reserve(path, max_wait)
+        if wait:
+            time.sleep(wait)
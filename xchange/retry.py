@@ -0,0 +1,73 @@
+import time
+import random
+from email.utils import parsedate_tz, mktime_tz
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait
+    before each retry.
+
+    Only idempotent methods are retried after the request may have reached
+    the exchange (read timeouts, dropped connections, error status codes),
+    so calls like `open_order` are never sent twice. Connect timeouts are
+    retried for any method, as the request never left the client.
+
+    :max_retries:
+        max number of retries for a single request (0 disables retries).
+    :backoff_factor:
+        base delay in seconds. The wait before retry N is a random value
+        between 0 and `backoff_factor * 2 ** N` ("full jitter").
+    :max_backoff:
+        upper bound in seconds for any wait, including `Retry-After`.
+    :retry_statuses:
+        response status codes considered transient.
+    :idempotent_methods:
+        HTTP methods that are safe to send more than once.
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, max_retries=0, backoff_factor=0.1, max_backoff=10,
+                 retry_statuses=None, idempotent_methods=None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses or self.RETRY_STATUSES
+        self.idempotent_methods = idempotent_methods or self.IDEMPOTENT_METHODS
+
+    def can_retry(self, method, attempt, sent=True):
+        """
+        Whether the request can be sent again after `attempt` retries.
+        `sent` is False when the request surely didn't reach the server.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return not sent or method.upper() in self.idempotent_methods
+
+    def should_retry_status(self, method, attempt, status_code):
+        return (status_code in self.retry_statuses and
+                self.can_retry(method, attempt))
+
+    def get_backoff(self, attempt, retry_after=None):
+        """Seconds to wait before sending retry number `attempt + 1`."""
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, self.backoff_factor * 2 ** attempt)
+        return min(delay, self.max_backoff)
+
+    def parse_retry_after(self, retry_after):
+        """
+        Parses a `Retry-After` header value, expressed either in seconds
+        or as an HTTP date. Returns `None` when missing or invalid.
+        """
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        parsed_date = parsedate_tz(retry_after)
+        if parsed_date is None:
+            return None
+        return max(mktime_tz(parsed_date) - time.time(), 0)
@@ -0,0 +1,167 @@
+"""
+Smart order routing: splits a buy or sell across exchanges taking the
+best priced levels of all their order books first (the lowest marginal
+price for buys, the highest for sells), which minimizes the combined
+volume weighted average price, then sends the child orders concurrently.
+"""
+import time
+from decimal import Decimal
+
+from xchange import exceptions
+from xchange.clients.multi import MultiExchangeResponse
+from xchange.constants import exchanges
+from xchange.models.consolidated import merge_levels
+from xchange.models.utils import as_decimal
+from xchange.validators import is_restricted_to_values, is_instance, passes_test
+
+
+class Route:
+    """
+    Part of an order routed to a single exchange.
+
+    :amount:
+        Decimal amount to operate at the exchange.
+    :price:
+        Decimal worst price of the exchange levels used, the limit
+        price of the child order.
+    :notional:
+        Decimal sum of `price * amount` of the levels used.
+    """
+    __slots__ = ('exchange', 'amount', 'price', 'notional')
+
+    def __init__(self, exchange, amount=Decimal('0'), price=None, notional=Decimal('0')):
+        self.exchange = exchange
+        self.amount = amount
+        self.price = price
+        self.notional = notional
+
+    @property
+    def average_price(self):
+        return self.notional / self.amount
+
+    def __eq__(self, other):
+        if isinstance(other, Route):
+            return (self.exchange, self.amount, self.price) == (
+                other.exchange, other.amount, other.price)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r}, amount={}, price={})'.format(
+            self.__class__.__name__, self.exchange, self.amount, self.price)
+
+
+def split_order(action, order_books, amount):
+    """
+    Splits an operation (sell/buy) of the given `amount` across the
+    exchanges of `order_books`, in a single merge sweep of their sides.
+
+    @params:
+        * action: exchanges.ACTIONS choice
+        * order_books: dict mapping exchange names to models.base.OrderBook instances
+        * amount: Decimal or valid numeric argument representing volume to operate.
+
+    @returns:
+        a dict mapping exchange names to `Route` objects, only for the
+        exchanges with levels used.
+    """
+    # validate arguments
+    is_restricted_to_values(action, exchanges.ACTIONS)
+
+    is_instance(amount, (Decimal, float, int, str))
+    passes_test(amount, lambda x: Decimal(x) > 0)
+
+    side = 'asks' if action == exchanges.BUY else 'bids'
+    routes = {}
+    rest = as_decimal(amount)
+    for (price, volume), exchange in merge_levels(order_books, side):
+        used = min(volume, rest)
+        route = routes.get(exchange)
+        if route is None:
+            route = routes[exchange] = Route(exchange)
+        route.amount += used
+        route.notional += price * used
+        route.price = price
+        rest -= used
+        if rest <= 0:
+            break
+    if rest > 0:
+        raise exceptions.InsufficientMarketDepth(
+            'Not enough depth in OrderBooks to {} {} volume'.format(action, amount))
+    return routes
+
+
+class RoutingResponse(MultiExchangeResponse):
+    """
+    `MultiExchangeResponse` of the child orders sent by `SmartOrderRouter`.
+
+    :routes:
+        dict mapping each exchange name to its `Route`.
+    :elapsed:
+        seconds taken to send all the child orders.
+    """
+
+    def __init__(self, routes, response, elapsed):
+        super(RoutingResponse, self).__init__(
+            response.results, response.errors, response.timings)
+        self.routes = routes
+        self.elapsed = elapsed
+
+    @property
+    def average_price(self):
+        """Combined VWAP of the routes, as planned."""
+        amount = sum(route.amount for route in self.routes.values())
+        return sum(route.notional for route in self.routes.values()) / amount
+
+
+class SmartOrderRouter:
+    """
+    Sends buy or sell orders split across the exchanges of a
+    `MultiExchangeClient` by `split_order`, one limit order per exchange
+    at the worst price of its levels used.
+
+    >>> router = SmartOrderRouter(multi_client)
+    >>> response = router.open_order(exchanges.BUY, Decimal('10'), currencies.BTC_USD)
+    >>> response.routes, response.results, response.timings
+    """
+
+    def __init__(self, multi_client):
+        self.multi_client = multi_client
+
+    def get_order_books(self, symbol_pair, depth=None, timeout=None):
+        """Order books of the exchanges answering on time."""
+        return self.multi_client.get_order_book(
+            symbol_pair, depth=depth, timeout=timeout).results
+
+    def open_order(self, action, amount, symbol_pair, order_books=None,
+                   order_type=exchanges.LIMIT, timeout=None):
+        """
+        Splits and sends an order, returning a `RoutingResponse`.
+
+        :order_books:
+            dict mapping exchange names to the order books to route on,
+            fetched from every exchange when not given.
+        :order_type:
+            exchanges.ORDER_TYPES choice of the child orders.
+        :timeout:
+            deadline (in seconds) for the order books and for the child orders.
+            Child orders are never abandoned: each of them gets the deadline,
+            and all of them are waited for, so their outcome is always known.
+        """
+        is_restricted_to_values(order_type, exchanges.ORDER_TYPES)
+        if order_books is None:
+            order_books = self.get_order_books(symbol_pair, timeout=timeout)
+        routes = split_order(action, order_books, amount)
+
+        start = time.time()
+        response = self.multi_client.request_each({
+            exchange: ('open_order',
+                       (action, route.amount, symbol_pair, route.price, order_type), {})
+            for exchange, route in routes.items()
+        }, timeout=timeout, wait_pending=True)
+        return RoutingResponse(routes, response, time.time() - start)
@@ -0,0 +1,62 @@
+import threading
+
+from xchange import exceptions
+
+
+def _timeout_error(timeout):
+    return exceptions.TimeoutException(
+        'Coalesced call did not finish within {:.3f} seconds'.format(timeout))
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing the same key: while a call is in
+    flight, other threads asking for the same key wait for it and get its
+    result (or exception) instead of running their own.
+
+    Waiting threads give up after their own `timeout`, raising
+    `exceptions.TimeoutException`, while the call keeps running for the rest.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        :timeout:
+            (keyword argument, not passed to `func`) seconds to wait for the
+            call in flight of another thread, None waits until it finishes.
+            It doesn't bound the own calls.
+        """
+        timeout = kwargs.pop('timeout', None)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.event.wait(timeout):
+                raise _timeout_error(timeout)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
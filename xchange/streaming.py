@@ -0,0 +1,205 @@
+import re
+import json
+import codecs
+from decimal import Decimal
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITERS = ' \t\n\r,:]}'
+
+# parser states
+VALUE = 'value'
+KEY = 'key'
+COLON = 'colon'
+COMMA = 'comma'
+END = 'end'
+
+
+class OrderBookStreamParser:
+    """
+    Incremental JSON parser for order book responses.
+
+    Bytes are fed as they arrive from the exchange. Levels of the
+    `asks` and `bids` arrays (at any nesting level of the document)
+    are converted with `normalize_level` as soon as they are complete,
+    so the whole response never needs to be buffered nor parsed into
+    an intermediate tree. Everything else in the document (ie: the
+    "error" field of Kraken responses) is parsed as usual.
+
+    Usage:
+        parser = OrderBookStreamParser(normalize_level, depth=10)
+        for chunk in response.iter_content(chunk_size=1024):
+            if parser.feed(chunk):
+                break  # both sides reached the requested depth
+        document = parser.close()
+        parser.asks, parser.bids
+    """
+    SIDES = ('asks', 'bids')
+
+    def __init__(self, normalize_level=None, depth=None):
+        """
+        :normalize_level:
+            function transforming a raw level of the response into
+            its final representation. Raw levels are kept by default.
+        :depth:
+            max number of levels to keep per side. Once both sides
+            are complete, the parser stops consuming data.
+        """
+        self.normalize_level = normalize_level
+        self.depth = depth
+        self.asks = []
+        self.bids = []
+        self.done = False
+        self._pending = set(self.SIDES)
+        self._decoder = json.JSONDecoder(parse_float=Decimal)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._stack = []
+        self._key = None
+        self._state = VALUE
+        self._can_close = False
+        self._root = None
+
+    def feed(self, chunk):
+        """
+        Parses a new chunk of bytes.
+        Returns True once no more data is needed.
+        """
+        if not self.done:
+            self._buffer += self._text_decoder.decode(chunk)
+            self._parse(final=False)
+        return self.done
+
+    def close(self):
+        """
+        Parses any remaining data and returns the (partial, when the
+        parser stopped early) document, where `asks` and `bids` hold
+        the normalized levels.
+        """
+        if not self.done:
+            self._buffer += self._text_decoder.decode(b'', True)
+            self._parse(final=True)
+            if self._state != END:
+                raise ValueError('Incomplete JSON document')
+        return self._root
+
+    def _decode(self, buffer, pos, final):
+        """
+        Decodes the complete JSON value starting at `pos`.
+        Returns None when more data is needed.
+        """
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except ValueError:
+            if final:
+                raise
+            return None
+        # numbers can't be told complete until a delimiter arrives
+        if not final and (end == len(buffer) or buffer[end] not in DELIMITERS):
+            return None
+        return value, end
+
+    def _attach(self, value):
+        if not self._stack:
+            self._root = value
+            self._state = END
+            return
+        container = self._stack[-1][0]
+        if isinstance(container, dict):
+            container[self._key] = value
+        else:
+            container.append(value)
+
+    def _add_level(self, side, level):
+        levels = getattr(self, side)
+        if self.depth is not None and len(levels) >= self.depth:
+            return
+        if self.normalize_level is not None:
+            level = self.normalize_level(level)
+        levels.append(level)
+        if self.depth is not None and len(levels) >= self.depth:
+            self._complete(side)
+
+    def _complete(self, side):
+        self._pending.discard(side)
+        if self.depth is not None and not self._pending:
+            self.done = True
+
+    def _parse(self, final):
+        buffer = self._buffer
+        pos = 0
+        length = len(buffer)
+        while not self.done:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos >= length:
+                break
+            char = buffer[pos]
+            state = self._state
+
+            if state == END:
+                raise ValueError('Extra data at position {}'.format(pos))
+
+            elif state == COMMA or (self._can_close and char in '}]'):
+                container, side = self._stack[-1]
+                if char == ',':
+                    self._state = KEY if isinstance(container, dict) else VALUE
+                    self._can_close = False
+                elif char == ('}' if isinstance(container, dict) else ']'):
+                    self._stack.pop()
+                    self._state = COMMA if self._stack else END
+                    self._can_close = False
+                    if side is not None:
+                        self._complete(side)
+                else:
+                    raise ValueError('Expecting delimiter at position {}'.format(pos))
+                pos += 1
+
+            elif state == COLON:
+                if char != ':':
+                    raise ValueError('Expecting ":" at position {}'.format(pos))
+                self._state = VALUE
+                pos += 1
+
+            elif state == KEY:
+                if char != '"':
+                    raise ValueError('Expecting property name at position {}'.format(pos))
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                self._key, pos = decoded
+                self._state = COLON
+
+            elif self._stack and self._stack[-1][1] is not None:
+                # inside the `asks` or `bids` array, decode levels at once
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                level, pos = decoded
+                self._add_level(self._stack[-1][1], level)
+                self._state = COMMA
+
+            elif char in '{[':
+                is_dict = char == '{'
+                side = None
+                if (not is_dict and self._stack and
+                        isinstance(self._stack[-1][0], dict) and
+                        self._key in self.SIDES):
+                    side = self._key
+                    container = getattr(self, side)
+                else:
+                    container = {} if is_dict else []
+                self._attach(container)
+                self._stack.append((container, side))
+                self._state = KEY if is_dict else VALUE
+                self._can_close = True
+                pos += 1
+
+            else:
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                value, pos = decoded
+                self._attach(value)
+                if self._state != END:
+                    self._state = COMMA
+
+        self._buffer = buffer[pos:]
@@ -1,10 +1,155 @@
+import math
 from decimal import Decimal
 
 from xchange import exceptions
 from xchange.constants import exchanges
+from xchange.models.arrays import PriceLevels, to_decimal
+from xchange.models.depth import build_depth_index
+from xchange.models.fixed import FixedPriceLevels
+from xchange.models.utils import as_decimal
 from xchange.validators import is_restricted_to_values, is_instance, passes_test
 
 
+def _not_enough_depth(action, amount):
+    return exceptions.InsufficientMarketDepth(
+        'Not enough depth in OrderBook to {} {} volume'.format(action, amount))
+
+
+def _depth_index(action, order_book, build=True):
+    """
+    Returns the depth index of the side used to operate `action`, see
+    `OrderBook.depth_index()` for `build`.
+    """
+    side = 'asks' if action == exchanges.BUY else 'bids'
+    depth_index = getattr(order_book, 'depth_index', None)
+    if depth_index is None:
+        return build_depth_index(getattr(order_book, side)) if build else None
+    return depth_index(side, build)
+
+
+def _scaled_amount(action, index, amount):
+    """
+    Returns the requested `amount` in the unit of the depth `index`,
+    after checking the market depth.
+    """
+    scaled = index.scale_amount(amount)
+    if scaled > index.total:
+        raise _not_enough_depth(action, amount)
+    return scaled
+
+
+# Single forward scans of an order book side (sorted best level first),
+# accumulating volume and notional on the fly. They answer one-off
+# queries without building the depth index, and only walk the levels
+# needed to fill `amount`. Running out of levels is the depth check.
+
+def _scan_worst_order_price(action, levels, amount):
+    value = as_decimal(amount)
+    accum = 0
+    for price, volume in levels:
+        accum += volume
+        if accum >= value:
+            return price
+    if value > accum:
+        raise _not_enough_depth(action, amount)
+
+
+def _scan_volume_weighted_average_price(action, levels, amount):
+    value = as_decimal(amount)
+    notional = 0
+    rest = value
+    for price, volume in levels:
+        if volume >= rest:
+            return (notional + price * rest) / value
+        notional += price * volume
+        rest -= volume
+    if rest > 0:
+        raise _not_enough_depth(action, amount)
+
+
+def _scan_buffers_worst_order_price(action, levels, amount):
+    """`_scan_worst_order_price` running on `PriceLevels` float64 buffers"""
+    value = float(amount)
+    accum = 0.0
+    price = None
+    for price, volume in zip(levels.prices, levels.amounts):
+        accum += volume
+        if accum >= value:
+            return to_decimal(price)
+    # float rounding may leave `accum` a hair below `amount` when the
+    # whole side is used, the last level is the worst one then
+    if value > math.fsum(levels.amounts):
+        raise _not_enough_depth(action, amount)
+    if price is not None:
+        return to_decimal(price)
+
+
+def _scan_buffers_volume_weighted_average_price(action, levels, amount):
+    """`_scan_volume_weighted_average_price` running on `PriceLevels` float64 buffers"""
+    value = float(amount)
+    notional = 0.0
+    rest = value
+    for price, volume in zip(levels.prices, levels.amounts):
+        if volume >= rest:
+            return to_decimal((notional + price * rest) / value)
+        notional += price * volume
+        rest -= volume
+    if value > math.fsum(levels.amounts):
+        raise _not_enough_depth(action, amount)
+    if len(levels):
+        return to_decimal(notional / (value - rest))
+
+
+def _scan_fixed_worst_order_price(action, levels, amount):
+    """`_scan_worst_order_price` running on `FixedPriceLevels` int64 buffers"""
+    value = levels.precision.amount_to_int(amount)
+    accum = 0
+    for price, volume in zip(levels.prices, levels.amounts):
+        accum += volume
+        if accum >= value:
+            return levels.precision.price_to_decimal(price)
+    if value > accum:
+        raise _not_enough_depth(action, amount)
+
+
+def _scan_fixed_volume_weighted_average_price(action, levels, amount):
+    """`_scan_volume_weighted_average_price` running on `FixedPriceLevels` int64 buffers"""
+    value = levels.precision.amount_to_int(amount)
+    notional = 0
+    rest = value
+    for price, volume in zip(levels.prices, levels.amounts):
+        if volume >= rest:
+            # the only Decimal operation, scaled amounts cancel out
+            return levels.precision.price_to_decimal(
+                Decimal(notional + price * rest) / Decimal(value))
+        notional += price * volume
+        rest -= volume
+    if rest > 0:
+        raise _not_enough_depth(action, amount)
+
+
+def _scan(action, levels, amount, kernels):
+    """Runs the scan kernel of `kernels` matching the storage of `levels`."""
+    scan, scan_buffers, scan_fixed = kernels
+    if isinstance(levels, FixedPriceLevels):
+        return scan_fixed(action, levels, amount)
+    if isinstance(levels, PriceLevels):
+        return scan_buffers(action, levels, amount)
+    return scan(action, levels, amount)
+
+
+WORST_ORDER_PRICE_SCANS = (
+    _scan_worst_order_price,
+    _scan_buffers_worst_order_price,
+    _scan_fixed_worst_order_price,
+)
+VOLUME_WEIGHTED_AVERAGE_PRICE_SCANS = (
+    _scan_volume_weighted_average_price,
+    _scan_buffers_volume_weighted_average_price,
+    _scan_fixed_volume_weighted_average_price,
+)
+
+
 def worst_order_price(action, order_book, amount):
     """
     Calculates the worst used order price in given `order_book` to fulfill
@@ -23,25 +168,16 @@ def worst_order_price(action, order_book, amount):
 
     is_instance(amount, (Decimal, float, int, str))
     passes_test(amount, lambda x: Decimal(x))
+    amount = as_decimal(amount)
 
-    order_list = order_book.asks if action == exchanges.BUY else order_book.bids
-
-    total_market_depth = sum([t[1] for t in order_list])
-    if amount > total_market_depth:
-        raise exceptions.InsufficientMarketDepth(
-            'Not enough depth in OrderBook to {} {} volume'.format(action, amount))
-
-    if action == exchanges.BUY:
-        # when checking the "asks" list, we want to
-        # iterate orders from cheapest to highest
-        order_list = list(reversed(order_list))
-
-    accum = Decimal('0')
-    for price_tuple in order_list:
-        price, volume = price_tuple
-        accum += volume
-        if accum >= amount:
-            return price
+    # both sides are sorted best level first. The first query of a side
+    # scans its levels, later ones search the cumulative volumes of its
+    # depth index for the level where `amount` is reached
+    index = _depth_index(action, order_book, build=False)
+    if index is None:
+        order_list = order_book.asks if action == exchanges.BUY else order_book.bids
+        return _scan(action, order_list, amount, WORST_ORDER_PRICE_SCANS)
+    return index.worst_price(_scaled_amount(action, index, amount))
 
 
 def volume_weighted_average_price(action, order_book, amount):
@@ -62,39 +198,133 @@ def volume_weighted_average_price(action, order_book, amount):
 
     is_instance(amount, (Decimal, float, int, str))
     passes_test(amount, lambda x: Decimal(x))
+    amount = as_decimal(amount)
 
-    order_list = order_book.asks if action == exchanges.BUY else order_book.bids
+    # most of the times last used order in the orderbook
+    # is partially used, only the needed rest amount of
+    # that order is taken into account
+    index = _depth_index(action, order_book, build=False)
+    if index is None:
+        order_list = order_book.asks if action == exchanges.BUY else order_book.bids
+        return _scan(action, order_list, amount, VOLUME_WEIGHTED_AVERAGE_PRICE_SCANS)
+    return index.average_price(_scaled_amount(action, index, amount))
 
-    total_market_depth = sum([t[1] for t in order_list])
-    if amount > total_market_depth:
-        raise exceptions.InsufficientMarketDepth(
-            'Not enough depth in OrderBook to {} {} volume'.format(action, amount))
 
-    if action == exchanges.BUY:
-        # when checking the "asks" list, we want to
-        # iterate orders from cheapest to highest
-        order_list = list(reversed(order_list))
-    accum = Decimal(0.0)
+def _price_curve(action, order_book, amounts, query):
+    """
+    Validates the `amounts`, sorts them and runs the `query` batch method
+    of the depth index once over all of them, returning the results in the
+    original order of `amounts`.
+    """
+    # validate arguments
+    is_restricted_to_values(action, exchanges.ACTIONS)
 
-    # most of the times last used order in the orderbook
-    # is partially used. we need to know which was the portion
-    # used from that order to calculate the weighted average
-    rest = amount
+    amounts = list(amounts)
+    for amount in amounts:
+        is_instance(amount, (Decimal, float, int, str))
+        passes_test(amount, lambda x: Decimal(x))
 
-    for index, price_tuple in enumerate(order_list):
-        volume = price_tuple[1]
-        accum += volume
-        if accum >= amount:
-            break
-        rest -= volume
+    index = _depth_index(action, order_book)
+    scaled = [index.scale_amount(amount) for amount in amounts]
+    order = sorted(range(len(amounts)), key=scaled.__getitem__)
+    if order:
+        # the largest amount is the only one to check
+        _scaled_amount(action, index, amounts[order[-1]])
+
+    results = [None] * len(amounts)
+    for position, result in zip(order, getattr(index, query)([scaled[i] for i in order])):
+        results[position] = result
+    return results
+
+
+def worst_price_curve(action, order_book, amounts):
+    """
+    Batch version of `worst_order_price`: calculates the worst used order
+    price for each of the given `amounts` in a single sweep of the order
+    book side.
+
+    @params:
+        * action: exchanges.ACTIONS choice
+        * order_book: models.base.OrderBook instance or subclass
+        * amounts: iterable of Decimal or valid numeric arguments representing
+          volumes to operate, in any order.
+
+    @returns:
+        a list of Decimal objects, in the same order as `amounts`.
+    """
+    return _price_curve(action, order_book, amounts, 'worst_prices')
+
+
+def vwap_curve(action, order_book, amounts):
+    """
+    Batch version of `volume_weighted_average_price`: calculates the weighted
+    average price for each of the given `amounts` in a single sweep of the
+    order book side.
+
+    @params:
+        * action: exchanges.ACTIONS choice
+        * order_book: models.base.OrderBook instance or subclass
+        * amounts: iterable of Decimal or valid numeric arguments representing
+          volumes to operate, in any order.
+
+    @returns:
+        a list of Decimal objects, in the same order as `amounts`.
+    """
+    return _price_curve(action, order_book, amounts, 'average_prices')
+
+
+def max_amount_within_price(action, order_book, limit_price):
+    """
+    Calculates the maximum amount that can be operated (sell/buy) in given
+    `order_book` without using orders priced worse than `limit_price`, the
+    inverse of `worst_order_price`.
+
+    @params:
+        * action: exchanges.ACTIONS choice
+        * order_book: models.base.OrderBook instance or subclass
+        * limit_price: Decimal or valid numeric argument representing the
+          highest (buy) or lowest (sell) price to operate at.
+
+    @returns:
+        a Decimal object representing the amount, zero when the best order
+        is already beyond `limit_price`.
+    """
+    # validate arguments
+    is_restricted_to_values(action, exchanges.ACTIONS)
+
+    is_instance(limit_price, (Decimal, float, int, str))
+    passes_test(limit_price, lambda x: Decimal(x))
+
+    index = _depth_index(action, order_book)
+    return index.volume_within(as_decimal(limit_price), action == exchanges.BUY)
 
-    # get the sub list representing only the necessary
-    # orders to fulfill the amount amount
-    sub_list = order_list[:index + 1]
 
-    # change the last used order in the list, to just
-    # the needed rest amount
-    sub_list[-1] = (sub_list[-1][0], Decimal(rest))
+def max_amount_within_slippage(action, order_book, bps):
+    """
+    Calculates the maximum amount that can be operated (sell/buy) in given
+    `order_book` without using orders priced more than `bps` basis points
+    away from the best order price.
+
+    @params:
+        * action: exchanges.ACTIONS choice
+        * order_book: models.base.OrderBook instance or subclass
+        * bps: Decimal or valid numeric argument representing the slippage
+          band in basis points (1 bps = 0.01%).
+
+    @returns:
+        a Decimal object representing the amount, zero for an empty side.
+    """
+    # validate arguments
+    is_restricted_to_values(action, exchanges.ACTIONS)
+
+    is_instance(bps, (Decimal, float, int, str))
+    passes_test(bps, lambda x: Decimal(x) >= 0)
 
-    sub_list_amounts = [t[1] for t in sub_list]
-    return sum(x * y for x, y in sub_list) / sum(sub_list_amounts)
+    index = _depth_index(action, order_book)
+    best_price = index.best_price()
+    if best_price is None:
+        return Decimal('0')
+    band = best_price * as_decimal(bps) / 10000
+    if action == exchanges.BUY:
+        return index.volume_within(best_price + band, True)
+    return index.volume_within(best_price - band, False)